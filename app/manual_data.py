@@ -11,6 +11,7 @@ from typing import Any, Optional
 
 import streamlit as st
 
+from src.disposition import get_builtin_blacklist_matcher
 from src.utils.schema_utils import ACCOUNT_ID, ACCOUNT_NAME
 
 
@@ -125,12 +126,23 @@ def save_manual_blacklist(terms: list[str]) -> bool:
         return False
 
 
+def get_blacklist_matches(name: str) -> list[str]:
+    """Get the blacklist terms (built-in and manual) that match a name.
+
+    Uses the same cached matcher as disposition classification.
+    """
+    return get_builtin_blacklist_matcher(load_manual_blacklist()).find_all(name)
+
+
 def add_manual_blacklist_term(term: str) -> bool:
     """Add a term to the manual blacklist."""
     terms = load_manual_blacklist()
     term_lower = term.lower().strip()
 
     if term_lower not in terms:
+        covered_by = get_blacklist_matches(term_lower)
+        if covered_by:
+            st.info(f"Term is already matched by: {', '.join(covered_by)}")
         terms.append(term_lower)
         if save_manual_blacklist(terms):
             st.success(f"Added blacklist term: {term}")
@@ -15,17 +15,21 @@ import pandas as pd
 from rapidfuzz import fuzz, process
 
 from src.utils.parallel_utils import ParallelExecutor
+from src.utils.token_vocab import TokenVocabulary
 
 logger = logging.getLogger(__name__)
 
 
 def _build_first_token_bucket(
     name_core: pd.Series,
+    token_vocab: Optional[TokenVocabulary] = None,
 ) -> tuple[dict[str, np.ndarray], dict[int, int], dict[int, int]]:
     """Build a bucket mapping first tokens to row indices and an index mapping.
 
     Args:
         name_core: Series of normalized names
+        token_vocab: Optional run-level token vocabulary; when given, records
+            are bucketed by first-token ID with one grouped argsort
 
     Returns:
         Tuple of:
@@ -34,24 +38,27 @@ def _build_first_token_bucket(
         - Dictionary mapping new contiguous indices back to original indices
 
     """
-    bucket = defaultdict(list)
-
     # Create index mapping (old index -> new contiguous index)
     index_map = {old_idx: new_idx for new_idx, old_idx in enumerate(name_core.index)}
     reverse_map = {new_idx: old_idx for old_idx, new_idx in index_map.items()}
 
-    # Build buckets using mapped indices
-    for idx, name in name_core.items():
-        if pd.isna(name) or not name:
-            continue
-        first_token = name.split()[0] if name else ""
-        if first_token:
-            bucket[first_token].append(index_map[idx])
+    if token_vocab is not None:
+        bucket_arrays = _first_token_buckets_by_id(name_core, token_vocab)
+    else:
+        bucket = defaultdict(list)
 
-    # Convert to numpy arrays for efficiency
-    bucket_arrays = {
-        token: np.array(indices, dtype=int) for token, indices in bucket.items()
-    }
+        # Build buckets using mapped indices
+        for idx, name in name_core.items():
+            if pd.isna(name) or not name:
+                continue
+            first_token = name.split()[0] if name else ""
+            if first_token:
+                bucket[first_token].append(index_map[idx])
+
+        # Convert to numpy arrays for efficiency
+        bucket_arrays = {
+            token: np.array(indices, dtype=int) for token, indices in bucket.items()
+        }
 
     # Log bucket statistics
     logger.debug("Index mapping stats:")
@@ -62,6 +69,47 @@ def _build_first_token_bucket(
     return bucket_arrays, index_map, reverse_map
 
 
+def _first_token_buckets_by_id(
+    name_core: pd.Series,
+    token_vocab: TokenVocabulary,
+) -> dict[str, np.ndarray]:
+    """Group row positions by first-token ID of the run vocabulary.
+
+    Buckets keep first-appearance order and ascending positions, matching the
+    split-based buckets. First tokens missing from the vocabulary (names
+    edited after it was built) get fresh IDs past the vocabulary size.
+    """
+    first = np.array(
+        [
+            (
+                name.split(maxsplit=1)[0]
+                if isinstance(name, str) and name.strip()
+                else None
+            )
+            for name in name_core.to_numpy(dtype=object)
+        ],
+        dtype=object,
+    )
+    rows = np.flatnonzero(pd.notna(first))
+    if not len(rows):
+        return {}
+
+    ids = token_vocab.lookup(first[rows]).astype(np.int64)
+    unknown = ids < 0
+    if unknown.any():
+        fresh, _ = pd.factorize(first[rows][unknown], sort=False)
+        ids[unknown] = token_vocab.size + fresh
+
+    codes, uniques = pd.factorize(ids, sort=False)
+    grouped = rows[np.argsort(codes, kind="stable")]
+    bounds = np.cumsum(np.bincount(codes, minlength=len(uniques)))[:-1]
+    heads = first[grouped[np.insert(bounds, 0, 0)]]
+    return {
+        token: indices.astype(int)
+        for token, indices in zip(heads, np.split(grouped, bounds))
+    }
+
+
 def _records_with_aliases(df_norm: pd.DataFrame) -> list[Any]:
     """Get sorted list of record indices that have non-empty alias candidates.
 
@@ -285,6 +333,7 @@ def compute_alias_matches(
     df_groups: pd.DataFrame,
     settings: dict[str, Any],
     parallel_executor: Optional[ParallelExecutor] = None,
+    token_vocab: Optional[TokenVocabulary] = None,
 ) -> tuple[pd.DataFrame, dict[str, Any]]:
     """Compute alias matches across records.
 
@@ -292,6 +341,8 @@ def compute_alias_matches(
         df_norm: DataFrame with normalized data and alias candidates
         df_groups: DataFrame with group assignments
         settings: Configuration settings
+        parallel_executor: Optional parallel executor
+        token_vocab: Optional run-level token vocabulary for first-token buckets
 
     Returns:
         Tuple of (DataFrame with alias matches, performance stats)
@@ -379,7 +430,10 @@ def compute_alias_matches(
         )
 
         # Build first token bucket with index mapping
-        bucket, index_map, reverse_map = _build_first_token_bucket(name_core)
+        bucket, index_map, reverse_map = _build_first_token_bucket(
+            name_core,
+            token_vocab,
+        )
 
         # Check for large buckets and warn
         for token, indices in bucket.items():
@@ -90,6 +90,13 @@ from src.utils.schema_utils import (
     WEAKEST_EDGE_TO_PRIMARY,
     apply_canonical_rename,
 )
+from src.utils.token_vocab import (
+    TOKEN_VOCAB_FILENAME,
+    TokenVocabulary,
+    build_token_vocabulary,
+    load_token_vocabulary,
+    save_token_vocabulary,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -574,6 +581,8 @@ def run_pipeline(
     stop_flag = threading.Event()
     parallel_executor.stop_flag = stop_flag
 
+    token_vocab: Optional[TokenVocabulary] = None
+
     try:
         # Step 1: Load and validate data
         logger.info(f"Loading data from {input_path}")
@@ -595,6 +604,10 @@ def run_pipeline(
                 else:
                     df_norm = pd.read_csv(normalized_path)
                 logger.info(f"Loaded {len(df_norm)} normalized records")
+
+                vocab_path = get_interim_dir(run_id) / TOKEN_VOCAB_FILENAME
+                if vocab_path.exists():
+                    token_vocab = load_token_vocabulary(vocab_path)
             else:
                 raise FileNotFoundError(
                     f"Required intermediate file not found: {normalized_path}",
@@ -741,17 +754,14 @@ def run_pipeline(
             logger.info("Normalizing company names")
             name_column = ACCOUNT_NAME  # Use standardized column name
             # Performance tracking removed - using built-in logging instead
-            df_norm = normalize_dataframe(df, name_column)
-
-            # Add name_core_tokens column for edge-gating
-            def create_tokens(x: Any) -> str:
-                if pd.notna(x):
-                    x_str = str(x)
-                    if x_str.strip():
-                        return json.dumps(x_str.split())
-                return "[]"
-
-            df_norm["name_core_tokens"] = df_norm["name_core"].apply(create_tokens)
+            # name_core_tokens (for edge-gating) is built in the same pass
+            df_norm = normalize_dataframe(
+                df,
+                name_column,
+                settings.get("similarity", {}).get("normalization", {}),
+                parallel_executor,
+                with_tokens=True,
+            )
 
             perf_tracker.record_timing(
                 "clean_normalize",
@@ -864,6 +874,10 @@ def run_pipeline(
                 df_norm.to_csv(filtered_path, index=False)
             logger.info(f"Saved filtered data to {filtered_path}")
 
+            # Run-level token vocabulary, shared by later stages and resumes
+            token_vocab, _ = build_token_vocabulary(df_norm["name_core_tokens"])
+            save_token_vocabulary(token_vocab, f"{interim_dir}/{TOKEN_VOCAB_FILENAME}")
+
             dag.complete("filtering")
             logger.info("[stage:end] filtering")
 
@@ -888,24 +902,38 @@ def run_pipeline(
                     "Phase 1.35.2: Running Exact-Equals Phase-0 before normalization",
                 )
 
-                # Find exact equals groups
                 name_column = ACCOUNT_NAME  # Use standardized column name
-                exact_raw_groups, raw_exact_map, candidate_pairs_exact_raw = (
-                    find_exact_equals_groups(df_norm, settings, name_column)
+                backend = (
+                    settings.get("pipeline", {})
+                    .get("exact_equals_first_pass", {})
+                    .get("backend", "pandas")
                 )
+                if backend == "duckdb":
+                    from src.utils.exact_equals_duckdb import DuckDBExactEquals
+
+                    # Groups, artifacts (COPY TO parquet) and the unique set
+                    # all come from one DuckDB session
+                    with DuckDBExactEquals(df_norm, settings, name_column) as engine:
+                        engine.write_artifacts(interim_dir, run_id)
+                        df_norm = engine.unique_normalized()
+                else:
+                    # Find exact equals groups
+                    exact_raw_groups, raw_exact_map, candidate_pairs_exact_raw = (
+                        find_exact_equals_groups(df_norm, settings, name_column)
+                    )
 
-                # Write artifacts with no-overwrite policy
-                write_exact_equals_artifacts(
-                    exact_raw_groups,
-                    raw_exact_map,
-                    candidate_pairs_exact_raw,
-                    interim_dir,
-                    run_id,
-                    settings,
-                )
+                    # Write artifacts with no-overwrite policy
+                    write_exact_equals_artifacts(
+                        exact_raw_groups,
+                        raw_exact_map,
+                        candidate_pairs_exact_raw,
+                        interim_dir,
+                        run_id,
+                        settings,
+                    )
 
-                # Create unique normalized dataset (representatives + singletons only)
-                df_norm = create_unique_normalized(df_norm, raw_exact_map, settings)
+                    # Create unique normalized dataset (representatives + singletons only)
+                    df_norm = create_unique_normalized(df_norm, raw_exact_map, settings)
 
                 # Save unique normalized data
                 unique_path = f"{interim_dir}/unique_normalized.parquet"
@@ -937,6 +965,7 @@ def run_pipeline(
                 parallel_executor,
                 interim_dir,
                 profile,
+                token_vocab=token_vocab,
             )
             perf_tracker.record_timing("blocking", 0.0)  # Blocking phase
             perf_tracker.record_timing("scoring", 0.0)  # Scoring phase
@@ -980,6 +1009,8 @@ def run_pipeline(
             stop_tokens,
             enable_progress,
             profile,
+            token_vocab=token_vocab,
+            parallel_executor=parallel_executor,
         )
         logger.info(f"create_groups_with_edge_gating returned: {type(df_groups)}")
         if df_groups is not None:
@@ -1520,7 +1551,13 @@ def run_pipeline(
             logger.info("Computing alias matches and cross-references")
         alias_matches_path = f"{interim_dir}/alias_matches.{interim_format}"
         # Performance tracking removed - using built-in logging instead
-        result = compute_alias_matches(df_norm, df_groups, settings, parallel_executor)
+        result = compute_alias_matches(
+            df_norm,
+            df_groups,
+            settings,
+            parallel_executor,
+            token_vocab=token_vocab,
+        )
 
         df_alias_matches, alias_stats = result
 
@@ -9,39 +9,50 @@ This module handles:
 
 import logging
 import re
+from collections.abc import Iterable
 from typing import Any, Optional
 
 import pandas as pd
 
+from src.utils.blacklist_matcher import BlacklistMatcher
+from src.utils.hash_utils import config_hash
 from src.utils.schema_utils import DISPOSITION
 
 logger = logging.getLogger(__name__)
 
-# Module-level regex caches for performance optimization
-_TOKEN_REGEX_CACHE = {}
-_PHRASE_REGEX_CACHE = {}
+# Module-level caches for performance optimization
+_BLACKLIST_MATCHER_CACHE: dict[str, BlacklistMatcher] = {}
 _SUSPICIOUS_REGEX_CACHE = {}
 
 
-def _get_token_regex(tokens: list[str]) -> re.Pattern:
-    """Get cached compiled regex for blacklist tokens."""
-    key = tuple(sorted(tokens))
-    if key not in _TOKEN_REGEX_CACHE:
-        pattern = r"\b(?:" + "|".join(map(re.escape, tokens)) + r")\b"
-        _TOKEN_REGEX_CACHE[key] = re.compile(pattern, re.IGNORECASE)
-    return _TOKEN_REGEX_CACHE[key]
+def get_blacklist_matcher(
+    tokens: Iterable[str],
+    phrases: Iterable[str],
+) -> BlacklistMatcher:
+    """Get the cached Aho-Corasick matcher for a blacklist configuration.
 
+    Matchers are built once per hash of the (sorted, de-duplicated) term
+    lists, so the pipeline and the UI blacklist editor share them.
 
-def _get_phrase_regex(phrases: tuple[str, ...]) -> Optional[re.Pattern]:
-    """Get cached compiled regex for blacklist phrases."""
-    if not phrases:
-        return None
-    
-    cache_key = tuple(sorted(phrases))
-    if cache_key not in _PHRASE_REGEX_CACHE:
-        pattern = "|".join(map(re.escape, phrases))
-        _PHRASE_REGEX_CACHE[cache_key] = re.compile(pattern, re.IGNORECASE)
-    return _PHRASE_REGEX_CACHE[cache_key]
+    Args:
+        tokens: Terms matched on word boundaries
+        phrases: Terms matched as substrings
+
+    Returns:
+        Compiled blacklist matcher
+
+    """
+    tokens = sorted(set(tokens))
+    phrases = sorted(set(phrases))
+    key = config_hash({"tokens": tokens, "phrases": phrases})
+    if key not in _BLACKLIST_MATCHER_CACHE:
+        _BLACKLIST_MATCHER_CACHE[key] = BlacklistMatcher(tokens, phrases)
+    return _BLACKLIST_MATCHER_CACHE[key]
+
+
+def get_builtin_blacklist_matcher(manual_terms: Iterable[str] = ()) -> BlacklistMatcher:
+    """Matcher for the built-in blacklist plus manual terms (as substrings)."""
+    return get_blacklist_matcher(BLACKLIST_TOKENS, [*BLACKLIST_PHRASES, *manual_terms])
 
 
 def _get_suspicious_regex(pattern: str) -> re.Pattern:
@@ -236,24 +247,11 @@ def _is_blacklisted_improved(
     if not name or pd.isna(name):
         return False
 
-    name_lower = str(name).lower()
-
-    # Check single-word tokens with word boundaries - use cached regex
-    token_regex = _get_token_regex(BLACKLIST_TOKENS)
-    if token_regex.search(name):
+    # Tokens on word boundaries, phrases and manual terms as substrings,
+    # all in one automaton scan
+    if get_builtin_blacklist_matcher(manual_terms or ()).search(name):
         return True
 
-    # Check multi-word phrases with substring matching
-    for phrase in BLACKLIST_PHRASES:
-        if phrase.lower() in name_lower:
-            return True
-
-    # Check manual blacklist terms (if provided)
-    if manual_terms:
-        for term in manual_terms:
-            if term.lower() in name_lower:
-                return True
-
     # Check for very short or very long names
     if len(name.strip()) < 3:
         return True
@@ -398,9 +396,41 @@ def _is_suspicious_singleton(row: pd.Series, settings: dict[str, Any]) -> bool:
     return False
 
 
+def _blacklisted_mask(names: pd.Series) -> pd.Series:
+    """Column-wise ``_is_blacklisted`` over a Series of company names.
+
+    Uses the cached built-in blacklist matcher (manual blacklist terms join
+    the built-in phrases); the punctuation/stopword check only runs on names
+    not already flagged.
+
+    Args:
+        names: Company names
+
+    Returns:
+        Boolean Series aligned with ``names``
+
+    """
+    text = names.fillna("").astype(str)
+    present = names.notna() & (text != "")
+
+    matcher = get_builtin_blacklist_matcher(_load_manual_blacklist())
+    stripped_length = text.str.strip().str.len()
+    blacklisted = matcher.mask(text) | (stripped_length < 3) | (stripped_length > 100)
+
+    remaining = present & ~blacklisted
+    blacklisted[remaining] = (
+        text[remaining].map(_is_mostly_punctuation_or_stopwords).to_numpy(dtype=bool)
+    )
+    return present & blacklisted
+
+
 def compute_group_metadata(df_groups: pd.DataFrame) -> dict[int, dict[str, Any]]:
     """Compute metadata for each group.
 
+    One ``groupby("group_id")`` pass over the assigned records: group size,
+    primary presence, blacklist hits (from one column-wise blacklist mask) and
+    the distinct suffix classes in order of appearance.
+
     Args:
         df_groups: DataFrame with group assignments
 
@@ -408,35 +438,43 @@ def compute_group_metadata(df_groups: pd.DataFrame) -> dict[int, dict[str, Any]]
         Dictionary mapping group_id to metadata
 
     """
-    group_metadata = {}
+    # Skip unassigned records
+    assigned = df_groups[df_groups["group_id"] != -1]
 
-    for group_id in df_groups["group_id"].unique():
-        if group_id == -1:  # Skip unassigned records
-            continue
-
-        group_mask = df_groups["group_id"] == group_id
-        group_data = df_groups[group_mask]
-
-        # Check for suffix mismatches
-        suffix_classes = group_data["suffix_class"].unique()
-        has_suffix_mismatch = len(suffix_classes) > 1
-
-        # Check for blacklist hits
-        # Handle both standardized and original column names
-        account_name_col = (
-            "account_name" if "account_name" in group_data.columns else "Account Name"
+    # Check for blacklist hits
+    # Handle both standardized and original column names
+    account_name_col = (
+        "account_name" if "account_name" in assigned.columns else "Account Name"
+    )
+    stats = (
+        assigned.assign(_blacklisted=_blacklisted_mask(assigned[account_name_col]))
+        .groupby("group_id", sort=False)
+        .agg(
+            group_size=("group_id", "size"),
+            blacklist_hits=("_blacklisted", "sum"),
+            has_primary=("is_primary", "any"),
         )
-        blacklist_hits = group_data[account_name_col].apply(_is_blacklisted).sum()
-
-        group_metadata[group_id] = {
-            "group_size": len(group_data),
-            "has_suffix_mismatch": has_suffix_mismatch,
-            "blacklist_hits": blacklist_hits,
-            "suffix_classes": list(suffix_classes),
-            "has_primary": group_data["is_primary"].any(),
-        }
+    )
 
-    return group_metadata
+    # Distinct suffix classes per group (missing values count as a class)
+    suffixes = assigned[["group_id", "suffix_class"]].drop_duplicates()
+    suffix_classes = suffixes.groupby("group_id", sort=False)["suffix_class"].agg(list)
+
+    return {
+        group_id: {
+            "group_size": int(group_size),
+            "has_suffix_mismatch": len(suffix_classes[group_id]) > 1,
+            "blacklist_hits": int(blacklist_hits),
+            "suffix_classes": suffix_classes[group_id],
+            "has_primary": bool(has_primary),
+        }
+        for group_id, group_size, blacklist_hits, has_primary in zip(
+            stats.index,
+            stats["group_size"],
+            stats["blacklist_hits"],
+            stats["has_primary"],
+        )
+    }
 
 
 def apply_dispositions(
@@ -521,21 +559,11 @@ def _apply_dispositions_vectorized(
 
     # Split tokens and phrases correctly
     tokens = [t for t in blacklist_terms if " " not in t]
-    phrases = tuple(p for p in blacklist_terms if " " in p)
-
-    # Single-word token detection (word boundaries) - use cached regex
-    token_regex = _get_token_regex(tokens)
-    token_mask = name_series.str.contains(token_regex, na=False)
-
-    # Multi-word phrase detection (substring) - vectorized
-    if phrases:
-        phrase_regex = _get_phrase_regex(phrases)
-        phrase_mask = name_lower.str.contains(phrase_regex, na=False)
-    else:
-        phrase_mask = false_series
+    phrases = [p for p in blacklist_terms if " " in p]
 
-    # Combined blacklist mask
-    blacklist_mask = token_mask | phrase_mask
+    # Single-word tokens on word boundaries, multi-word phrases as substrings,
+    # matched together by the cached automaton
+    blacklist_mask = get_blacklist_matcher(tokens, phrases).mask(name_series)
     
     # PROFILING: End timing blacklist mask building
     blacklist_time = time.time() - blacklist_start
@@ -12,7 +12,7 @@ DTYPES = {
     "created_date": "string",  # Keep as string for Excel serial compatibility
     # Normalization fields
     "name_core": "string",
-    "name_core_tokens": "string",  # JSON string of token list
+    "name_core_tokens": "object",  # List of tokens (Arrow list<string> on disk)
     "suffix_class": "category",
     "has_parentheses": "boolean",
     "has_semicolon": "boolean",
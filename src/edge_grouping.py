@@ -7,17 +7,31 @@ from __future__ import annotations
 
 import json
 import logging
-from collections import defaultdict
-from typing import Any, Callable
-
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from collections.abc import Set as AbstractSet
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Callable, cast
+
+import numpy as np
 import pandas as pd
 
+from src.utils.parallel_protocols import ChunkedExecutorLike, ExecutorLike
 from src.utils.progress import ProgressLogger
+from src.utils.token_vocab import (
+    TokenVocabulary,
+    build_token_vocabulary,
+    intersection_sizes,
+)
+from src.utils.union_find import ArrayUnionFind, connected_component_labels
 
 logger = logging.getLogger(__name__)
 
 # Optional imports with safe fallbacks
 try:
+    from src.utils.hash_utils import config_hash, stable_group_id_for_hash
     from src.utils.hash_utils import stable_group_id as _stable_group_id
 
     StableGroupIdFunc = Callable[[list[str], dict[str, Any]], str]
@@ -34,9 +48,9 @@ def can_join_group(
     primary_id: str,
     candidate_id: str,
     edge_scores: dict[tuple[str, str], float],
-    token_sets: dict[str, set[str]],
+    token_sets: dict[str, AbstractSet[Any]],
     config: dict[str, Any],
-    stop_tokens: set[str],
+    stop_tokens: AbstractSet[Any],
 ) -> tuple[bool, str, float]:
     """Determine if a candidate can join a group based on edge-gating rules.
 
@@ -44,9 +58,10 @@ def can_join_group(
         primary_id: ID of the group primary
         candidate_id: ID of the candidate to join
         edge_scores: Dict mapping (id1, id2) tuples to similarity scores
-        token_sets: Dict mapping account IDs to their token sets
+        token_sets: Dict mapping account IDs to their token sets (token
+            strings or token IDs)
         config: Configuration dictionary
-        stop_tokens: Set of stop tokens to exclude
+        stop_tokens: Set of stop tokens to exclude, in the same encoding
 
     Returns:
         Tuple of (can_join, reason, score)
@@ -128,6 +143,425 @@ def apply_canopy_bound(
     return float(score) >= float(high_threshold)
 
 
+# -------------------------------
+# Array grouping kernel
+# -------------------------------
+
+# Edge-gating reasons, indexed by the kernel's reason codes
+GATING_REASONS = ("edge>=high", "edge>=medium+shared_token", "insufficient_edge")
+_INSUFFICIENT_EDGE = 2
+
+# Sorted pairs handed to the gating kernel per call (one progress step)
+_PAIRS_PER_KERNEL_CALL = 50_000
+
+
+def _lookup_edge_scores(
+    edge_a: np.ndarray,
+    edge_b: np.ndarray,
+    edge_score_values: np.ndarray,
+    query_a: np.ndarray,
+    query_b: np.ndarray,
+    num_nodes: int,
+) -> np.ndarray:
+    """Score of each queried edge, as ``can_join_group`` reads ``edge_scores``.
+
+    The (a, b) edge is preferred over (b, a) and the last duplicate of an
+    edge wins, like the ``edge_scores`` dict built from the pairs in order.
+    Missing edges score 0.0.
+    """
+    keys = edge_a.astype(np.int64) * num_nodes + edge_b
+    last = ~pd.Index(keys).duplicated(keep="last")
+    index = pd.Index(keys[last])
+    scores = np.append(edge_score_values[last], 0.0)
+
+    forward = index.get_indexer(query_a.astype(np.int64) * num_nodes + query_b)
+    reverse = index.get_indexer(query_b.astype(np.int64) * num_nodes + query_a)
+    # -1 (missing) indexes the trailing 0.0
+    return cast("np.ndarray", scores[np.where(forward >= 0, forward, reverse)])
+
+
+def _gating_reason_codes(
+    edge_scores: np.ndarray,
+    shared_counts: np.ndarray,
+    config: dict[str, Any],
+) -> np.ndarray:
+    """Vectorized ``can_join_group`` reason per pair (index into GATING_REASONS)."""
+    high_threshold = config.get("similarity", {}).get("high", 92)
+    medium_threshold = config.get("similarity", {}).get("medium", 84)
+    allow_medium_plus_shared = (
+        config.get("grouping", {})
+        .get("edge_gating", {})
+        .get("allow_medium_plus_shared_token", True)
+    )
+
+    codes = np.full(len(edge_scores), _INSUFFICIENT_EDGE, dtype=np.int8)
+    if allow_medium_plus_shared:
+        codes[(edge_scores >= medium_threshold) & (shared_counts > 0)] = 1
+    codes[edge_scores >= high_threshold] = 0
+    return codes
+
+
+def _gate_edges(
+    parent: Any,
+    rank: Any,
+    size: Any,
+    member_count: Any,
+    primary: Any,
+    candidate: Any,
+    reason_codes: Any,
+    is_high: Any,
+    start: int,
+    end: int,
+    prefer_smaller: bool,
+    maintain_size: bool,
+    canopy_enabled: bool,
+    max_without_high: int,
+    reason_counts: Any,
+    joined_by: Any,
+    num_unions: int,
+) -> tuple[int, int]:
+    """Edge-gating loop over sorted pairs ``start:end``, updating state in place.
+
+    Works on NumPy arrays or plain lists using indexing only, so it can be
+    compiled with numba unchanged. Union decisions follow the original
+    loop: pairs already in one group are skipped, the gating reason is
+    counted, then the canopy bound is checked before the union.
+
+    Args:
+        parent: Union-find parent per node
+        rank: Union-find rank per node
+        size: Component size per root
+        member_count: Tracked members filed under each primary node
+        primary: Primary (lower ID) node per sorted pair
+        candidate: Candidate node per sorted pair
+        reason_codes: Gating reason code per sorted pair
+        is_high: Whether each pair's edge reaches the high threshold
+        start: First pair to process
+        end: One past the last pair to process
+        prefer_smaller: Equal-rank unions keep the smaller root, not the primary's
+        maintain_size: Canopy bound uses component sizes, not member counts
+        canopy_enabled: Whether the canopy bound applies
+        max_without_high: Group size from which joins need a high edge
+        reason_counts: Counts per gating reason, updated in place
+        joined_by: Pair index of each candidate's latest join, updated in place
+        num_unions: Unions performed so far
+
+    Returns:
+        Tuple of (total unions performed, canopy rejections in this call)
+
+    """
+    canopy_rejections = 0
+    for i in range(start, end):
+        node_a = primary[i]
+        node_b = candidate[i]
+
+        # Find both roots, compressing their paths
+        root_a = node_a
+        while parent[root_a] != root_a:
+            root_a = parent[root_a]
+        node = node_a
+        while parent[node] != root_a:
+            next_node = parent[node]
+            parent[node] = root_a
+            node = next_node
+        root_b = node_b
+        while parent[root_b] != root_b:
+            root_b = parent[root_b]
+        node = node_b
+        while parent[node] != root_b:
+            next_node = parent[node]
+            parent[node] = root_b
+            node = next_node
+
+        # Skip if already in same group
+        if root_a == root_b:
+            continue
+
+        reason = reason_codes[i]
+        reason_counts[reason] += 1
+        if reason == _INSUFFICIENT_EDGE:
+            continue
+
+        # Canopy bound: large groups only accept high edges
+        if maintain_size:
+            group_size = size[root_a]
+        else:
+            group_size = member_count[node_a] + 1
+        if canopy_enabled and group_size >= max_without_high and not is_high[i]:
+            canopy_rejections += 1
+            continue
+
+        # Union by rank
+        if rank[root_a] < rank[root_b] or (
+            rank[root_a] == rank[root_b] and prefer_smaller and root_b < root_a
+        ):
+            root_a, root_b = root_b, root_a
+        parent[root_b] = root_a
+        size[root_a] += size[root_b]
+        if rank[root_a] == rank[root_b]:
+            rank[root_a] += 1
+
+        member_count[node_a] += 1
+        joined_by[node_b] = i
+        num_unions += 1
+
+    return num_unions, canopy_rejections
+
+
+@lru_cache(maxsize=1)
+def _compiled_gate_edges() -> Callable[..., tuple[int, int]] | None:
+    """``_gate_edges`` compiled with numba, or None when numba is unavailable."""
+    try:
+        from numba import njit
+    except ImportError:
+        logger.warning("numba not available, running the gating kernel uncompiled")
+        return None
+    compiled: Callable[..., tuple[int, int]] = njit(cache=True)(_gate_edges)
+    return compiled
+
+
+@dataclass(frozen=True)
+class _GatingParams:
+    """Static settings of the gating kernel."""
+
+    prefer_smaller: bool
+    maintain_size: bool
+    canopy_enabled: bool
+    max_without_high: int
+    jit: bool
+
+
+def _run_gating(
+    state: list[np.ndarray],
+    pairs: list[np.ndarray],
+    params: _GatingParams,
+    reason_counts: np.ndarray,
+    joined_by: np.ndarray,
+    progress: ProgressLogger | None = None,
+) -> tuple[int, int]:
+    """Run the gating kernel over all pairs, updating ``state`` in place.
+
+    Args:
+        state: parent, rank, size and member_count arrays
+        pairs: primary, candidate, reason code and is-high arrays, in
+            processing order
+        params: Kernel settings
+        reason_counts: Counts per gating reason, updated in place
+        joined_by: Pair index of each candidate's latest join, updated in place
+        progress: Optional progress logger, stepped once per kernel call
+
+    Returns:
+        Tuple of (unions performed, canopy rejections)
+
+    """
+    kernel: Callable[..., tuple[int, int]] = _gate_edges
+    if params.jit:
+        kernel = _compiled_gate_edges() or _gate_edges
+    kernel_state: list[Any] = state
+    kernel_pairs: list[Any] = pairs
+    if kernel is _gate_edges:
+        # Plain lists index fastest in the interpreter
+        kernel_state = [values.tolist() for values in state]
+        kernel_pairs = [values.tolist() for values in pairs]
+
+    num_pairs = len(pairs[0])
+    chunk_starts: Iterable[int] = range(0, num_pairs, _PAIRS_PER_KERNEL_CALL)
+    if progress is not None:
+        chunk_starts = progress.wrap(chunk_starts)
+
+    unions_performed = 0
+    canopy_rejections = 0
+    for chunk_start in chunk_starts:
+        unions_performed, chunk_rejections = kernel(
+            *kernel_state,
+            *kernel_pairs,
+            chunk_start,
+            min(chunk_start + _PAIRS_PER_KERNEL_CALL, num_pairs),
+            params.prefer_smaller,
+            params.maintain_size,
+            params.canopy_enabled,
+            params.max_without_high,
+            reason_counts,
+            joined_by,
+            unions_performed,
+        )
+        canopy_rejections += chunk_rejections
+
+    for array, values in zip(state, kernel_state):
+        array[:] = values
+    return unions_performed, canopy_rejections
+
+
+@dataclass
+class _GatingUnit:
+    """Connected components gated together in one worker task.
+
+    Attributes:
+        nodes: Global node IDs of the components, ascending (local node i is
+            ``nodes[i]``, so local order matches global order)
+        pair_index: Global indices of the components' sorted pairs, ascending
+        state: Local parent, rank, size and member_count arrays
+        pairs: Local primary, candidate, reason code and is-high arrays
+        params: Kernel settings
+
+    """
+
+    nodes: np.ndarray
+    pair_index: np.ndarray
+    state: list[np.ndarray]
+    pairs: list[np.ndarray]
+    params: _GatingParams
+
+
+def _gate_component_units(
+    units: list[_GatingUnit],
+) -> tuple[tuple[list[np.ndarray], np.ndarray, np.ndarray, int, int], ...]:
+    """Gate a chunk of component units in a worker.
+
+    Returns a tuple (not a list) so ``execute_chunked`` keeps one result per
+    chunk on both its sequential and parallel paths.
+    """
+    results = []
+    for unit in units:
+        reason_counts = np.zeros(len(GATING_REASONS), dtype=np.int64)
+        joined_by = np.full(len(unit.nodes), -1, dtype=np.int64)
+        unions, rejections = _run_gating(
+            unit.state,
+            unit.pairs,
+            unit.params,
+            reason_counts,
+            joined_by,
+        )
+        results.append((unit.state, reason_counts, joined_by, unions, rejections))
+    return tuple(results)
+
+
+def _gate_components_parallel(
+    uf: ArrayUnionFind,
+    member_count: np.ndarray,
+    pairs: list[np.ndarray],
+    params: _GatingParams,
+    parallel_executor: ChunkedExecutorLike,
+    reason_counts: np.ndarray,
+    joined_by: np.ndarray,
+) -> tuple[int, int] | None:
+    """Gate connected components of the pair graph across workers.
+
+    Gating is order-dependent only within a component of the joinable pairs,
+    so each component's pairs are run in their sorted order on local copies
+    of its union-find state, and the results are written back node by node.
+    Decisions and reason counts match the sequential loop exactly.
+
+    Args:
+        uf: Union-find after the exact-equals unions, updated in place
+        member_count: Members filed under each primary node, updated in place
+        pairs: primary, candidate, reason code and is-high arrays, sorted
+        params: Kernel settings
+        parallel_executor: Executor for the component units
+        reason_counts: Counts per gating reason, updated in place
+        joined_by: Pair index of each candidate's latest join, updated in place
+
+    Returns:
+        Tuple of (unions performed, canopy rejections), or None when the
+        joinable pairs form fewer than two components
+
+    """
+    primary, candidate = pairs[0], pairs[1]
+    roots = uf.find_all()
+
+    # Only pairs that can pass the gate ever merge groups, so components are
+    # taken over those; other pairs between two components always count as
+    # insufficient and need no kernel work
+    joinable = pairs[2] != _INSUFFICIENT_EDGE
+    labels = connected_component_labels(
+        len(uf),
+        roots[primary[joinable]],
+        roots[candidate[joinable]],
+    )
+    node_labels = labels[roots]
+    internal = np.flatnonzero(node_labels[primary] == node_labels[candidate])
+    pair_labels = node_labels[primary[internal]]
+    components, pair_counts = np.unique(pair_labels, return_counts=True)
+    if len(components) < 2:
+        return None
+    reason_counts[_INSUFFICIENT_EDGE] += len(primary) - len(internal)
+
+    # Pairs and nodes grouped by component (ascending within each)
+    pair_order = internal[np.argsort(pair_labels, kind="stable")]
+    pair_offsets = np.concatenate([[0], np.cumsum(pair_counts)])
+    node_sel = np.flatnonzero(np.isin(node_labels, components))
+    node_order = node_sel[np.argsort(node_labels[node_sel], kind="stable")]
+    node_counts = np.unique(node_labels[node_sel], return_counts=True)[1]
+    node_offsets = np.concatenate([[0], np.cumsum(node_counts)])
+
+    # Contiguous component ranges of roughly equal pair counts
+    n_units = min(len(components), max(1, parallel_executor.workers * 3))
+    targets = pair_offsets[-1] * np.arange(1, n_units) / n_units
+    cuts = np.searchsorted(pair_offsets[1:], targets, side="left") + 1
+    bounds = np.unique(np.concatenate([[0], cuts, [len(components)]]))
+    bounds = bounds[bounds <= len(components)]
+
+    units = []
+    for first, last in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+        nodes = np.sort(node_order[node_offsets[first] : node_offsets[last]])
+        pair_index = np.sort(pair_order[pair_offsets[first] : pair_offsets[last]])
+        units.append(
+            _GatingUnit(
+                nodes=nodes,
+                pair_index=pair_index,
+                state=[
+                    np.searchsorted(nodes, uf.parent[nodes]).astype(np.int32),
+                    uf.rank[nodes],
+                    uf.size[nodes],
+                    member_count[nodes],
+                ],
+                pairs=[
+                    np.searchsorted(nodes, primary[pair_index]),
+                    np.searchsorted(nodes, candidate[pair_index]),
+                    pairs[2][pair_index],
+                    pairs[3][pair_index],
+                ],
+                params=params,
+            ),
+        )
+    logger.info(
+        f"grouping | parallel_components | components={len(components)} | "
+        f"units={len(units)} | max_unit_pairs={max(len(u.pair_index) for u in units)}",
+    )
+
+    chunk_results = parallel_executor.execute_chunked(
+        _gate_component_units,
+        units,
+        chunk_size=1,
+        operation_name="grouping",
+        work_size=len(primary),
+    )
+    unit_results = [result for chunk in chunk_results for result in chunk]
+    if len(unit_results) != len(units):
+        raise RuntimeError(
+            f"grouping interrupted: {len(unit_results)}/{len(units)} component units gated",
+        )
+
+    # Deterministic merge: units own disjoint nodes
+    unions_performed = 0
+    canopy_rejections = 0
+    for unit, (state, counts, local_joined, unions, rejections) in zip(
+        units,
+        unit_results,
+    ):
+        nodes = unit.nodes
+        uf.parent[nodes] = nodes[state[0]]
+        uf.rank[nodes] = state[1]
+        uf.size[nodes] = state[2]
+        member_count[nodes] = state[3]
+        joined = local_joined >= 0
+        joined_by[nodes[joined]] = unit.pair_index[local_joined[joined]]
+        reason_counts += counts
+        unions_performed += unions
+        canopy_rejections += rejections
+    return unions_performed, canopy_rejections
+
+
 # -------------------------------
 # Main grouping functions
 # -------------------------------
@@ -140,6 +574,8 @@ def create_groups_with_edge_gating(
     stop_tokens: set[str],
     enable_progress: bool = False,
     profile: bool = False,
+    token_vocab: TokenVocabulary | None = None,
+    parallel_executor: ExecutorLike | None = None,
 ) -> pd.DataFrame:
     """Create groups using edge-gating logic.
 
@@ -148,6 +584,12 @@ def create_groups_with_edge_gating(
         candidate_pairs_df: DataFrame with candidate pairs and scores
         config: Configuration dictionary
         stop_tokens: Set of stop tokens
+        enable_progress: Enable progress logging
+        profile: Enable performance profiling
+        token_vocab: Run-level token vocabulary; built from ``accounts_df``
+            when not given
+        parallel_executor: Executor for gating connected components in
+            parallel (``performance.parallel_components``)
 
     Returns:
         DataFrame with group assignments and explain metadata
@@ -247,29 +689,7 @@ def create_groups_with_edge_gating(
         return create_groups_standard(accounts_df, candidate_pairs_df, config)
 
     # Prepare data structures
-    edge_scores: dict[tuple[str, str], float] = {}
-    token_sets: dict[str, set[str]] = {}
-
-    # Build edge scores dict
-    perf_settings = (
-        config.get("grouping", {}).get("edge_gating", {}).get("performance", {})
-    )
-    vectorize_edge_scores = perf_settings.get("vectorize_edge_scores", False)
-
-    if vectorize_edge_scores:
-        # Vectorized edge_scores building without iterrows
-        logger.info("Using vectorized edge_scores building")
-        edge_scores = dict(
-            zip(
-                zip(candidate_pairs_df[id_col1], candidate_pairs_df[id_col2]),
-                candidate_pairs_df["score"],
-            ),
-        )
-    else:
-        # Original iterrows approach
-        for _, row in candidate_pairs_df.iterrows():
-            id1, id2 = row[id_col1], row[id_col2]
-            edge_scores[(id1, id2)] = row["score"]
+    perf_settings = edge_gating_config.get("performance", {})
 
     # Build token sets
     # Handle different column naming conventions for account ID
@@ -287,138 +707,105 @@ def create_groups_with_edge_gating(
 
     # Check if optimized token parsing is enabled
     token_parse_mode = perf_settings.get("token_parse", "auto")
+    token_lists: Iterable[Any] = [[]] * len(accounts_df)
 
     if token_parse_mode == "auto":
-        # Auto-detect and use optimized parsing
-        try:
-            from src.utils.perf_utils import parse_name_core_tokens
-
-            logger.info("Using optimized token parsing")
-            token_series = accounts_df.get(
-                "name_core_tokens",
-                pd.Series("[]", index=accounts_df.index),
-            )
-            token_sets = {
-                account_id: set(parse_name_core_tokens(tokens_str))
-                for account_id, tokens_str in zip(
-                    accounts_df[account_id_col],
-                    token_series,
-                )
-            }
-        except ImportError:
-            logger.warning(
-                "Optimized token parsing not available, using standard approach",
-            )
-            token_parse_mode = "json"
+        logger.info("Using token-ID sets for edge gating")
+        token_lists = accounts_df.get("name_core_tokens", token_lists)
 
     if token_parse_mode == "json":
         # Original JSON parsing approach
-        for _, row in accounts_df.iterrows():
-            account_id = row[account_id_col]
-            tokens_str = row.get("name_core_tokens", "[]")
+        parsed_lists: list[AbstractSet[Any]] = []
+        for tokens_str in accounts_df.get(
+            "name_core_tokens", ["[]"] * len(accounts_df)
+        ):
+            if not isinstance(tokens_str, str):
+                # Native token lists need no decoding
+                parsed_lists.append(
+                    set(tokens_str) if tokens_str is not None else set(),
+                )
+                continue
             try:
-                tokens = set(json.loads(tokens_str))
-                token_sets[account_id] = tokens
+                parsed_lists.append(set(json.loads(tokens_str)))
             except (json.JSONDecodeError, TypeError):
-                token_sets[account_id] = set()
-
-    # Union-Find selection
-    maintain_unionfind_size = perf_settings.get("maintain_unionfind_size", False)
-    if maintain_unionfind_size:
-        # Use optimized Union-Find with size tracking
-        try:
-            from src.utils.union_find import DisjointSet
-
-            logger.info("Using optimized Union-Find with size tracking")
-
-            uf = DisjointSet()
-            for account_id in accounts_df[account_id_col]:
-                uf.make_set(account_id)
-
-            def find(x: str) -> str:
-                return str(uf.find(x))
+                parsed_lists.append(set())
+        token_lists = parsed_lists
+
+    # Token sets hold int32 token IDs from the run vocabulary; stop tokens are
+    # encoded in the same call so out-of-vocabulary stop tokens still match
+    # their record tokens
+    stop_list = sorted(stop_tokens)
+    if token_vocab is None:
+        _, encoded = build_token_vocabulary(chain([stop_list], token_lists))
+    else:
+        encoded = token_vocab.encode(chain([stop_list], token_lists))
+    stop_mask = np.zeros(encoded.id_bound, dtype=bool)
+    stop_mask[encoded.record(0)] = True
+
+    # Union-find over integer node IDs: accounts are numbered in sorted
+    # account_id order, so the smaller node is always the smaller ID
+    node_ids = pd.Index(accounts_df[account_id_col].astype(object)).sort_values()
+    account_ids = node_ids.to_numpy()
+    num_nodes = len(node_ids)
+
+    def to_nodes(ids: pd.Series) -> np.ndarray:
+        nodes = node_ids.get_indexer(ids.astype(object))
+        if (nodes < 0).any():
+            unknown = ids[nodes < 0].head(5).tolist()
+            raise ValueError(
+                f"candidate pairs reference unknown account_id values, sample: {unknown}",
+            )
+        return cast("np.ndarray", nodes)
 
-            def union(x: str, y: str) -> None:
-                uf.union(x, y)
+    # Unique token IDs per node
+    node_tokens = encoded.take(
+        1 + np.argsort(to_nodes(accounts_df[account_id_col])),
+    ).unique()
 
-            def get_group_size(x: str) -> int:
-                return uf.get_size(x)
+    # Edge scores of all pairs (exact equals included), keyed by node pair
+    edge_a = to_nodes(candidate_pairs_df[id_col1])
+    edge_b = to_nodes(candidate_pairs_df[id_col2])
+    edge_score_values = candidate_pairs_df["score"].to_numpy(dtype=np.float64)
 
-        except ImportError:
-            logger.warning(
-                "Optimized Union-Find not available, using standard approach",
-            )
-            maintain_unionfind_size = False
-
-    if not maintain_unionfind_size:
-        # Standard Union-Find structure
-        parent: dict[str, str] = {}
-        rank: dict[str, int] = {}
-
-        def find(x: str) -> str:
-            if parent[x] != x:
-                parent[x] = find(parent[x])
-            return parent[x]
-
-        def union(x: str, y: str) -> None:
-            px, py = find(x), find(y)
-            if px == py:
-                return
-            if rank[px] < rank[py]:
-                parent[px] = py
-            elif rank[px] > rank[py]:
-                parent[py] = px
-            # When ranks are equal, always choose the smaller root ID as the new parent
-            # This ensures consistent results across runs
-            elif px < py:
-                parent[py] = px
-                rank[px] += 1
-            else:
-                parent[px] = py
-                rank[py] += 1
-
-        def get_group_size(x: str) -> int:
-            # Fallback: count group members manually
-            root = find(x)
-            return sum(1 for node in parent if find(node) == root)
-
-        # Initialize all accounts as their own groups
-        logger.debug(
-            f"Initializing standard Union-Find for {len(accounts_df)} accounts",
-        )
-        for account_id in accounts_df[account_id_col]:
-            parent[account_id] = account_id
-            rank[account_id] = 0
+    # With size tracking the canopy bound sees the true component size and
+    # equal-rank unions keep the primary's root (as DisjointSet did);
+    # otherwise it counts tracked members and ties keep the smaller ID
+    maintain_unionfind_size = perf_settings.get("maintain_unionfind_size", False)
+    uf = ArrayUnionFind(
+        num_nodes,
+        tie_break="first" if maintain_unionfind_size else "smaller",
+    )
+    logger.info(
+        f"grouping | union_find=array | nodes={len(uf)} | "
+        f"maintain_size={maintain_unionfind_size}",
+    )
 
-    # Group membership tracking (move this ABOVE any use)
-    group_members: dict[str, list[str]] = defaultdict(list)
-    explain_metadata: dict[str, dict[str, Any]] = {}
+    # Members filed under each primary node (canopy size without size tracking)
+    member_count = np.zeros(num_nodes, dtype=np.int32)
 
     # Phase 1.35.2: Fast-path union of exact equals pairs first
     exact_equals_unions = 0
     if "group_join_reason" in candidate_pairs_df.columns:
         exact_pairs = candidate_pairs_df[
             candidate_pairs_df["group_join_reason"] == "exact_equal_raw"
-        ].copy()
+        ]
 
         if not exact_pairs.empty:
             logger.info(
                 f"grouping | processing_exact_equals | pairs={len(exact_pairs)} | backend=union_find",
             )
 
-            # Process exact equals pairs (score = 100.0)
-            for _, row in exact_pairs.iterrows():
-                id1, id2 = row[id_col1], row[id_col2]
-
-                # Union the exact equals
-                union(id1, id2)
-                exact_equals_unions += 1
+            # Union the exact equals (score = 100.0) in one batch
+            exact_a = to_nodes(exact_pairs[id_col1])
+            exact_b = to_nodes(exact_pairs[id_col2])
+            roots_at_union = np.empty(len(exact_a), dtype=np.int64)
+            uf.union_many(exact_a, exact_b, roots_out=roots_at_union)
+            exact_equals_unions = len(exact_pairs)
 
-                # Track group membership
-                root = find(id1)
-                if root not in group_members:
-                    group_members[root] = []
-                group_members[root].extend([id1, id2])
+            # File both ends of each pair under the root the pair had right
+            # after its union, not the final root: later pairs can move the
+            # root while the members stay filed under the earlier node
+            np.add.at(member_count, roots_at_union, 2)
 
             logger.info(
                 f"grouping | exact_equals_complete | unions={exact_equals_unions} | backend=union_find",
@@ -434,9 +821,6 @@ def create_groups_with_edge_gating(
         )
 
     # Process candidate pairs in score order (highest first)
-    perf_settings = (
-        config.get("grouping", {}).get("edge_gating", {}).get("performance", {})
-    )
     _pair_columns = perf_settings.get(
         "pair_columns",
         [id_col1, id_col2, "score"],
@@ -455,91 +839,105 @@ def create_groups_with_edge_gating(
             kind="mergesort",
         )
 
-    # Add progress logging for pair processing
-    pair_progress = ProgressLogger(
-        total=len(sorted_pairs),
-        label="grouping",
-        step_every=50_000,
-        secs_every=5.0,
-        enable_tqdm=enable_progress,
+    # Pre-extract the gating inputs of every sorted pair: primary (lower ID)
+    # and candidate nodes, edge score, shared non-stop tokens and reason
+    sorted_a = to_nodes(sorted_pairs[id_col1])
+    sorted_b = to_nodes(sorted_pairs[id_col2])
+    primary_nodes = np.minimum(sorted_a, sorted_b)
+    candidate_nodes = np.maximum(sorted_a, sorted_b)
+    edge_scores = _lookup_edge_scores(
+        edge_a,
+        edge_b,
+        edge_score_values,
+        primary_nodes,
+        candidate_nodes,
+        num_nodes,
+    )
+    shared_counts = intersection_sizes(
+        node_tokens,
+        primary_nodes,
+        candidate_nodes,
+        stop_mask,
     )
+    reason_codes = _gating_reason_codes(edge_scores, shared_counts, config)
+    high_threshold = config.get("similarity", {}).get("high", 92)
+    canopy_config = edge_gating_config.get("canopy_bound", {})
 
     # Performance counters
     start_time = pd.Timestamp.now()
-    pairs_processed = 0
-    unions_performed = 0
-    canopy_rejections = 0
-
-    # Track edge-gating decisions for tuning
-    import collections
-
-    gating_reasons: collections.Counter[str] = collections.Counter()
-
-    for _, row in pair_progress.wrap(sorted_pairs.iterrows()):
-        id1, id2 = row[id_col1], row[id_col2]
-        pairs_processed += 1
-
-        # Skip if already in same group
-        if find(id1) == find(id2):
-            continue
-
-        # Determine primary (lower ID for consistency)
-        primary_id = min(id1, id2)
-        candidate_id = max(id1, id2)
-
-        # Check if candidate can join primary's group
-        can_join, reason, actual_score = can_join_group(
-            primary_id,
-            candidate_id,
-            edge_scores,
-            token_sets,
-            config,
-            stop_tokens,
+    pairs_processed = len(sorted_pairs)
+
+    # Run the gating loop over plain arrays, per connected component across
+    # workers when enabled, otherwise in chunks for progress logging
+    params = _GatingParams(
+        prefer_smaller=uf.tie_break == "smaller",
+        maintain_size=maintain_unionfind_size,
+        canopy_enabled=canopy_config.get("enabled", True),
+        max_without_high=canopy_config.get("max_without_high_edge", 8),
+        jit=perf_settings.get("jit_kernel", False),
+    )
+    gating_pairs = [
+        primary_nodes,
+        candidate_nodes,
+        reason_codes,
+        edge_scores >= float(high_threshold),
+    ]
+    reason_counts = np.zeros(len(GATING_REASONS), dtype=np.int64)
+    joined_by = np.full(num_nodes, -1, dtype=np.int64)
+
+    gating_result = None
+    if (
+        perf_settings.get("parallel_components", False)
+        and isinstance(parallel_executor, ChunkedExecutorLike)
+        and parallel_executor.workers > 1
+    ):
+        gating_result = _gate_components_parallel(
+            uf,
+            member_count,
+            gating_pairs,
+            params,
+            parallel_executor,
+            reason_counts,
+            joined_by,
         )
+    if gating_result is None:
+        pair_progress = ProgressLogger(
+            total=-(-pairs_processed // _PAIRS_PER_KERNEL_CALL),
+            label=f"grouping | chunk_pairs={_PAIRS_PER_KERNEL_CALL}",
+            step_every=1,
+            secs_every=5.0,
+            enable_tqdm=enable_progress,
+        )
+        gating_result = _run_gating(
+            [uf.parent, uf.rank, uf.size, member_count],
+            gating_pairs,
+            params,
+            reason_counts,
+            joined_by,
+            pair_progress,
+        )
+    unions_performed, canopy_rejections = gating_result
 
-        # Track gating decisions for tuning
-        gating_reasons[reason] += 1
-
-        if not can_join:
-            continue
-
-        # Check canopy bound using optimized group size if available
-        if maintain_unionfind_size:
-            current_group_size = get_group_size(primary_id)
-        else:
-            current_group = [m for m in group_members[primary_id]] + [primary_id]
-            current_group_size = len(current_group)
-
-        if not apply_canopy_bound(
-            current_group_size,
-            primary_id,
-            candidate_id,
-            edge_scores,
-            config,
-        ):
-            logger.debug(
-                f"Canopy bound rejected {candidate_id} joining {primary_id}'s group (size: {current_group_size})",
-            )
-            canopy_rejections += 1
-            continue
-
-        # Perform union
-        union(primary_id, candidate_id)
-        unions_performed += 1
-
-        # Update group membership
-        group_members[primary_id].append(candidate_id)
+    # Track edge-gating decisions for tuning
+    gating_reasons = Counter(
+        {
+            reason: int(count)
+            for reason, count in zip(GATING_REASONS, reason_counts)
+            if count
+        },
+    )
 
-        # Record explain metadata
-        shared_tokens = (
-            token_sets.get(primary_id, set())
-            & token_sets.get(candidate_id, set()) - stop_tokens
-        )
-        explain_metadata[candidate_id] = {
-            "group_join_reason": reason,
-            "weakest_edge_to_primary": actual_score,
-            "shared_tokens_count": len(shared_tokens),
-        }
+    # Explain metadata per node, from the pair of each candidate's last join
+    joined = np.flatnonzero(joined_by >= 0)
+    join_pairs = joined_by[joined]
+    join_reason = np.full(num_nodes, "primary", dtype=object)
+    join_reason[joined] = np.asarray(GATING_REASONS, dtype=object)[
+        reason_codes[join_pairs]
+    ]
+    join_score = np.zeros(num_nodes, dtype=np.float64)
+    join_score[joined] = edge_scores[join_pairs]
+    join_shared = np.zeros(num_nodes, dtype=np.int64)
+    join_shared[joined] = shared_counts[join_pairs]
 
     # Log performance metrics
     end_time = pd.Timestamp.now()
@@ -570,34 +968,39 @@ def create_groups_with_edge_gating(
         except Exception as e:  # pragma: no cover
             logger.warning(f"Failed to save profile: {e}")
 
-    # Build final groups dataframe
-    groups_data: list[dict[str, Any]] = []
-
-    for account_id in accounts_df["account_id"]:
-        group_root = find(account_id)
-        group_member_list = [m for m in group_members[group_root]] + [group_root]
-
-        # Generate stable group ID
-        if stable_group_id is None:
-            raise ImportError("stable_group_id is not available")
-        group_id = stable_group_id(group_member_list, config)
-
-        # Get explain metadata
-        explain = explain_metadata.get(account_id, {})
-
-        groups_data.append(
-            {
-                "account_id": account_id,
-                "group_id": group_id,
-                "group_size": len(group_member_list),
-                "is_primary": account_id == group_root,
-                "group_join_reason": explain.get("group_join_reason", "primary"),
-                "weakest_edge_to_primary": explain.get("weakest_edge_to_primary", 0.0),
-                "shared_tokens_count": explain.get("shared_tokens_count", 0),
-            },
-        )
+    # Build final groups dataframe: components come from the union-find
+    # roots, and each gets its stable ID once
+    if stable_group_id is None:
+        raise ImportError("stable_group_id is not available")
+    roots = uf.find_all()
+    by_root = np.argsort(roots, kind="stable")
+    _, component_of = np.unique(roots, return_inverse=True)
+    component_sizes = np.bincount(component_of)
+    cfg_hash = config_hash(config)
+    group_ids = np.asarray(
+        [
+            stable_group_id_for_hash(members, cfg_hash)
+            for members in np.split(
+                account_ids[by_root],
+                np.cumsum(component_sizes)[:-1],
+            )
+        ],
+        dtype=object,
+    )
 
-    groups_df = pd.DataFrame(groups_data)
+    account_nodes = to_nodes(accounts_df["account_id"])
+    account_components = component_of[account_nodes]
+    groups_df = pd.DataFrame(
+        {
+            "account_id": accounts_df["account_id"].to_numpy(dtype=object),
+            "group_id": group_ids[account_components],
+            "group_size": component_sizes[account_components].astype(np.int64),
+            "is_primary": roots[account_nodes] == account_nodes,
+            "group_join_reason": join_reason[account_nodes],
+            "weakest_edge_to_primary": join_score[account_nodes],
+            "shared_tokens_count": join_shared[account_nodes],
+        },
+    )
 
     # Merge back with original account data
     groups_df = groups_df.merge(accounts_df, on="account_id", how="left")
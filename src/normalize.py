@@ -9,12 +9,18 @@ This module handles:
 
 import logging
 import re
-from dataclasses import dataclass
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, fields
+from functools import lru_cache, partial
 from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 import yaml
 
+from src.utils.io_utils import dataframe_to_record_batch, record_batches_to_dataframe
+from src.utils.parallel_protocols import ChunkedExecutorLike, ExecutorLike
+
 logger = logging.getLogger(__name__)
 
 # Global normalization settings (loaded from config)
@@ -129,11 +135,170 @@ PARENTHESES_BLACKLIST = {
 }
 
 
-def normalize_name(name: Optional[str]) -> NameNorm:
+# Symbol mapping applied to lowercased names before whitespace cleanup
+SYMBOL_MAP = {
+    "&": " and ",
+    "/": " ",
+    "-": " ",
+    "@": " at ",
+    "+": " plus ",
+    ",": " ",
+    ".": " ",
+    ";": " ",
+    ":": " ",
+    "_": " ",  # Normalize underscores to spaces
+}
+
+# Replacements never contain mapped symbols, so one translate pass equals the
+# sequential str.replace calls
+_SYMBOL_TABLE = str.maketrans(SYMBOL_MAP)
+
+# Numbers with separators (20-20, 20/20 -> 20 20)
+_NUMERIC_STYLE_PATTERN = r"(\d+)[\-\/](\d+)"
+
+_NUMBERED_MARKER_RE = re.compile(r"^\(\d+\)\s*")
+_NUMBERED_PATTERN_RE = re.compile(r"\(\d+\)|^\d+\.")
+_PARENTHESES_RE = re.compile(r"\(([^)]+)\)")
+_DIGITS_ONLY_RE = re.compile(r"^\d+$")
+_CAPITALIZED_WORD_RE = re.compile(r"\b[A-Z][a-z]+")
+
+
+class LegalNameMatcher:
+    """Precompiled legal-suffix and parentheses-blacklist matcher.
+
+    Built once per suffix table and blacklist, then shared by
+    ``extract_suffix``, ``extract_suffix_from_tokens``,
+    ``_is_valid_parentheses_alias`` and the vectorized normalizer.
+
+    Attributes:
+        suffixes: Lowercase suffix phrase -> suffix class
+        max_suffix_tokens: Token count of the longest suffix phrase
+        blacklist_re: Alternation of blacklist terms (substring match), or None
+        trailing_suffix_re: Longest trailing suffix of a single-space-joined
+            token string, with ``core`` and ``suffix`` groups
+
+    """
+
+    def __init__(
+        self,
+        suffixes: Mapping[str, str],
+        blacklist: Iterable[str],
+    ) -> None:
+        """Compile the matcher.
+
+        Args:
+            suffixes: Suffix phrase -> suffix class (case-insensitive)
+            blacklist: Terms that disqualify parentheses content as an alias
+
+        """
+        self.suffixes = {
+            " ".join(phrase.lower().split()): suffix_class
+            for phrase, suffix_class in suffixes.items()
+            if phrase.strip()
+        }
+        self.max_suffix_tokens = max(
+            (len(phrase.split()) for phrase in self.suffixes),
+            default=0,
+        )
+
+        terms = sorted({t.lower() for t in blacklist if t}, key=len, reverse=True)
+        self.blacklist_re = (
+            re.compile("|".join(re.escape(t) for t in terms)) if terms else None
+        )
+
+        # The lazy optional core tries the whole string first, then ever
+        # shorter suffixes, matching split_suffix
+        phrases = sorted(self.suffixes, key=len, reverse=True)
+        self.trailing_suffix_re = re.compile(
+            (
+                r"^(?:(?P<core>.*?) )??(?P<suffix>"
+                + "|".join(re.escape(phrase) for phrase in phrases)
+                + r")$"
+                if phrases
+                else r"(?P<core>(?!))(?P<suffix>(?!))"
+            ),
+        )
+
+    def split_suffix(self, tokens: list[str]) -> tuple[str, str]:
+        """Split the longest trailing legal suffix off a token list.
+
+        Args:
+            tokens: List of name tokens
+
+        Returns:
+            Tuple of (suffix_class, core_name)
+
+        """
+        # Longer candidates than the longest phrase can never match
+        for i in range(min(len(tokens), self.max_suffix_tokens), 0, -1):
+            suffix_class = self.suffixes.get(" ".join(tokens[-i:]))
+            if suffix_class is not None:
+                return suffix_class, " ".join(tokens[:-i])
+
+        return "NONE", " ".join(tokens)
+
+    def is_suffix_word(self, word: str) -> bool:
+        """Return True if a lowercase word is itself a suffix phrase."""
+        return word in self.suffixes
+
+    def is_blacklisted(self, content_lower: str) -> bool:
+        """Return True if lowercase content contains any blacklist term."""
+        return self.blacklist_re is not None and bool(
+            self.blacklist_re.search(content_lower),
+        )
+
+
+_DEFAULT_MATCHER = LegalNameMatcher(LEGAL_SUFFIXES, PARENTHESES_BLACKLIST)
+
+
+def get_name_matcher(
+    normalization_settings: Optional[dict[str, Any]] = None,
+) -> LegalNameMatcher:
+    """Get the matcher for a normalization config, compiling it once.
+
+    ``legal_suffixes`` (phrase -> class) entries extend or override
+    LEGAL_SUFFIXES and ``parentheses_blacklist`` terms extend
+    PARENTHESES_BLACKLIST.
+
+    Args:
+        normalization_settings: ``similarity.normalization`` settings
+
+    Returns:
+        Shared LegalNameMatcher
+
+    """
+    settings = normalization_settings or {}
+    extra_suffixes = settings.get("legal_suffixes") or {}
+    extra_blacklist = settings.get("parentheses_blacklist") or []
+    if not extra_suffixes and not extra_blacklist:
+        return _DEFAULT_MATCHER
+    return _cached_name_matcher(
+        tuple(sorted((str(k), str(v).upper()) for k, v in extra_suffixes.items())),
+        tuple(sorted(str(t) for t in extra_blacklist)),
+    )
+
+
+@lru_cache(maxsize=8)
+def _cached_name_matcher(
+    extra_suffixes: tuple[tuple[str, str], ...],
+    extra_blacklist: tuple[str, ...],
+) -> LegalNameMatcher:
+    """Compile a matcher with settings entries layered over the defaults."""
+    return LegalNameMatcher(
+        {**LEGAL_SUFFIXES, **dict(extra_suffixes)},
+        PARENTHESES_BLACKLIST | set(extra_blacklist),
+    )
+
+
+def normalize_name(
+    name: Optional[str],
+    matcher: Optional[LegalNameMatcher] = None,
+) -> NameNorm:
     """Normalize a company name with legal suffix detection.
 
     Args:
         name: Raw company name string
+        matcher: Suffix/blacklist matcher (defaults to the built-in tables)
 
     Returns:
         NameNorm object with normalized components
@@ -160,16 +325,16 @@ def normalize_name(name: Optional[str]) -> NameNorm:
     has_multiple_names = _detect_multiple_names(name_raw)
 
     # Extract alias candidates
-    alias_candidates, alias_sources = _extract_alias_candidates(name_raw)
+    alias_candidates, alias_sources = _extract_alias_candidates(name_raw, matcher)
 
     # Remove numbered markers from the name for scoring
-    name_for_scoring = re.sub(r"^\(\d+\)\s*", "", name_raw)
+    name_for_scoring = _NUMBERED_MARKER_RE.sub("", name_raw)
 
     # Step 1: Create name_base (lowercase, symbol mapping, whitespace normalization)
     name_base = _create_name_base(name_for_scoring)
 
     # Step 2: Extract suffix and core
-    suffix_class, name_core = extract_suffix(name_base)
+    suffix_class, name_core = extract_suffix(name_base, matcher)
 
     return NameNorm(
         name_raw=name_raw,
@@ -198,20 +363,7 @@ def _create_name_base(name_raw: str) -> str:
     base = name_raw.lower()
 
     # Symbol mapping
-    symbol_map = {
-        "&": " and ",
-        "/": " ",
-        "-": " ",
-        "@": " at ",
-        "+": " plus ",
-        ",": " ",
-        ".": " ",
-        ";": " ",
-        ":": " ",
-        "_": " ",  # Normalize underscores to spaces
-    }
-
-    for symbol, replacement in symbol_map.items():
+    for symbol, replacement in SYMBOL_MAP.items():
         base = base.replace(symbol, replacement)
 
     # Collapse multiple spaces
@@ -236,14 +388,12 @@ def _unify_numeric_style(text: str) -> str:
         Text with unified numeric style
 
     """
-    # Pattern to match numbers with separators
-    pattern = r"(\d+)[\-\/](\d+)"
 
     def replace_numeric(match: re.Match[str]) -> str:
         num1, num2 = match.groups()
         return f"{num1} {num2}"
 
-    return re.sub(pattern, replace_numeric, text)
+    return re.sub(_NUMERIC_STYLE_PATTERN, replace_numeric, text)
 
 
 def _detect_multiple_names(name: str) -> bool:
@@ -261,7 +411,7 @@ def _detect_multiple_names(name: str) -> bool:
         return True
 
     # Numbered patterns like "(1)", "(2)", "1.", "2."
-    if re.search(r"\(\d+\)|^\d+\.", name):
+    if _NUMBERED_PATTERN_RE.search(name):
         return True
 
     # Multiple "and" or "&" separators
@@ -272,11 +422,15 @@ def _detect_multiple_names(name: str) -> bool:
     return False
 
 
-def _extract_alias_candidates(name: str) -> tuple[list[str], list[str]]:
+def _extract_alias_candidates(
+    name: str,
+    matcher: Optional[LegalNameMatcher] = None,
+) -> tuple[list[str], list[str]]:
     """Extract alias candidates from a name string.
 
     Args:
         name: Raw name string
+        matcher: Suffix/blacklist matcher (defaults to the built-in tables)
 
     Returns:
         Tuple of (alias_candidates, alias_sources)
@@ -284,72 +438,75 @@ def _extract_alias_candidates(name: str) -> tuple[list[str], list[str]]:
     """
     aliases = []
     sources = []
+    segments = [s.strip() for s in name.split(";")] if ";" in name else []
 
     # Extract semicolon-separated aliases (including numbered sequences)
-    if ";" in name:
-        segments = [s.strip() for s in name.split(";")]
-        for segment in segments:
-            if segment:
-                # Remove numbered markers from the segment
-                clean_segment = re.sub(r"^\(\d+\)\s*", "", segment)
-                if clean_segment:
-                    aliases.append(clean_segment)
-                    sources.append("semicolon")
+    for segment in segments:
+        if segment:
+            # Remove numbered markers from the segment
+            clean_segment = _NUMBERED_MARKER_RE.sub("", segment)
+            if clean_segment:
+                aliases.append(clean_segment)
+                sources.append("semicolon")
 
     # Extract filtered parentheses aliases (not already captured by semicolon)
-    parentheses_pattern = r"\(([^)]+)\)"
-    matches = re.finditer(parentheses_pattern, name)
-    for match in matches:
+    for match in _PARENTHESES_RE.finditer(name):
         content = match.group(1).strip()
         # Skip if this content is already captured by semicolon splitting
-        if ";" not in name or content not in [s.strip() for s in name.split(";")]:
-            if _is_valid_parentheses_alias(content):
+        if content not in segments:
+            if _is_valid_parentheses_alias(content, matcher):
                 aliases.append(content)
                 sources.append("parentheses")
 
     return aliases, sources
 
 
-def _is_valid_parentheses_alias(content: str) -> bool:
+def _is_valid_parentheses_alias(
+    content: str,
+    matcher: Optional[LegalNameMatcher] = None,
+) -> bool:
     """Check if parentheses content should be treated as a company alias.
 
     Args:
         content: Content inside parentheses
+        matcher: Suffix/blacklist matcher (defaults to the built-in tables)
 
     Returns:
         True if content should be treated as company alias
 
     """
+    matcher = matcher or _DEFAULT_MATCHER
     content_lower = content.lower()
 
     # Check blacklist (exact matches and contains blacklist terms)
-    for blacklist_term in PARENTHESES_BLACKLIST:
-        if blacklist_term in content_lower:
-            return False
+    if matcher.is_blacklisted(content_lower):
+        return False
 
     # Check if it's just a number or single word
-    if re.match(r"^\d+$", content.strip()):
+    if _DIGITS_ONLY_RE.match(content.strip()):
         return False
 
     # Check for legal suffix
-    words = content.lower().split()
-    for word in words:
-        if word in LEGAL_SUFFIXES:
-            return True
+    if any(matcher.is_suffix_word(word) for word in content_lower.split()):
+        return True
 
     # Check for multiple capitalized words (likely company name)
-    capitalized_words = re.findall(r"\b[A-Z][a-z]+", content)
+    capitalized_words = _CAPITALIZED_WORD_RE.findall(content)
     if len(capitalized_words) >= 2:
         return True
 
     return False
 
 
-def _normalize_alias(alias: str) -> str:
+def _normalize_alias(
+    alias: str,
+    matcher: Optional[LegalNameMatcher] = None,
+) -> str:
     """Normalize an alias using the same rules as name_core.
 
     Args:
         alias: Raw alias string
+        matcher: Suffix/blacklist matcher (defaults to the built-in tables)
 
     Returns:
         Normalized alias
@@ -359,16 +516,20 @@ def _normalize_alias(alias: str) -> str:
     normalized = _create_name_base(alias)
 
     # Extract suffix and core (same as normalize_name)
-    suffix_class, name_core = extract_suffix(normalized)
+    suffix_class, name_core = extract_suffix(normalized, matcher)
 
     return name_core
 
 
-def extract_suffix_from_tokens(tokens: list[str]) -> tuple[str, str]:
+def extract_suffix_from_tokens(
+    tokens: list[str],
+    matcher: Optional[LegalNameMatcher] = None,
+) -> tuple[str, str]:
     """Extract legal suffix from tokenized name.
 
     Args:
         tokens: List of name tokens
+        matcher: Suffix/blacklist matcher (defaults to the built-in tables)
 
     Returns:
         Tuple of (suffix_class, core_name)
@@ -377,29 +538,26 @@ def extract_suffix_from_tokens(tokens: list[str]) -> tuple[str, str]:
     if not tokens:
         return "NONE", ""
 
-    # Check for trailing suffix tokens
-    for i in range(len(tokens), 0, -1):
-        suffix_candidate = " ".join(tokens[-i:])
-        if suffix_candidate in LEGAL_SUFFIXES:
-            suffix_class = LEGAL_SUFFIXES[suffix_candidate]
-            core_tokens = tokens[:-i]
-            return suffix_class, " ".join(core_tokens)
-
-    return "NONE", " ".join(tokens)
+    # Check for trailing suffix tokens, longest first
+    return (matcher or _DEFAULT_MATCHER).split_suffix(tokens)
 
 
-def extract_suffix(name_base: str) -> tuple[str, str]:
+def extract_suffix(
+    name_base: str,
+    matcher: Optional[LegalNameMatcher] = None,
+) -> tuple[str, str]:
     """Extract legal suffix from normalized base name.
 
     Args:
         name_base: Normalized base name
+        matcher: Suffix/blacklist matcher (defaults to the built-in tables)
 
     Returns:
         Tuple of (suffix_class, core_name)
 
     """
     tokens = name_base.split()
-    return extract_suffix_from_tokens(tokens)
+    return extract_suffix_from_tokens(tokens, matcher)
 
 
 def excel_serial_to_datetime(val: Any) -> Optional[pd.Timestamp]:
@@ -465,12 +623,26 @@ def excel_serial_to_datetime(val: Any) -> Optional[pd.Timestamp]:
 def normalize_dataframe(
     df: pd.DataFrame,
     name_column: str = "Account Name",
+    normalization_settings: Optional[dict[str, Any]] = None,
+    parallel_executor: Optional[ExecutorLike] = None,
+    with_tokens: bool = False,
 ) -> pd.DataFrame:
     """Normalize name column in a DataFrame.
 
+    Names are factorized and only the distinct values are normalized, with
+    vectorized ``.str`` pipelines; results are broadcast back to rows. Output
+    matches calling ``normalize_name`` on every row.
+
+    With a multi-worker executor the distinct names are normalized in chunks
+    across workers, and each chunk comes back as an Arrow record batch.
+
     Args:
         df: Input DataFrame
         name_column: Column name containing company names
+        normalization_settings: ``similarity.normalization`` settings for
+            custom legal suffixes and parentheses blacklist terms
+        parallel_executor: Optional executor for chunked parallel normalization
+        with_tokens: Also add ``name_core_tokens`` (list of core tokens)
 
     Returns:
         DataFrame with normalized name columns added
@@ -480,27 +652,162 @@ def normalize_dataframe(
         logger.warning(f"Name column '{name_column}' not found in DataFrame")
         return df
 
-    # Apply normalization
-    normalized_list = []
-    for val in df[name_column]:
-        normalized_list.append(normalize_name(str(val) if pd.notna(val) else None))
-    normalized = pd.Series(normalized_list, index=df.index)
+    values = df[name_column]
+    present = values.notna().to_numpy()
+    codes = np.full(len(values), -1, dtype=np.int64)
+    codes[present], uniques = pd.factorize(
+        values[present].astype(str).to_numpy(dtype=object),
+        sort=False,
+    )
+
+    if (
+        isinstance(parallel_executor, ChunkedExecutorLike)
+        and parallel_executor.workers > 1
+        and len(uniques) > 1
+    ):
+        batches = parallel_executor.execute_chunked(
+            partial(
+                _normalize_names_batch,
+                normalization_settings=normalization_settings,
+                with_tokens=with_tokens,
+            ),
+            list(uniques),
+            operation_name="normalization",
+        )
+        table = record_batches_to_dataframe(
+            batches,
+            _normalized_columns(with_tokens),
+        )
+    else:
+        table = _normalize_unique_names(
+            pd.Series(uniques, dtype=object),
+            get_name_matcher(normalization_settings),
+            with_tokens,
+        )
+
+    # Missing names normalize like normalize_name(None); they take the last row
+    missing = normalize_name(None)
+    table.loc[len(table)] = [
+        getattr(missing, col) if col != "name_core_tokens" else []
+        for col in table.columns
+    ]
+    codes[~present] = len(table) - 1
+
+    logger.info(
+        f"Normalized names | rows={len(values)} | unique={len(uniques)} | "
+        f"missing={int((~present).sum())}",
+    )
 
     # Add normalized columns
     df = df.copy()
-    df["name_raw"] = [n.name_raw for n in normalized]
-    df["name_base"] = [n.name_base for n in normalized]
-    df["name_core"] = [n.name_core for n in normalized]
-    df["suffix_class"] = [n.suffix_class for n in normalized]
-    df["has_parentheses"] = [n.has_parentheses for n in normalized]
-    df["has_semicolon"] = [n.has_semicolon for n in normalized]
-    df["has_multiple_names"] = [n.has_multiple_names for n in normalized]
-    df["alias_candidates"] = [n.alias_candidates for n in normalized]
-    df["alias_sources"] = [n.alias_sources for n in normalized]
+    for col in table.columns:
+        df[col] = table[col].to_numpy()[codes]
 
     return df
 
 
+def _normalized_columns(with_tokens: bool) -> list[str]:
+    """Columns added by normalize_dataframe, in output order."""
+    columns = [field.name for field in fields(NameNorm)]
+    return [*columns, "name_core_tokens"] if with_tokens else columns
+
+
+def _normalize_names_batch(
+    names: list[str],
+    normalization_settings: Optional[dict[str, Any]] = None,
+    with_tokens: bool = False,
+) -> Any:
+    """Normalize a chunk of distinct names into an Arrow record batch.
+
+    Runs in executor workers; the matcher is compiled (and cached) per worker.
+    """
+    table = _normalize_unique_names(
+        pd.Series(names, dtype=object),
+        get_name_matcher(normalization_settings),
+        with_tokens,
+    )
+    return dataframe_to_record_batch(table)
+
+
+def _normalize_unique_names(
+    names: pd.Series,
+    matcher: LegalNameMatcher,
+    with_tokens: bool = False,
+) -> pd.DataFrame:
+    """Vectorized ``normalize_name`` over distinct, non-missing names.
+
+    Args:
+        names: Distinct raw names as an object Series with a RangeIndex
+        matcher: Suffix/blacklist matcher
+        with_tokens: Also compute ``name_core_tokens``
+
+    Returns:
+        DataFrame with one column per NameNorm field, aligned with ``names``
+
+    """
+    name_raw = names.str.strip()
+    lower_raw = name_raw.str.lower()
+
+    # Detect patterns before normalization
+    has_semicolon = name_raw.str.contains(";", regex=False)
+    has_parentheses = name_raw.str.contains("(", regex=False) & name_raw.str.contains(
+        ")",
+        regex=False,
+    )
+    and_count = lower_raw.str.count(" and ") + name_raw.str.count("&")
+    has_multiple_names = (
+        has_semicolon
+        | name_raw.str.contains(":", regex=False)
+        | name_raw.str.contains(_NUMBERED_PATTERN_RE, regex=True)
+        | (and_count > 1)
+    )
+
+    # Alias extraction only has work to do when a separator is present
+    alias_candidates = pd.Series([[] for _ in range(len(names))], dtype=object)
+    alias_sources = pd.Series([[] for _ in range(len(names))], dtype=object)
+    for pos in np.flatnonzero((has_semicolon | has_parentheses).to_numpy()):
+        alias_candidates[pos], alias_sources[pos] = _extract_alias_candidates(
+            name_raw[pos],
+            matcher,
+        )
+
+    # Remove numbered markers, then build name_base as in _create_name_base
+    name_base = (
+        name_raw.str.replace(_NUMBERED_MARKER_RE, "", regex=True)
+        .str.lower()
+        .str.translate(_SYMBOL_TABLE)
+        .str.replace(r"\s+", " ", regex=True)
+        .str.replace(r"[^a-z0-9\s]", "", regex=True)
+        .str.replace(_NUMERIC_STYLE_PATTERN, r"\1 \2", regex=True)
+        .str.strip()
+    )
+
+    # Suffix extraction on whitespace-joined tokens (longest trailing suffix)
+    tokens_joined = name_base.str.split().str.join(" ")
+    suffix_match = tokens_joined.str.extract(matcher.trailing_suffix_re)
+    matched = suffix_match["suffix"].notna()
+    suffix_class = suffix_match["suffix"].map(matcher.suffixes).fillna("NONE")
+    name_core = tokens_joined.where(~matched, suffix_match["core"].fillna(""))
+
+    table = pd.DataFrame(
+        {
+            "name_raw": name_raw,
+            "name_base": name_base,
+            "name_core": name_core,
+            "suffix_class": suffix_class,
+            "has_parentheses": has_parentheses.astype(bool),
+            "has_semicolon": has_semicolon.astype(bool),
+            "has_multiple_names": has_multiple_names.astype(bool),
+            "alias_candidates": alias_candidates,
+            "alias_sources": alias_sources,
+        },
+    )
+    if with_tokens:
+        # name_core is already single-space joined, so split() is its tokens
+        table["name_core_tokens"] = [core.split() for core in name_core]
+    return table
+
+
 def load_normalization_settings(
     config_path: str = "config/settings.yaml",
 ) -> dict[str, Any]:
@@ -9,11 +9,19 @@ from typing import Optional
 import pandas as pd
 
 from src.utils.duckdb_utils import ensure_pandas_strings
-from src.utils.parallel_protocols import ExecutorLike
-
-from .blocking import generate_candidate_pairs_soft_ban, get_stop_tokens
+from src.utils.parallel_protocols import ExecutorLike, RangeExecutorLike
+from src.utils.token_vocab import TokenVocabulary
+
+from .blocking import (
+    generate_candidate_pairs,
+    generate_candidate_pairs_soft_ban,
+    get_stop_tokens,
+)
 from .diagnostics import generate_brand_suggestions, write_blocking_diagnostics
+from .pairs import CandidatePairs
 from .scoring import compute_score_components, score_pairs_bulk, score_pairs_parallel
+from .shared_scoring import score_pairs_shared
+from .streaming import stream_pair_scores
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +33,7 @@ def pair_scores(
     parallel_executor: Optional[ExecutorLike] = None,
     interim_dir: Optional[str] = None,
     profile: bool = False,
+    token_vocab: Optional[TokenVocabulary] = None,
 ) -> pd.DataFrame:
     """Generate candidate pairs and compute similarity scores.
 
@@ -35,6 +44,7 @@ def pair_scores(
         parallel_executor: Optional parallel executor for parallel processing
         interim_dir: Directory for interim files
         profile: Enable performance profiling
+        token_vocab: Optional run-level token vocabulary for blocking keys
 
     Returns:
         DataFrame with candidate pairs and scores
@@ -61,16 +71,33 @@ def pair_scores(
         profiler = None
 
     try:
-        # Generate candidate pairs using soft-ban strategy
-        pairs = generate_candidate_pairs_soft_ban(
+        medium_threshold = settings.get("similarity", {}).get("medium", 84)
+        streaming_settings = settings.get("similarity", {}).get("streaming", {})
+        if streaming_settings.get("enabled", False):
+            if interim_dir:
+                return _pair_scores_streaming(
+                    df_norm,
+                    settings,
+                    enable_progress,
+                    interim_dir,
+                    medium_threshold,
+                    token_vocab,
+                )
+            logger.warning(
+                "Streaming scoring requires interim_dir; using in-memory scoring",
+            )
+
+        # Generate candidate pairs with the configured blocking strategy
+        pairs = generate_candidate_pairs(
             df_norm,
             enable_progress,
             parallel_executor,
             interim_dir,
             settings,
+            token_vocab,
         )
 
-        if not pairs:
+        if not len(pairs):
             logger.info("No candidate pairs generated")
             return pd.DataFrame()
 
@@ -79,8 +106,24 @@ def pair_scores(
         # Compute similarity scores
         scoring_settings = settings.get("similarity", {}).get("scoring", {})
         use_bulk_cdist = scoring_settings.get("use_bulk_cdist", True)
-
-        if use_bulk_cdist and len(pairs) > 1000:
+        use_shared_memory = scoring_settings.get("use_shared_memory", True)
+
+        if (
+            use_bulk_cdist
+            and use_shared_memory
+            and len(pairs) > 1000
+            and isinstance(parallel_executor, RangeExecutorLike)
+            and parallel_executor.workers > 1
+        ):
+            logger.info("Using shared-memory process scoring for large dataset")
+            scores = score_pairs_shared(
+                df_norm,
+                pairs,
+                settings,
+                parallel_executor,
+                enable_progress,
+            )
+        elif use_bulk_cdist and len(pairs) > 1000:
             logger.info("Using bulk scoring for large dataset")
             scores = score_pairs_bulk(df_norm, pairs, settings, enable_progress)
         else:
@@ -101,17 +144,8 @@ def pair_scores(
         pairs_df = pd.DataFrame.from_records(scores)
 
         # Filter on medium threshold (single canonical key)
-        medium_threshold = settings.get("similarity", {}).get("medium", 84)
         pairs_df = pairs_df[pairs_df["score"] >= medium_threshold].copy()
-
-        # Sort explicitly: id_a, id_b ascending, score descending
-        pairs_df = pairs_df.sort_values(
-            ["id_a", "id_b", "score"],
-            ascending=[True, True, False],
-        )
-
-        # Ensure string types for consistency
-        pairs_df = ensure_pandas_strings(pairs_df, ["id_a", "id_b"])
+        pairs_df = _finalize_pairs_df(pairs_df)
 
         # Save candidate pairs if interim directory provided
         if interim_dir:
@@ -140,6 +174,49 @@ def pair_scores(
             logger.info(f"Performance profile saved to {profile_path}")
 
 
+def _finalize_pairs_df(pairs_df: pd.DataFrame) -> pd.DataFrame:
+    """Apply the canonical sort and string types to scored pairs."""
+    # Sort explicitly: id_a, id_b ascending, score descending
+    pairs_df = pairs_df.sort_values(
+        ["id_a", "id_b", "score"],
+        ascending=[True, True, False],
+    )
+
+    # Ensure string types for consistency
+    return ensure_pandas_strings(pairs_df, ["id_a", "id_b"])
+
+
+def _pair_scores_streaming(
+    df_norm: pd.DataFrame,
+    settings: dict,
+    enable_progress: bool,
+    interim_dir: str,
+    medium_threshold: float,
+    token_vocab: Optional[TokenVocabulary] = None,
+) -> pd.DataFrame:
+    """Run streaming scoring and load the (already filtered) pairs back."""
+    logger.info("Using streaming block-by-block scoring")
+    candidate_pairs_path = f"{interim_dir}/candidate_pairs.parquet"
+    counts = stream_pair_scores(
+        df_norm,
+        settings,
+        candidate_pairs_path,
+        enable_progress,
+        interim_dir,
+        token_vocab,
+    )
+    if counts["rows_written"] == 0:
+        logger.info("No scores computed")
+        return pd.DataFrame()
+
+    pairs_df = _finalize_pairs_df(pd.read_parquet(candidate_pairs_path))
+    logger.info(f"Candidate pairs saved to {candidate_pairs_path}")
+    logger.info(
+        f"Final result: {len(pairs_df)} pairs above medium threshold ({medium_threshold})",
+    )
+    return pairs_df
+
+
 # get_stop_tokens is defined in blocking.py to maintain single source of truth
 
 
@@ -152,13 +229,17 @@ def save_candidate_pairs(pairs_df: pd.DataFrame, pairs_path: str) -> None:
 # Export all functions
 
 __all__ = [
+    "CandidatePairs",
     "compute_score_components",
     "generate_brand_suggestions",
+    "generate_candidate_pairs",
     "generate_candidate_pairs_soft_ban",
     "get_stop_tokens",
     "pair_scores",
     "save_candidate_pairs",
     "score_pairs_bulk",
     "score_pairs_parallel",
+    "score_pairs_shared",
+    "stream_pair_scores",
     "write_blocking_diagnostics",
 ]
@@ -1,14 +1,26 @@
 """Blocking and candidate pair generation for similarity matching."""
 
+import heapq
 import logging
-from itertools import combinations
-from typing import Any, Optional
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any, Optional, cast
 
+import numpy as np
 import pandas as pd
 
-from src.utils.parallel_protocols import ExecutorLike
+from src.utils.parallel_protocols import ChunkedExecutorLike, ExecutorLike
+from src.utils.token_vocab import TokenIdSets, TokenVocabulary
 
 from .diagnostics import write_blocking_diagnostics
+from .lsh import (
+    generate_candidate_pairs_minhash,
+    get_lsh_settings,
+    iter_lsh_blocks,
+    write_lsh_recall_diagnostics,
+)
+from .pairs import CandidatePairs
+from .tfidf import generate_candidate_pairs_tfidf, iter_tfidf_blocks
 
 logger = logging.getLogger(__name__)
 
@@ -20,13 +32,137 @@ def get_stop_tokens(settings: dict[str, Any]) -> set[str]:
     return stop_tokens
 
 
+BLOCKING_STRATEGIES = ("soft_ban", "minhash_lsh", "tfidf_topk")
+
+
+def get_blocking_strategy(settings: Optional[dict[str, Any]]) -> str:
+    """Get the configured blocking strategy (``similarity.blocking.strategy``).
+
+    Raises:
+        ValueError: If the strategy is not one of BLOCKING_STRATEGIES
+
+    """
+    strategy = (
+        (settings or {})
+        .get("similarity", {})
+        .get("blocking", {})
+        .get("strategy", "soft_ban")
+    )
+    if strategy not in BLOCKING_STRATEGIES:
+        raise ValueError(
+            f"Unknown blocking strategy '{strategy}', expected one of {BLOCKING_STRATEGIES}",
+        )
+    return str(strategy)
+
+
+def generate_candidate_pairs(
+    df_norm: pd.DataFrame,
+    enable_progress: bool = False,
+    parallel_executor: Optional[ExecutorLike] = None,
+    interim_dir: Optional[str] = None,
+    settings: Optional[dict[str, Any]] = None,
+    token_vocab: Optional[TokenVocabulary] = None,
+) -> CandidatePairs:
+    """Generate candidate pairs with the configured blocking strategy.
+
+    Args:
+        df_norm: DataFrame with normalized names
+        enable_progress: Enable progress logging
+        parallel_executor: Optional parallel executor
+        interim_dir: Directory for interim files
+        settings: Configuration settings
+        token_vocab: Optional run-level token vocabulary for soft-ban keys
+
+    Returns:
+        Deduplicated CandidatePairs of row positions into df_norm
+
+    """
+    strategy = get_blocking_strategy(settings)
+    if strategy == "minhash_lsh":
+        return generate_candidate_pairs_minhash(
+            df_norm,
+            enable_progress,
+            interim_dir,
+            settings,
+        )
+    if strategy == "tfidf_topk":
+        return generate_candidate_pairs_tfidf(
+            df_norm,
+            enable_progress,
+            interim_dir,
+            settings,
+        )
+    return generate_candidate_pairs_soft_ban(
+        df_norm,
+        enable_progress,
+        parallel_executor,
+        interim_dir,
+        settings,
+        token_vocab,
+    )
+
+
+def wants_strategy_diagnostics(settings: Optional[dict[str, Any]]) -> bool:
+    """Whether the configured strategy reports diagnostics over all its pairs.
+
+    Only MinHash LSH does, when ``recall_diagnostics`` is enabled.
+    """
+    return (
+        get_blocking_strategy(settings) == "minhash_lsh"
+        and get_lsh_settings(settings)["recall_diagnostics"]
+    )
+
+
+def write_strategy_diagnostics(
+    df_norm: pd.DataFrame,
+    pairs: CandidatePairs,
+    interim_dir: str,
+    settings: Optional[dict[str, Any]] = None,
+) -> None:
+    """Write the configured strategy's diagnostics over its full pair set.
+
+    ``generate_candidate_pairs`` writes these itself; callers that consume
+    ``iter_blocks`` collect the pairs when ``wants_strategy_diagnostics``.
+
+    Args:
+        df_norm: DataFrame with normalized names
+        pairs: Every candidate pair the strategy generated
+        interim_dir: Directory for interim files
+        settings: Configuration settings
+
+    """
+    if wants_strategy_diagnostics(settings):
+        write_lsh_recall_diagnostics(df_norm, pairs, settings or {}, interim_dir)
+
+
+def iter_blocks(
+    df_norm: pd.DataFrame,
+    enable_progress: bool = False,
+    settings: Optional[dict[str, Any]] = None,
+    token_vocab: Optional[TokenVocabulary] = None,
+) -> Iterator[tuple[dict[str, Any], CandidatePairs]]:
+    """Yield (block_stats row, CandidatePairs) for the configured strategy."""
+    strategy = get_blocking_strategy(settings)
+    if strategy == "minhash_lsh":
+        return iter_lsh_blocks(df_norm, enable_progress, settings)
+    if strategy == "tfidf_topk":
+        return iter_tfidf_blocks(df_norm, enable_progress, settings)
+    return iter_candidate_blocks(
+        df_norm,
+        enable_progress,
+        settings,
+        token_vocab=token_vocab,
+    )
+
+
 def generate_candidate_pairs_soft_ban(
     df_norm: pd.DataFrame,
     enable_progress: bool = False,
     parallel_executor: Optional[ExecutorLike] = None,
     interim_dir: Optional[str] = None,
     settings: Optional[dict[str, Any]] = None,
-) -> list[tuple[int, int]]:
+    token_vocab: Optional[TokenVocabulary] = None,
+) -> CandidatePairs:
     """Generate candidate pairs using soft-ban blocking strategy.
 
     Args:
@@ -35,16 +171,99 @@ def generate_candidate_pairs_soft_ban(
         parallel_executor: Optional parallel executor
         interim_dir: Directory for interim files
         settings: Configuration settings
+        token_vocab: Optional run-level token vocabulary for blocking keys
 
     Returns:
-        List of candidate pair tuples (index_a, index_b)
+        Deduplicated CandidatePairs of row positions into df_norm
 
     """
-    pairs: list[tuple[int, int]] = []
-
     if df_norm.empty or "name_core" not in df_norm.columns:
-        return pairs
+        return CandidatePairs.empty()
+
+    # Initialize diagnostics
+    block_stats = []
+    brand_suggestions: list[dict[str, Any]] = []
+    pair_parts: list[CandidatePairs] = []
+
+    for stats, block_pairs in iter_candidate_blocks(
+        df_norm,
+        enable_progress,
+        settings,
+        parallel_executor,
+        token_vocab,
+    ):
+        block_stats.append(stats)
+        pair_parts.append(block_pairs)
+
+    # Deduplicate pairs with a vectorized unique over packed int64 keys
+    pairs = CandidatePairs.concat(pair_parts).unique()
+
+    # Write diagnostics
+    if interim_dir:
+        write_blocking_diagnostics(block_stats, brand_suggestions, interim_dir)
+
+    # Log summary
+    strategies_used = set(stat["strategy"] for stat in block_stats)
+    logger.info(
+        f"Soft-ban blocking: Generated {len(pairs)} candidate pairs from {len(block_stats)} blocks "
+        f"({pairs.nbytes / 1e6:.1f} MB)",
+    )
+    logger.info(f"Strategies used: {', '.join(sorted(strategies_used))}")
+
+    return pairs
+
+
+@dataclass(frozen=True)
+class _ShardParams:
+    """Soft-ban sharding and prefilter settings shared by all block tasks."""
+
+    shard_strategy: str
+    fallback_shard: str
+    max_shard_size: int
+    char_bigram_gate: float
+    length_window: int
+    min_token_overlap: int
+    max_candidates_per_record: int
+    block_cap: int
+
+
+@dataclass(frozen=True)
+class _BlockTask:
+    """One block's pair-generation work, picklable for process workers.
 
+    Attributes:
+        seq: Position of the block in the deterministic output order
+        key: Block key (first token or allowlisted bigram)
+        strategy: block_stats strategy label deciding how pairs are built
+        positions: Row positions of the block members (ascending)
+        names: name_core of the members, only for sharded strategies
+        params: Sharding and prefilter settings
+
+    """
+
+    seq: int
+    key: str
+    strategy: str
+    positions: np.ndarray
+    names: Optional[np.ndarray]
+    params: _ShardParams
+
+    @property
+    def cost(self) -> int:
+        """Estimated work: pairwise comparisons within the block."""
+        return len(self.positions) ** 2
+
+
+def _plan_block_tasks(
+    df_norm: pd.DataFrame,
+    settings: Optional[dict[str, Any]],
+    token_vocab: Optional[TokenVocabulary] = None,
+) -> list[_BlockTask]:
+    """Assign every multi-record block its strategy, in output order.
+
+    Allowlisted bigram blocks come first, then first-token blocks in
+    first-appearance order.
+    """
     # Get blocking settings and normalize to lowercase
     blocking_settings = (
         settings.get("similarity", {}).get("blocking", {}) if settings else {}
@@ -59,77 +278,64 @@ def generate_candidate_pairs_soft_ban(
     stop_tokens = {t.lower() for t in get_stop_tokens(settings or {})}
 
     soft_ban_settings = blocking_settings.get("soft_ban", {})
-    shard_strategy = soft_ban_settings.get("shard_strategy", "second_token")
-    fallback_shard = soft_ban_settings.get("fallback_shard", "char_trigram")
-    max_shard_size = soft_ban_settings.get("max_shard_size", 200)
-    char_bigram_gate = soft_ban_settings.get("char_bigram_gate", 0.1)
-    length_window = soft_ban_settings.get("length_window", 10)
-    min_token_overlap = soft_ban_settings.get("min_token_overlap", 1)
-    max_candidates_per_record = soft_ban_settings.get("max_candidates_per_record", 50)
-    block_cap = soft_ban_settings.get("block_cap", 800)
-
-    # Create local Series for blocking keys (no mutation of input DataFrame)
-    def get_first_token(name: str) -> str:
-        tokens = name.split()
-        for token in tokens:
-            if token.lower() not in stop_tokens:
-                return token.lower()
-        return tokens[0].lower() if tokens else ""
-
-    def get_bigram_key(name: str) -> str:
-        tokens = name.split()
-        if len(tokens) >= 2:
-            bigram = f"{tokens[0].lower()} {tokens[1].lower()}"
-            if bigram in allowlist_bigrams:
-                return bigram
-        return ""
-
-    # Create local blocking keys
-    block_key_series = df_norm["name_core"].apply(get_first_token).fillna("")
-    bigram_key_series = df_norm["name_core"].apply(get_bigram_key).fillna("")
+    params = _ShardParams(
+        shard_strategy=soft_ban_settings.get("shard_strategy", "second_token"),
+        fallback_shard=soft_ban_settings.get("fallback_shard", "char_trigram"),
+        max_shard_size=soft_ban_settings.get("max_shard_size", 200),
+        char_bigram_gate=soft_ban_settings.get("char_bigram_gate", 0.1),
+        length_window=soft_ban_settings.get("length_window", 10),
+        min_token_overlap=soft_ban_settings.get("min_token_overlap", 1),
+        max_candidates_per_record=soft_ban_settings.get(
+            "max_candidates_per_record",
+            50,
+        ),
+        block_cap=soft_ban_settings.get("block_cap", 800),
+    )
+    block_cap = params.block_cap
 
-    # Ensure string dtype
-    block_key_series = block_key_series.astype("string")
-    bigram_key_series = bigram_key_series.astype("string")
+    block_key_series, bigram_key_series = _blocking_keys(
+        df_norm,
+        stop_tokens,
+        allowlist_bigrams,
+        token_vocab,
+    )
 
-    # Initialize diagnostics
-    block_stats = []
-    brand_suggestions: list[dict[str, Any]] = []
+    names = df_norm["name_core"].to_numpy(dtype=object)
+    tasks: list[_BlockTask] = []
+
+    def add_task(key: str, strategy: str, positions: np.ndarray) -> None:
+        sharded = strategy.endswith("sharded")
+        tasks.append(
+            _BlockTask(
+                seq=len(tasks),
+                key=key,
+                strategy=strategy,
+                positions=positions,
+                names=names[positions] if sharded else None,
+                params=params,
+            ),
+        )
 
     # Allowlisted bigram pass: force full pairing within those bigram groups
     if len(allowlist_bigrams) > 0:
-        bigram_hits = bigram_key_series[bigram_key_series != ""]
-        if not bigram_hits.empty:
-            for bg in bigram_hits.unique().tolist():
-                bg_mask = bigram_key_series == bg
-                bg_df = df_norm[bg_mask]
-                if len(bg_df) > 1:
-                    if len(bg_df) > block_cap:
-                        # Safety rail: shard huge bigram groups
-                        bg_pairs = _apply_standard_sharding(
-                            bg_df,
-                            bg,
-                            shard_strategy,
-                            block_cap,
-                            fallback_shard,
-                        )
-                        strategy = "allowlisted_bigram_sharded"
-                    else:
-                        bg_pairs = list(combinations(bg_df.index, 2))
-                        strategy = "allowlisted_bigram"
-                    pairs.extend(bg_pairs)
-                    block_stats.append(
-                        {
-                            "token": bg,
-                            "count": len(bg_df),
-                            "strategy": strategy,
-                            "pairs_generated": len(bg_pairs),
-                            "pairs_capped": 0,
-                        },
-                    )
-
-    # Group by block key
-    unique_blocks = block_key_series.unique()
+        bigram_keys, bigram_offsets, bigram_positions = _build_block_index(
+            bigram_key_series,
+        )
+        for b, bg in enumerate(bigram_keys):
+            if pd.isna(bg) or bg == "":
+                continue
+            bg_pos = bigram_positions[bigram_offsets[b] : bigram_offsets[b + 1]]
+            if len(bg_pos) > 1:
+                # Safety rail: shard huge bigram groups
+                if len(bg_pos) > block_cap:
+                    add_task(bg, "allowlisted_bigram_sharded", bg_pos)
+                else:
+                    add_task(bg, "allowlisted_bigram", bg_pos)
+
+    # Group by block key: one factorize pass builds key -> row positions
+    unique_blocks, block_offsets, block_positions = _build_block_index(
+        block_key_series,
+    )
     logger.info(f"Processing {len(unique_blocks)} unique block keys")
 
     for i, block_key in enumerate(unique_blocks):
@@ -137,110 +343,319 @@ def generate_candidate_pairs_soft_ban(
             continue
 
         # Get records for this block
-        block_mask = block_key_series == block_key
-        block_df = df_norm[block_mask].copy()
-        block_size = len(block_df)
+        block_pos = block_positions[block_offsets[i] : block_offsets[i + 1]]
+        block_size = len(block_pos)
 
         if block_size <= 1:
             continue
 
-        # Progress logging every 100 blocks
-        if enable_progress and i % 100 == 0:
-            logger.info(
-                f"Processed {i}/{len(unique_blocks)} blocks, generated {len(pairs)} pairs so far",
-            )
-
         # Determine strategy based on allowlist/denylist
         if block_key in allowlist_tokens:
-            # Allowlisted: generate all pairs (with safety rail for huge blocks)
+            # Allowlisted: generate all pairs (keep recall, shard huge blocks)
             if block_size > block_cap:
-                # Keep recall, just shard deterministically (no prefilter)
-                block_pairs = _apply_standard_sharding(
-                    block_df,
-                    block_key,
-                    shard_strategy,
-                    block_cap,
-                    fallback_shard,
-                )
-                pairs_generated = len(block_pairs)
-                pairs_capped = 0
-                strategy = "allowlisted_sharded"
+                add_task(block_key, "allowlisted_sharded", block_pos)
             else:
-                block_pairs = list(combinations(block_df.index, 2))
-                pairs_generated = len(block_pairs)
-                pairs_capped = 0
-                strategy = "allowlisted"
-
+                add_task(block_key, "allowlisted", block_pos)
         elif block_key in denylist_tokens and block_size > block_cap:
             # Denylisted and large: apply soft-ban sharding
-            strategy = "soft_ban_sharded"
+            add_task(block_key, "soft_ban_sharded", block_pos)
+        elif block_size > block_cap:
+            # Large but not denylisted: standard sharding
+            add_task(block_key, "standard_sharded", block_pos)
+        else:
+            # Small block: generate all pairs
+            add_task(block_key, "full_pairs", block_pos)
+
+    return tasks
+
+
+def _run_block_task(task: _BlockTask) -> tuple[dict[str, Any], CandidatePairs]:
+    """Generate one block's pairs and its block_stats row."""
+    params = task.params
+    block_size = len(task.positions)
+    pairs_capped = 0
+
+    if task.names is None:
+        block_pairs = CandidatePairs.all_pairs(task.positions)
+    else:
+        # Positional name frame: sharding helpers see row positions as the index
+        block_df = pd.DataFrame({"name_core": task.names}, index=task.positions)
+        if task.strategy == "soft_ban_sharded":
             block_pairs = _apply_soft_ban_sharding(
                 block_df,
-                block_key,
-                shard_strategy,
-                fallback_shard,
-                max_shard_size,
-                char_bigram_gate,
-                length_window,
-                min_token_overlap,
-                max_candidates_per_record,
+                task.key,
+                params.shard_strategy,
+                params.fallback_shard,
+                params.max_shard_size,
+                params.char_bigram_gate,
+                params.length_window,
+                params.min_token_overlap,
+                params.max_candidates_per_record,
             )
-            pairs_generated = len(block_pairs)
             pairs_capped = max(
                 0,
-                (block_size * (block_size - 1) // 2) - pairs_generated,
+                (block_size * (block_size - 1) // 2) - len(block_pairs),
             )
-
-        elif block_size > block_cap:
-            # Large but not denylisted: standard sharding
-            strategy = "standard_sharded"
+        else:
             block_pairs = _apply_standard_sharding(
                 block_df,
-                block_key,
-                shard_strategy,
-                block_cap,
-                fallback_shard,
+                task.key,
+                params.shard_strategy,
+                params.block_cap,
+                params.fallback_shard,
             )
-            pairs_generated = len(block_pairs)
-            pairs_capped = 0
 
-        else:
-            # Small block: generate all pairs
-            strategy = "full_pairs"
-            block_pairs = list(combinations(block_df.index, 2))
-            pairs_generated = len(block_pairs)
-            pairs_capped = 0
-
-        pairs.extend(block_pairs)
-
-        # Collect block statistics
-        block_stats.append(
-            {
-                "token": block_key,
-                "count": block_size,
-                "strategy": strategy,
-                "pairs_generated": pairs_generated,
-                "pairs_capped": pairs_capped,
-            },
-        )
+    return (
+        {
+            "token": task.key,
+            "count": block_size,
+            "strategy": task.strategy,
+            "pairs_generated": len(block_pairs),
+            "pairs_capped": pairs_capped,
+        },
+        block_pairs,
+    )
 
-    # Deduplicate pairs using a set-based approach
-    if pairs:
-        pairs_set = set(pairs)
-        pairs = list(pairs_set)
 
-    # Write diagnostics
-    if interim_dir:
-        write_blocking_diagnostics(block_stats, brand_suggestions, interim_dir)
+def _run_block_units(
+    units: list[list[_BlockTask]],
+) -> tuple[tuple[int, dict[str, Any], CandidatePairs], ...]:
+    """Run a chunk of work units in a worker.
 
-    # Log summary
-    strategies_used = set(stat["strategy"] for stat in block_stats)
+    Returns a tuple (not a list) so ``execute_chunked`` keeps one result per
+    chunk on both its sequential and parallel paths.
+    """
+    return tuple((task.seq, *_run_block_task(task)) for unit in units for task in unit)
+
+
+def _balance_units(tasks: list[_BlockTask], n_units: int) -> list[list[_BlockTask]]:
+    """Partition tasks into ``n_units`` units of roughly equal n² cost (LPT)."""
+    n_units = max(1, min(n_units, len(tasks)))
+    heap = [(0, unit) for unit in range(n_units)]
+    units: list[list[_BlockTask]] = [[] for _ in range(n_units)]
+    for task in sorted(tasks, key=lambda t: (-t.cost, t.seq)):
+        load, unit = heapq.heappop(heap)
+        units[unit].append(task)
+        heapq.heappush(heap, (load + task.cost, unit))
+    return [unit for unit in units if unit]
+
+
+def _run_block_tasks_parallel(
+    tasks: list[_BlockTask],
+    parallel_executor: ChunkedExecutorLike,
+) -> list[tuple[dict[str, Any], CandidatePairs]]:
+    """Generate pairs for all blocks across workers, merged in block order."""
+    # execute_chunked targets ~3 chunks per worker; one unit per chunk
+    units = _balance_units(tasks, parallel_executor.workers * 3)
+    total_cost = sum(task.cost for task in tasks)
     logger.info(
-        f"Soft-ban blocking: Generated {len(pairs)} candidate pairs from {len(block_stats)} blocks",
+        f"Parallel blocking | blocks={len(tasks)} | units={len(units)} | "
+        f"total_cost={total_cost} | max_unit_cost="
+        f"{max(sum(t.cost for t in unit) for unit in units)}",
     )
-    logger.info(f"Strategies used: {', '.join(sorted(strategies_used))}")
 
-    return pairs
+    chunk_results = parallel_executor.execute_chunked(
+        _run_block_units,
+        units,
+        chunk_size=1,
+        operation_name="blocking",
+        work_size=total_cost,
+    )
+
+    items = [item for chunk in chunk_results for item in chunk]
+    if len(items) != len(tasks):
+        raise RuntimeError(
+            f"blocking interrupted: {len(items)}/{len(tasks)} blocks generated",
+        )
+
+    # Deterministic merge: restore the sequential block order
+    merged = sorted(items, key=lambda item: item[0])
+    return [(stats, pairs) for _, stats, pairs in merged]
+
+
+def iter_candidate_blocks(
+    df_norm: pd.DataFrame,
+    enable_progress: bool = False,
+    settings: Optional[dict[str, Any]] = None,
+    parallel_executor: Optional[ExecutorLike] = None,
+    token_vocab: Optional[TokenVocabulary] = None,
+) -> Iterator[tuple[dict[str, Any], CandidatePairs]]:
+    """Yield soft-ban blocks one at a time with their candidate pairs.
+
+    Allowlisted bigram blocks come first, then first-token blocks in
+    first-appearance order. Each record belongs to at most one bigram block
+    and one token block, so pairs can only repeat between a bigram block and
+    a token block; callers that need a global dedup must account for that.
+
+    When an executor with ``execute_chunked`` and more than one worker is
+    given, blocks are generated up front across workers (cost-balanced by
+    n²) and then yielded in the same order.
+
+    Args:
+        df_norm: DataFrame with normalized names
+        enable_progress: Enable progress logging
+        settings: Configuration settings
+        parallel_executor: Optional executor for parallel block generation
+        token_vocab: Optional run-level token vocabulary for blocking keys
+
+    Yields:
+        Tuples of (block_stats row, CandidatePairs of row positions)
+
+    """
+    if df_norm.empty or "name_core" not in df_norm.columns:
+        return
+
+    tasks = _plan_block_tasks(df_norm, settings, token_vocab)
+
+    if (
+        isinstance(parallel_executor, ChunkedExecutorLike)
+        and parallel_executor.workers > 1
+        and len(tasks) > 1
+    ):
+        yield from _run_block_tasks_parallel(tasks, parallel_executor)
+        return
+
+    pairs_so_far = 0
+    for i, task in enumerate(tasks):
+        # Progress logging every 100 blocks
+        if enable_progress and i % 100 == 0:
+            logger.info(
+                f"Processed {i}/{len(tasks)} blocks, generated {pairs_so_far} pairs so far",
+            )
+        stats, block_pairs = _run_block_task(task)
+        pairs_so_far += len(block_pairs)
+        yield stats, block_pairs
+
+
+def _blocking_keys(
+    df_norm: pd.DataFrame,
+    stop_tokens: set[str],
+    allowlist_bigrams: set[str],
+    token_vocab: Optional[TokenVocabulary] = None,
+) -> tuple[pd.Series, pd.Series]:
+    """Compute first-token and allowlisted-bigram blocking keys per record.
+
+    The first-token key is the first token (lowercased) that is not a stop
+    token, falling back to the first token; the bigram key is the first two
+    tokens when they form an allowlisted bigram. Both are empty strings when
+    not applicable.
+
+    With the run vocabulary, ``name_core_tokens`` are encoded against it and
+    the stop-token checks and lowercasing run once per vocabulary entry;
+    otherwise each name is split on its own.
+
+    Args:
+        df_norm: DataFrame with name_core (and name_core_tokens, if present)
+        stop_tokens: Lowercased stop tokens
+        allowlist_bigrams: Lowercased allowlisted bigrams
+        token_vocab: Optional run-level token vocabulary
+
+    Returns:
+        Tuple of (first-token keys, bigram keys), aligned with ``df_norm``
+
+    """
+    if token_vocab is not None and "name_core_tokens" in df_norm.columns:
+        token_ids = token_vocab.encode(df_norm["name_core_tokens"])
+        # Tokens outside the vocabulary have no string to key on
+        if token_ids.id_bound <= token_vocab.size:
+            return _blocking_keys_from_ids(
+                df_norm.index,
+                token_vocab,
+                token_ids,
+                stop_tokens,
+                allowlist_bigrams,
+            )
+        logger.info("Tokens outside the run vocabulary; splitting names for keys")
+
+    def get_first_token(name: str) -> str:
+        tokens = name.split()
+        for token in tokens:
+            if token.lower() not in stop_tokens:
+                return token.lower()
+        return tokens[0].lower() if tokens else ""
+
+    def get_bigram_key(name: str) -> str:
+        tokens = name.split()
+        if len(tokens) >= 2:
+            bigram = f"{tokens[0].lower()} {tokens[1].lower()}"
+            if bigram in allowlist_bigrams:
+                return bigram
+        return ""
+
+    block_key_series = df_norm["name_core"].apply(get_first_token).fillna("")
+    bigram_key_series = df_norm["name_core"].apply(get_bigram_key).fillna("")
+    return block_key_series.astype("string"), bigram_key_series.astype("string")
+
+
+def _blocking_keys_from_ids(
+    index: pd.Index,
+    vocab: TokenVocabulary,
+    token_ids: TokenIdSets,
+    stop_tokens: set[str],
+    allowlist_bigrams: set[str],
+) -> tuple[pd.Series, pd.Series]:
+    """Blocking keys of records encoded against the run vocabulary."""
+    # Lowercased tokens, with a trailing "" that token ID -1 selects
+    lowered = np.empty(vocab.size + 1, dtype=object)
+    lowered[:-1] = pd.Series(vocab.tokens, dtype=object).str.lower().to_numpy()
+    lowered[-1] = ""
+    is_stop = np.isin(lowered[:-1], list(stop_tokens))
+
+    first_keys = lowered[token_ids.first(skip=is_stop)]
+    bigram_keys = np.full(len(token_ids), "", dtype=object)
+
+    if allowlist_bigrams:
+        two = np.flatnonzero(token_ids.sizes >= 2)
+        starts = token_ids.offsets[two]
+        first = lowered[token_ids.ids[starts]]
+        # Only records whose first token starts some allowlisted bigram
+        leads = {bigram.split(" ", 1)[0] for bigram in allowlist_bigrams}
+        lead_ok = np.isin(first, list(leads))
+        second = lowered[token_ids.ids[starts[lead_ok] + 1]]
+        candidates = [f"{a} {b}" for a, b in zip(first[lead_ok], second)]
+        keep = np.fromiter(
+            (bigram in allowlist_bigrams for bigram in candidates),
+            dtype=bool,
+            count=len(candidates),
+        )
+        rows = two[lead_ok][keep]
+        bigram_keys[rows] = np.asarray(candidates, dtype=object)[keep]
+
+    return (
+        pd.Series(first_keys, index=index, dtype="string"),
+        pd.Series(bigram_keys, index=index, dtype="string"),
+    )
+
+
+def _build_block_index(
+    keys: pd.Series,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Build an inverted index from block key to row positions in one pass.
+
+    Keys are integer-coded with ``pd.factorize`` (first-appearance order, the
+    same order as ``Series.unique``) and a stable argsort groups row positions
+    by code, so each block's positions stay in ascending row order.
+
+    Args:
+        keys: Blocking key per row (positionally aligned with the frame)
+
+    Returns:
+        Tuple of (unique_keys, offsets, positions) where the row positions of
+        ``unique_keys[i]`` are ``positions[offsets[i]:offsets[i + 1]]``
+
+    """
+    codes, uniques = pd.factorize(keys, sort=False)
+    positions = np.argsort(codes, kind="stable")
+
+    # Missing keys are coded -1 and sort first; drop them from the index
+    n_missing = int((codes < 0).sum())
+    positions = positions[n_missing:]
+
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    offsets = np.zeros(len(uniques) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+
+    return np.asarray(uniques, dtype=object), offsets, positions
 
 
 def _create_shards_with_fallback(
@@ -270,7 +685,7 @@ def _apply_soft_ban_sharding(
     length_window: int,
     min_token_overlap: int,
     max_candidates_per_record: int,
-) -> list[tuple[int, int]]:
+) -> CandidatePairs:
     """Apply soft-ban sharding with prefiltering."""
     shards = _create_shards_with_fallback(
         block_df,
@@ -294,7 +709,7 @@ def _apply_soft_ban_sharding(
         )
         pairs.extend(shard_pairs)
 
-    return pairs
+    return CandidatePairs.from_tuples(pairs)
 
 
 def _apply_standard_sharding(
@@ -303,7 +718,7 @@ def _apply_standard_sharding(
     shard_strategy: str,
     block_cap: int,
     fallback_shard: Optional[str] = None,
-) -> list[tuple[int, int]]:
+) -> CandidatePairs:
     """Apply standard sharding for large blocks."""
     shards = _create_shards_with_fallback(
         block_df,
@@ -312,13 +727,13 @@ def _apply_standard_sharding(
         block_cap,
     )
 
-    pairs = []
-    for shard_df in shards:
-        if len(shard_df) > 1:
-            shard_pairs = list(combinations(shard_df.index, 2))
-            pairs.extend(shard_pairs)
-
-    return pairs
+    return CandidatePairs.concat(
+        [
+            CandidatePairs.all_pairs(shard_df.index.to_numpy())
+            for shard_df in shards
+            if len(shard_df) > 1
+        ],
+    )
 
 
 def _create_shards(
@@ -366,6 +781,14 @@ def _create_shards(
     return shards
 
 
+# Elements per (rows x shard x bytes) block when comparing bitsets
+_PREFILTER_CHUNK_ELEMENTS = 4_000_000
+
+# np.bitwise_count needs NumPy 2; older NumPy uses a byte lookup table
+_HAS_BITWISE_COUNT = hasattr(np, "bitwise_count")
+_POPCOUNT_U8 = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
 def _apply_prefiltering(
     shard_df: pd.DataFrame,
     char_bigram_gate: float,
@@ -373,48 +796,114 @@ def _apply_prefiltering(
     min_token_overlap: int,
     max_candidates_per_record: int,
 ) -> list[tuple[int, int]]:
-    """Apply prefiltering to candidate pairs within a shard."""
+    """Apply prefiltering to candidate pairs within a shard.
+
+    Token sets and lowercase character-bigram sets are packed into bitsets
+    over shard-local vocabularies, so the length-window, token-overlap and
+    bigram-Jaccard gates run as NumPy operations over the upper triangle.
+    Each record keeps its first ``max_candidates_per_record`` passing
+    partners in row order, exactly like the pairwise loop.
+    """
     names = shard_df["name_core"].tolist()
-    indices = shard_df.index.tolist()
+    indices = shard_df.index.to_numpy()
+    n = len(names)
+    if n < 2:
+        return []
+
+    lengths = np.fromiter((len(name) for name in names), dtype=np.int64, count=n)
+    token_bits, _ = _pack_bitsets([set(name.split()) for name in names])
+    bigram_bits, bigram_sizes = _pack_bitsets(
+        [_char_bigrams(name.lower()) for name in names],
+    )
 
-    # Precompute token sets to reduce inner-loop work
-    token_sets = [set(n.split()) for n in names]
+    width = max(token_bits.shape[1], bigram_bits.shape[1], 1)
+    rows_per_chunk = max(1, _PREFILTER_CHUNK_ELEMENTS // (n * width))
+    columns = np.arange(n)
+
+    pair_rows = []
+    pair_cols = []
+    for start in range(0, n, rows_per_chunk):
+        rows = np.arange(start, min(n, start + rows_per_chunk))
+
+        ok = columns[None, :] > rows[:, None]
+
+        # Length window check
+        ok &= np.abs(lengths[rows, None] - lengths[None, :]) <= length_window
+
+        # Token overlap check
+        token_overlap = _popcount(token_bits[rows, None, :] & token_bits[None, :, :])
+        ok &= token_overlap >= min_token_overlap
+
+        # Character bigram overlap check (Jaccard, 0.0 when either is empty)
+        intersection = _popcount(bigram_bits[rows, None, :] & bigram_bits[None, :, :])
+        size_a = bigram_sizes[rows, None]
+        size_b = bigram_sizes[None, :]
+        union = size_a + size_b - intersection
+        overlap = np.zeros(ok.shape, dtype=np.float64)
+        np.divide(
+            intersection,
+            union,
+            out=overlap,
+            where=(size_a > 0) & (size_b > 0) & (union > 0),
+        )
+        ok &= overlap >= char_bigram_gate
 
-    pairs = []
-    for i in range(len(indices)):
-        candidates_for_i = 0
-        for j in range(i + 1, len(indices)):
-            if candidates_for_i >= max_candidates_per_record:
-                break
+        # Per-record cap: keep the first N passing partners in row order
+        ok &= np.cumsum(ok, axis=1) <= max_candidates_per_record
 
-            name_a, name_b = names[i], names[j]
+        r, c = np.nonzero(ok)
+        pair_rows.append(rows[r])
+        pair_cols.append(c)
 
-            # Length window check
-            if abs(len(name_a) - len(name_b)) > length_window:
-                continue
+    left = indices[np.concatenate(pair_rows)]
+    right = indices[np.concatenate(pair_cols)]
+    return list(zip(left.tolist(), right.tolist()))
 
-            # Token overlap check (using precomputed sets)
-            if len(token_sets[i] & token_sets[j]) < min_token_overlap:
-                continue
 
-            # Character bigram overlap check
-            if _char_bigram_overlap(name_a, name_b) < char_bigram_gate:
-                continue
+def _pack_bitsets(sets: list[set[str]]) -> tuple[np.ndarray, np.ndarray]:
+    """Pack per-record string sets into bitsets over a local vocabulary.
 
-            pairs.append((indices[i], indices[j]))
-            candidates_for_i += 1
+    Args:
+        sets: One set of strings per record
 
-    return pairs
+    Returns:
+        Tuple of (uint64 bitsets of shape (n, ceil(vocab / 64)), set sizes)
 
+    """
+    vocab: dict[str, int] = {}
+    row_ids: list[int] = []
+    col_ids: list[int] = []
+    for row, items in enumerate(sets):
+        for item in items:
+            row_ids.append(row)
+            col_ids.append(vocab.setdefault(item, len(vocab)))
+
+    # Round the vocabulary up to whole 64-bit words
+    n_bits = max(64, -(-len(vocab) // 64) * 64)
+    dense = np.zeros((len(sets), n_bits), dtype=bool)
+    dense[row_ids, col_ids] = True
+    sizes = np.fromiter((len(items) for items in sets), dtype=np.int64, count=len(sets))
+    words = np.ascontiguousarray(np.packbits(dense, axis=1)).view(np.uint64)
+    return words, sizes
+
+
+def _popcount(bits: np.ndarray) -> np.ndarray:
+    """Count set bits along the last axis of a uint64 bitset array."""
+    if _HAS_BITWISE_COUNT:
+        return cast("np.ndarray", np.bitwise_count(bits).sum(axis=-1, dtype=np.int64))
+    as_bytes = bits.view(np.uint8)
+    return cast("np.ndarray", _POPCOUNT_U8[as_bytes].sum(axis=-1, dtype=np.int64))
 
-def _char_bigram_overlap(name_a: str, name_b: str) -> float:
-    """Calculate character bigram overlap between two names."""
 
-    def get_bigrams(text: str) -> set:
-        return set(text[i : i + 2] for i in range(len(text) - 1))
+def _char_bigrams(text: str) -> set[str]:
+    """Character bigrams of a string."""
+    return set(text[i : i + 2] for i in range(len(text) - 1))
 
-    bigrams_a = get_bigrams(name_a.lower())
-    bigrams_b = get_bigrams(name_b.lower())
+
+def _char_bigram_overlap(name_a: str, name_b: str) -> float:
+    """Calculate character bigram overlap between two names."""
+    bigrams_a = _char_bigrams(name_a.lower())
+    bigrams_b = _char_bigrams(name_b.lower())
 
     if not bigrams_a or not bigrams_b:
         return 0.0
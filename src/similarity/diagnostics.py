@@ -8,6 +8,36 @@ import pandas as pd
 logger = logging.getLogger(__name__)
 
 
+# Strategies that re-yield a block's stats row as its batches accumulate;
+# the last row for each block is the final one
+CUMULATIVE_STATS_STRATEGIES = frozenset({"minhash_lsh"})
+
+
+def merge_block_stats(block_stats: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Keep one block_stats row per block.
+
+    Rows of strategies in CUMULATIVE_STATS_STRATEGIES are collapsed to the
+    last row per (strategy, token); every other row is its own block.
+
+    Args:
+        block_stats: Rows in the order the blocks were yielded
+
+    Returns:
+        Rows in first-seen order
+
+    """
+    merged: dict[Any, dict[str, Any]] = {}
+    for position, stats in enumerate(block_stats):
+        strategy = stats["strategy"]
+        key = (
+            (strategy, stats["token"])
+            if strategy in CUMULATIVE_STATS_STRATEGIES
+            else position
+        )
+        merged[key] = stats
+    return list(merged.values())
+
+
 def write_blocking_diagnostics(
     block_stats: list[dict[str, Any]],
     brand_suggestions: list[dict[str, Any]],
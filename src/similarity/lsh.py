@@ -0,0 +1,434 @@
+"""MinHash/LSH blocking strategy for candidate pair generation.
+
+Each ``name_core`` is reduced to a set of character or token shingles, the
+set is summarized by a MinHash signature, and the signature is cut into
+bands. Records whose band values collide land in the same LSH bucket and
+become candidates. Unlike first-token blocking this tolerates reordered
+names and needs no allow/deny lists; the band/row split controls the
+similarity threshold (roughly ``(1 / bands) ** (1 / rows)`` Jaccard).
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterator
+from typing import Any, cast
+
+import numpy as np
+import pandas as pd
+
+from .diagnostics import merge_block_stats, write_blocking_diagnostics
+from .pairs import CandidatePairs
+
+logger = logging.getLogger(__name__)
+
+# Signature value for records with no shingles; never collides (see _band_codes)
+_EMPTY_SIGNATURE = np.iinfo(np.uint64).max
+
+
+def get_lsh_settings(settings: dict[str, Any] | None) -> dict[str, Any]:
+    """Get MinHash/LSH settings with defaults."""
+    lsh_settings = (
+        (settings or {})
+        .get("similarity", {})
+        .get("blocking", {})
+        .get("minhash_lsh", {})
+    )
+    return {
+        "shingle": lsh_settings.get("shingle", "char"),
+        "shingle_size": lsh_settings.get("shingle_size", 3),
+        "num_perm": lsh_settings.get("num_perm", 64),
+        "bands": lsh_settings.get("bands", 16),
+        "seed": lsh_settings.get("seed", 42),
+        "bucket_cap": lsh_settings.get("bucket_cap", 800),
+        "batch_pairs": lsh_settings.get("batch_pairs", 1_000_000),
+        "recall_diagnostics": lsh_settings.get("recall_diagnostics", False),
+    }
+
+
+def _shingles(name: str, shingle: str, size: int) -> list[str]:
+    """Split a name into character k-grams or tokens."""
+    if shingle == "token":
+        return name.split()
+    text = " ".join(name.split())
+    if not text:
+        return []
+    if len(text) <= size:
+        return [text]
+    return [text[i : i + size] for i in range(len(text) - size + 1)]
+
+
+def minhash_signatures(
+    names: pd.Series | np.ndarray,
+    shingle: str = "char",
+    shingle_size: int = 3,
+    num_perm: int = 64,
+    seed: int = 42,
+) -> np.ndarray:
+    """Compute MinHash signatures for a column of names.
+
+    Shingles are hashed with ``pd.util.hash_array`` (stable across runs and
+    processes) and permuted with multiply-shift hashing in wrapping uint64
+    arithmetic, so the whole computation is vectorized over all shingles.
+
+    Args:
+        names: name_core values, in row-position order
+        shingle: ``"char"`` for character k-grams or ``"token"`` for tokens
+        shingle_size: k for character shingles
+        num_perm: Number of hash permutations (signature length)
+        seed: Seed for the permutation parameters
+
+    Returns:
+        uint64 array of shape (len(names), num_perm); rows of records with no
+        shingles are filled with a sentinel
+
+    """
+    values = np.asarray(names, dtype=object)
+    per_record = [
+        _shingles(n if isinstance(n, str) else "", shingle, shingle_size)
+        for n in values
+    ]
+    counts = np.fromiter(
+        (len(s) for s in per_record), dtype=np.int64, count=len(values)
+    )
+    signatures = np.full((len(values), num_perm), _EMPTY_SIGNATURE, dtype=np.uint64)
+    if counts.sum() == 0:
+        return signatures
+
+    flat = np.empty(int(counts.sum()), dtype=object)
+    flat[:] = [s for shingles in per_record for s in shingles]
+    shingle_hashes = pd.util.hash_array(flat)
+
+    rng = np.random.default_rng(seed)
+    multipliers = rng.integers(1, 2**63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+    offsets = rng.integers(0, 2**63, size=num_perm, dtype=np.uint64)
+
+    # Only records with shingles take part in the segmented min
+    has_shingles = counts > 0
+    starts = np.zeros(len(values), dtype=np.int64)
+    np.cumsum(counts[:-1], out=starts[1:])
+    starts = starts[has_shingles]
+
+    with np.errstate(over="ignore"):
+        for p in range(num_perm):
+            permuted = (shingle_hashes * multipliers[p] + offsets[p]) >> np.uint64(32)
+            signatures[has_shingles, p] = np.minimum.reduceat(permuted, starts)
+
+    return signatures
+
+
+def _shard_buckets(
+    inverse: np.ndarray,
+    counts: np.ndarray,
+    capped: np.ndarray,
+    bucket_cap: int,
+    band: int,
+) -> np.ndarray:
+    """Split buckets above ``bucket_cap`` into sub-buckets of at most the cap.
+
+    Each bucket is cut into ``ceil(size / bucket_cap)`` near-equal shards of
+    its members in position order: contiguous runs on even bands, strided
+    (every n-th member) on odd bands. Near-duplicate clusters hash to the
+    same bucket in every band, so alternating the split links all shards
+    once two bands have run.
+
+    Args:
+        inverse: Bucket index of every record in this band
+        counts: Size of each bucket
+        capped: Mask of records in buckets above ``bucket_cap``
+        bucket_cap: Maximum sub-bucket size
+        band: Band number, choosing the split
+
+    Returns:
+        Code of each capped record, numbered after the band's bucket indices
+
+    """
+    # Rank of each member within its bucket, in position order
+    buckets = inverse[capped]
+    order = np.argsort(buckets, kind="stable")
+    starts = np.flatnonzero(np.r_[True, np.diff(buckets[order]) != 0])
+    run_sizes = np.diff(np.append(starts, len(buckets)))
+    rank = np.empty(len(buckets), dtype=np.int64)
+    rank[order] = np.arange(len(buckets)) - np.repeat(starts, run_sizes)
+
+    bucket_shards = np.zeros(len(counts), dtype=np.int64)
+    bucket_shards[buckets] = -(-counts[buckets] // bucket_cap)
+    n_shards = bucket_shards[buckets]
+    if band % 2:
+        shard = rank % n_shards
+    else:
+        shard = rank // -(-counts[buckets] // n_shards)
+
+    # Shard codes follow the bucket indices, one block of codes per bucket
+    first_shard = np.cumsum(bucket_shards) - bucket_shards
+    return cast("np.ndarray", len(counts) + first_shard[buckets] + shard)
+
+
+def _band_codes(
+    signatures: np.ndarray,
+    bands: int,
+    bucket_cap: int,
+) -> tuple[np.ndarray, np.ndarray, list[dict[str, Any]]]:
+    """Assign each record a bucket code per band.
+
+    Buckets above ``bucket_cap`` are split into sub-buckets of at most the
+    cap (see ``_shard_buckets``). Records that cannot emit pairs in a band
+    (empty signature or a bucket or sub-bucket of one) get a unique negative
+    code, so equal codes mean "emitted together in this band".
+
+    Returns:
+        Tuple of (codes of shape (bands, n), bucket sizes of shape (bands, n),
+        per-band stats)
+
+    """
+    n, num_perm = signatures.shape
+    rows = num_perm // bands
+    codes = np.empty((bands, n), dtype=np.int64)
+    sizes = np.zeros((bands, n), dtype=np.int64)
+    unique_negative = -np.arange(1, n + 1, dtype=np.int64)
+    empty = signatures[:, 0] == _EMPTY_SIGNATURE
+    band_stats = []
+
+    for band in range(bands):
+        block = np.ascontiguousarray(signatures[:, band * rows : (band + 1) * rows])
+        keys = block.view(np.dtype((np.void, block.dtype.itemsize * rows))).ravel()
+        _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+        inverse = inverse.reshape(-1).astype(np.int64)
+        capped = (counts[inverse] > bucket_cap) & ~empty
+
+        code = inverse.copy()
+        if capped.any():
+            code[capped] = _shard_buckets(inverse, counts, capped, bucket_cap, band)
+        code_sizes = np.bincount(code)
+        size = code_sizes[code]
+        emits = (size > 1) & ~empty
+
+        codes[band] = np.where(emits, code, unique_negative)
+        sizes[band] = np.where(emits, size, 0)
+
+        # Pairs of over-cap buckets that fall between their sub-buckets
+        capped_sizes = (
+            counts[np.unique(inverse[capped])] if capped.any() else counts[:0]
+        )
+        shard_sizes = code_sizes[len(counts) :]
+        band_stats.append(
+            {
+                "token": f"band_{band}",
+                "count": int(emits.sum()),
+                "strategy": "minhash_lsh",
+                "pairs_generated": 0,
+                "pairs_capped": int(
+                    (capped_sizes * (capped_sizes - 1) // 2).sum()
+                    - (shard_sizes * (shard_sizes - 1) // 2).sum(),
+                ),
+            },
+        )
+
+    return codes, sizes, band_stats
+
+
+def iter_lsh_blocks(
+    df_norm: pd.DataFrame,
+    enable_progress: bool = False,
+    settings: dict[str, Any] | None = None,
+) -> Iterator[tuple[dict[str, Any], CandidatePairs]]:
+    """Yield LSH candidate pairs band by band in bounded batches.
+
+    A pair is emitted only in the first band where it collides, so batches
+    are disjoint and need no global dedup.
+
+    Args:
+        df_norm: DataFrame with normalized names
+        enable_progress: Enable progress logging
+        settings: Configuration settings
+
+    Yields:
+        Tuples of (per-band block_stats row, CandidatePairs of row positions)
+
+    """
+    if df_norm.empty or "name_core" not in df_norm.columns:
+        return
+
+    cfg = get_lsh_settings(settings)
+    bands = max(1, min(cfg["bands"], cfg["num_perm"]))
+    signatures = minhash_signatures(
+        df_norm["name_core"],
+        cfg["shingle"],
+        cfg["shingle_size"],
+        cfg["num_perm"],
+        cfg["seed"],
+    )
+    codes, sizes, band_stats = _band_codes(signatures, bands, cfg["bucket_cap"])
+    logger.info(
+        f"MinHash LSH | records={len(df_norm)} | num_perm={cfg['num_perm']} | "
+        f"bands={bands} | rows={cfg['num_perm'] // bands} | shingle={cfg['shingle']}",
+    )
+
+    for band in range(bands):
+        members = np.flatnonzero(sizes[band] > 0)
+        if len(members) == 0:
+            yield band_stats[band], CandidatePairs.empty()
+            continue
+
+        # Group bucket members; positions stay ascending within a bucket
+        order = np.argsort(codes[band, members], kind="stable")
+        members = members[order]
+        bucket_codes = codes[band, members]
+        boundaries = np.flatnonzero(np.diff(bucket_codes)) + 1
+        buckets = np.split(members, boundaries)
+
+        batch: list[CandidatePairs] = []
+        batch_size = 0
+        for bucket in buckets:
+            pairs = CandidatePairs.all_pairs(bucket)
+            if band > 0:
+                # Skip pairs already emitted by an earlier band
+                earlier = (codes[:band, pairs.left] == codes[:band, pairs.right]).any(
+                    axis=0
+                )
+                pairs = CandidatePairs(pairs.left[~earlier], pairs.right[~earlier])
+            batch.append(pairs)
+            batch_size += len(pairs)
+            if batch_size >= cfg["batch_pairs"]:
+                stats = band_stats[band]
+                stats["pairs_generated"] += batch_size
+                yield dict(stats), CandidatePairs.concat(batch)
+                batch, batch_size = [], 0
+
+        band_stats[band]["pairs_generated"] += batch_size
+        if enable_progress:
+            logger.info(
+                f"MinHash LSH | band={band + 1}/{bands} | "
+                f"pairs={band_stats[band]['pairs_generated']}",
+            )
+        yield dict(band_stats[band]), CandidatePairs.concat(batch)
+
+
+def generate_candidate_pairs_minhash(
+    df_norm: pd.DataFrame,
+    enable_progress: bool = False,
+    interim_dir: str | None = None,
+    settings: dict[str, Any] | None = None,
+) -> CandidatePairs:
+    """Generate candidate pairs from MinHash LSH band collisions.
+
+    Args:
+        df_norm: DataFrame with normalized names
+        enable_progress: Enable progress logging
+        interim_dir: Directory for interim files
+        settings: Configuration settings
+
+    Returns:
+        Deduplicated CandidatePairs of row positions into df_norm
+
+    """
+    if df_norm.empty or "name_core" not in df_norm.columns:
+        return CandidatePairs.empty()
+
+    batch_stats: list[dict[str, Any]] = []
+    parts: list[CandidatePairs] = []
+    for stats, pairs in iter_lsh_blocks(df_norm, enable_progress, settings):
+        batch_stats.append(stats)
+        parts.append(pairs)
+
+    pairs = CandidatePairs.concat(parts).unique()
+    band_stats = merge_block_stats(batch_stats)
+
+    if interim_dir:
+        write_blocking_diagnostics(band_stats, [], interim_dir)
+        if get_lsh_settings(settings)["recall_diagnostics"]:
+            write_lsh_recall_diagnostics(df_norm, pairs, settings or {}, interim_dir)
+
+    logger.info(
+        f"MinHash LSH blocking: Generated {len(pairs)} candidate pairs from "
+        f"{len(band_stats)} bands ({pairs.nbytes / 1e6:.1f} MB)",
+    )
+    return pairs
+
+
+def lsh_recall_diagnostics(
+    df_norm: pd.DataFrame,
+    lsh_pairs: CandidatePairs,
+    settings: dict[str, Any],
+) -> dict[str, Any]:
+    """Measure LSH recall against soft-ban blocking.
+
+    Recall is reported both over all soft-ban candidates and over soft-ban
+    candidates that score at or above ``similarity.medium`` (the pairs that
+    actually reach grouping).
+
+    Args:
+        df_norm: DataFrame with normalized names
+        lsh_pairs: Candidate pairs produced by MinHash LSH
+        settings: Configuration settings
+
+    Returns:
+        Dictionary of pair counts and recall ratios
+
+    """
+    from .blocking import generate_candidate_pairs_soft_ban
+    from .scoring import score_pairs_bulk
+
+    reference = generate_candidate_pairs_soft_ban(df_norm, settings=settings)
+
+    # Compare orientation-free (min, max) keys
+    def _keys(pairs: CandidatePairs) -> np.ndarray:
+        low = np.minimum(pairs.left, pairs.right)
+        high = np.maximum(pairs.left, pairs.right)
+        return np.unique(CandidatePairs(low, high).packed_keys())
+
+    lsh_keys = _keys(lsh_pairs)
+    reference_keys = _keys(reference)
+    overlap = np.isin(reference_keys, lsh_keys, assume_unique=True)
+
+    medium = settings.get("similarity", {}).get("medium", 84)
+    scored = pd.DataFrame(score_pairs_bulk(df_norm, reference, settings))
+    if scored.empty:
+        matched_keys = np.empty(0, dtype=np.int64)
+    else:
+        scored = scored[scored["score"] >= medium]
+        position = pd.Series(
+            np.arange(len(df_norm)),
+            index=df_norm["account_id"].to_numpy(),
+        )
+        ids_a = position.loc[scored["id_a"].to_numpy()].to_numpy()
+        ids_b = position.loc[scored["id_b"].to_numpy()].to_numpy()
+        matched_keys = _keys(CandidatePairs(ids_a, ids_b))
+    matched_overlap = np.isin(matched_keys, lsh_keys, assume_unique=True)
+
+    def _ratio(hit: np.ndarray) -> float:
+        return float(hit.mean()) if len(hit) else 1.0
+
+    return {
+        "lsh_pairs": int(len(lsh_keys)),
+        "reference_pairs": int(len(reference_keys)),
+        "shared_pairs": int(overlap.sum()),
+        "lsh_only_pairs": int(len(lsh_keys) - overlap.sum()),
+        "recall": _ratio(overlap),
+        "reference_matches": int(len(matched_keys)),
+        "matches_found": int(matched_overlap.sum()),
+        "match_recall": _ratio(matched_overlap),
+    }
+
+
+def write_lsh_recall_diagnostics(
+    df_norm: pd.DataFrame,
+    lsh_pairs: CandidatePairs,
+    settings: dict[str, Any],
+    interim_dir: str,
+) -> dict[str, Any]:
+    """Compute LSH recall diagnostics and write them to blocking_recall.csv."""
+    recall = lsh_recall_diagnostics(df_norm, lsh_pairs, settings)
+    try:
+        csv_path = f"{interim_dir}/blocking_recall.csv"
+        pd.DataFrame([recall]).to_csv(csv_path, index=False)
+        logger.info(f"Wrote blocking recall diagnostics to {csv_path}")
+    except Exception as e:
+        logger.warning(f"Failed to write blocking recall diagnostics: {e}")
+
+    logger.info(
+        f"MinHash LSH recall | recall={recall['recall']:.3f} | "
+        f"match_recall={recall['match_recall']:.3f} | "
+        f"lsh_pairs={recall['lsh_pairs']} | reference_pairs={recall['reference_pairs']}",
+    )
+    return recall
@@ -0,0 +1,166 @@
+"""Columnar candidate-pair representation for blocking and scoring.
+
+Candidate pairs are stored as two int32 arrays of row positions into the
+normalized accounts frame instead of a Python list of index-label tuples.
+Positions index straight into ``name_core``/``suffix_class`` arrays, so the
+scorers need no label -> position dicts, and dedup is a single ``np.unique``
+over a packed int64 key.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+# dtype used for row positions; int32 covers frames up to 2**31 - 1 rows
+POSITION_DTYPE = np.int32
+
+
+@dataclass(frozen=True)
+class CandidatePairs:
+    """Candidate pairs as parallel arrays of row positions.
+
+    Attributes:
+        left: Row position of the first record of each pair
+        right: Row position of the second record of each pair
+
+    """
+
+    left: np.ndarray
+    right: np.ndarray
+
+    def __post_init__(self) -> None:
+        """Coerce both sides to contiguous int32 arrays of equal length."""
+        left = np.ascontiguousarray(self.left, dtype=POSITION_DTYPE)
+        right = np.ascontiguousarray(self.right, dtype=POSITION_DTYPE)
+        if left.shape != right.shape or left.ndim != 1:
+            raise ValueError(
+                f"CandidatePairs arrays must be 1-D and equal length, got "
+                f"{left.shape} and {right.shape}",
+            )
+        object.__setattr__(self, "left", left)
+        object.__setattr__(self, "right", right)
+
+    @classmethod
+    def empty(cls) -> CandidatePairs:
+        """Create an empty pair set."""
+        return cls(
+            np.empty(0, dtype=POSITION_DTYPE),
+            np.empty(0, dtype=POSITION_DTYPE),
+        )
+
+    @classmethod
+    def all_pairs(cls, positions: np.ndarray) -> CandidatePairs:
+        """Create every pair within a block, in ``itertools.combinations`` order.
+
+        Args:
+            positions: Row positions of the block members
+
+        Returns:
+            CandidatePairs with n * (n - 1) / 2 pairs
+
+        """
+        i, j = np.triu_indices(len(positions), k=1)
+        return cls(positions[i], positions[j])
+
+    @classmethod
+    def from_tuples(cls, pairs: Iterable[tuple[int, int]]) -> CandidatePairs:
+        """Create pairs from (position_a, position_b) tuples."""
+        arr = np.fromiter(
+            (p for pair in pairs for p in pair),
+            dtype=POSITION_DTYPE,
+        )
+        return cls(arr[0::2], arr[1::2])
+
+    @classmethod
+    def from_labels(
+        cls,
+        index: pd.Index,
+        pairs: Sequence[tuple[Any, Any]],
+    ) -> CandidatePairs:
+        """Create pairs from (label_a, label_b) tuples of DataFrame index labels.
+
+        Args:
+            index: Index of the frame the labels refer to
+            pairs: Pairs of index labels
+
+        Returns:
+            CandidatePairs holding the matching row positions
+
+        Raises:
+            KeyError: If a label is not present in the index
+
+        """
+        if not pairs:
+            return cls.empty()
+        labels_a, labels_b = zip(*pairs)
+        left = index.get_indexer(pd.Index(labels_a))
+        right = index.get_indexer(pd.Index(labels_b))
+        if (left < 0).any() or (right < 0).any():
+            raise KeyError("Candidate pair references labels missing from the index")
+        return cls(left, right)
+
+    @classmethod
+    def concat(cls, parts: Sequence[CandidatePairs]) -> CandidatePairs:
+        """Concatenate pair sets, preserving order."""
+        parts = [p for p in parts if len(p)]
+        if not parts:
+            return cls.empty()
+        if len(parts) == 1:
+            return parts[0]
+        return cls(
+            np.concatenate([p.left for p in parts]),
+            np.concatenate([p.right for p in parts]),
+        )
+
+    def unique(self) -> CandidatePairs:
+        """Drop duplicate (left, right) pairs via a packed int64 key.
+
+        Pair orientation is preserved, matching ``set(list_of_tuples)``
+        semantics. The result is sorted by (left, right).
+        """
+        if len(self) == 0:
+            return self
+        key = np.unique(self.packed_keys())
+        return CandidatePairs(key >> 32, key & 0xFFFFFFFF)
+
+    def packed_keys(self) -> np.ndarray:
+        """Encode each (left, right) pair as one int64 key."""
+        return (self.left.astype(np.int64) << 32) | self.right.astype(np.int64)
+
+    def drop_keys(self, sorted_keys: np.ndarray) -> CandidatePairs:
+        """Drop pairs whose packed key is in ``sorted_keys`` (ascending int64)."""
+        if len(self) == 0 or len(sorted_keys) == 0:
+            return self
+        keys = self.packed_keys()
+        idx = np.searchsorted(sorted_keys, keys)
+        idx[idx == len(sorted_keys)] = 0
+        keep = sorted_keys[idx] != keys
+        return CandidatePairs(self.left[keep], self.right[keep])
+
+    def to_labels(self, index: pd.Index) -> list[tuple[Any, Any]]:
+        """Map positions back to (label_a, label_b) tuples of ``index``."""
+        return list(zip(index[self.left].tolist(), index[self.right].tolist()))
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the position arrays."""
+        return int(self.left.nbytes + self.right.nbytes)
+
+    def __len__(self) -> int:
+        """Number of pairs."""
+        return int(self.left.shape[0])
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        """Iterate (position_a, position_b) tuples as Python ints."""
+        return zip(self.left.tolist(), self.right.tolist())
+
+    def __getitem__(self, item: slice) -> CandidatePairs:
+        """Slice the pair set (views, no copy)."""
+        if not isinstance(item, slice):
+            raise TypeError("CandidatePairs only supports slicing")
+        return CandidatePairs(self.left[item], self.right[item])
@@ -3,66 +3,156 @@
 from __future__ import annotations
 
 import logging
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
 from typing import Any, cast
 
+import numpy as np
 import pandas as pd
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
+from src.similarity.pairs import CandidatePairs
 from src.similarity.types import ScoreComponents
 
 # Replace concrete import with protocol contract
 from src.utils.parallel_protocols import ExecutorLike
+from src.utils.token_vocab import TokenIdSets, encode_token_lists, intersection_sizes
 
 logger = logging.getLogger(__name__)
 
 
-def compute_score_components(
-    name_core_a: str,
-    name_core_b: str,
-    suffix_class_a: str,
-    suffix_class_b: str,
-    penalties: dict[str, Any],
-    settings: dict[str, Any] | None = None,
-) -> ScoreComponents:
-    """Canonical scorer function - single source of truth for similarity scoring.
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_DIGITS_RE = re.compile(r"\d+")
+
+
+@dataclass(frozen=True)
+class ScoringFeatures:
+    """Per-record scoring features, aligned by row position.
+
+    Attributes:
+        enhanced: Enhanced name core used for RapidFuzz ratios
+        tokens: Jaccard token set (frozenset) per record
+        punct: Punctuation signature of the raw name core
+        nums: Tuple of digit runs in the raw name core
+        token_ids: Jaccard token sets as int32 token IDs per record
+
+    """
+
+    enhanced: np.ndarray
+    tokens: np.ndarray
+    punct: np.ndarray
+    nums: np.ndarray
+    token_ids: TokenIdSets
+
+
+def _punct_signature(name_core: str) -> str:
+    """Concatenate the punctuation characters of a name core."""
+    return "".join(_PUNCT_RE.findall(name_core or ""))
+
+
+def _numeric_signature(name_core: str) -> tuple[str, ...]:
+    """Digit runs of a name core, in order."""
+    return tuple(_DIGITS_RE.findall(name_core or ""))
+
+
+def _check_numeric_style_match(name_a: str, name_b: str) -> bool:
+    """Check if two names have matching numeric styles."""
+    return _numeric_signature(name_a) == _numeric_signature(name_b)
+
+
+def _record_features(
+    name_core: str,
+    settings: dict[str, Any] | None,
+    enhanced: bool,
+) -> tuple[str, frozenset[str], str, tuple[str, ...]]:
+    """Compute the scoring features of a single name core.
 
     Args:
-        name_core_a: Core name for first entity
-        name_core_b: Core name for second entity
-        suffix_class_a: Suffix class for first entity
-        suffix_class_b: Suffix class for second entity
-        penalties: Dictionary of penalty values
+        name_core: Core name of the record
         settings: Configuration settings for enhanced normalization
+        enhanced: Use enhanced normalization; otherwise plain tokens
 
     Returns:
-        Dictionary with score components and final score
+        Tuple of (enhanced core, Jaccard tokens, punctuation signature,
+        numeric signature)
 
     """
-    # Apply enhanced normalization if available
-    tokens_a: set[str]
-    tokens_b: set[str]
-
-    try:
+    if enhanced:
         from src.normalize import enhance_name_core, get_enhanced_tokens_for_jaccard
 
-        # Enhance name cores for better matching
-        enhanced_a, _ = enhance_name_core(name_core_a, settings)
-        enhanced_b, _ = enhance_name_core(name_core_b, settings)
-
-        # Use enhanced names for RapidFuzz ratios
-        ratio_name = fuzz.token_sort_ratio(enhanced_a, enhanced_b)
-        ratio_set = fuzz.token_set_ratio(enhanced_a, enhanced_b)
+        core, _ = enhance_name_core(name_core, settings)
+        tokens = frozenset(get_enhanced_tokens_for_jaccard(name_core, settings))
+    else:
+        core = name_core
+        tokens = frozenset(name_core.split())
+    return (
+        core,
+        tokens,
+        _punct_signature(name_core),
+        _numeric_signature(name_core),
+    )
 
-        # Use enhanced tokens excluding weak tokens for Jaccard
-        tokens_a = set(get_enhanced_tokens_for_jaccard(name_core_a, settings))
-        tokens_b = set(get_enhanced_tokens_for_jaccard(name_core_b, settings))
 
+def _name_feature_table(
+    names: Iterable[str],
+    settings: dict[str, Any] | None,
+) -> list[tuple[str, frozenset[str], str, tuple[str, ...]]]:
+    """Compute features for each distinct name, with the import fallback."""
+    try:
+        return [_record_features(n, settings, enhanced=True) for n in names]
     except ImportError:
         # Fallback to original behavior if enhanced normalization not available
-        ratio_name = fuzz.token_sort_ratio(name_core_a, name_core_b)
-        ratio_set = fuzz.token_set_ratio(name_core_a, name_core_b)
-        tokens_a = set(name_core_a.split())
-        tokens_b = set(name_core_b.split())
+        return [_record_features(n, settings, enhanced=False) for n in names]
+
+
+def precompute_scoring_features(
+    names: pd.Series | np.ndarray,
+    settings: dict[str, Any] | None = None,
+) -> ScoringFeatures:
+    """Compute scoring features once per record instead of once per pair side.
+
+    Features are computed once per distinct name and broadcast back to row
+    positions, so a record that appears in thousands of pairs is only
+    normalized once.
+
+    Args:
+        names: name_core values, in row-position order
+        settings: Configuration settings for enhanced normalization
+
+    Returns:
+        ScoringFeatures aligned with ``names``
+
+    """
+    values = np.asarray(names, dtype=object)
+    codes, uniques = pd.factorize(values, sort=False)
+    per_name = _name_feature_table(uniques, settings)
+
+    columns = []
+    for field in range(4):
+        unique_col = np.empty(len(per_name), dtype=object)
+        unique_col[:] = [feat[field] for feat in per_name]
+        columns.append(unique_col[codes])
+    enhanced, tokens, punct, nums = columns
+
+    token_ids = encode_token_lists(feat[1] for feat in per_name).take(codes)
+    return ScoringFeatures(enhanced, tokens, punct, nums, token_ids)
+
+
+def _score_from_features(
+    enhanced_a: str,
+    enhanced_b: str,
+    tokens_a: frozenset[str],
+    tokens_b: frozenset[str],
+    punct_mismatch: bool,
+    num_style_match: bool,
+    suffix_match: bool,
+    penalties: dict[str, Any],
+) -> ScoreComponents:
+    """Combine precomputed record features into score components."""
+    # Use enhanced names for RapidFuzz ratios
+    ratio_name = fuzz.token_sort_ratio(enhanced_a, enhanced_b)
+    ratio_set = fuzz.token_set_ratio(enhanced_a, enhanced_b)
 
     # Calculate Jaccard similarity
     if tokens_a and tokens_b:
@@ -72,17 +162,6 @@ def compute_score_components(
     else:
         jaccard = 0.0
 
-    # Simple punctuation mismatch: if punctuation differs materially, apply penalty
-    def _punct_pattern(s: str) -> str:
-        import re
-
-        return "".join(re.findall(r"[^\w\s]", s or ""))
-
-    punct_mismatch = _punct_pattern(name_core_a) != _punct_pattern(name_core_b)
-
-    num_style_match = _check_numeric_style_match(name_core_a, name_core_b)
-    suffix_match = suffix_class_a == suffix_class_b
-
     base = 0.45 * ratio_name + 0.35 * ratio_set + 20.0 * jaccard
     if not num_style_match:
         base -= cast("int", penalties.get("num_style_mismatch", 5))
@@ -104,9 +183,86 @@ def compute_score_components(
     )
 
 
+def _score_position(
+    features: ScoringFeatures,
+    suffix_class: np.ndarray,
+    pos_a: int,
+    pos_b: int,
+    penalties: dict[str, Any],
+) -> ScoreComponents:
+    """Score one pair of row positions from precomputed features."""
+    return _score_from_features(
+        features.enhanced[pos_a],
+        features.enhanced[pos_b],
+        features.tokens[pos_a],
+        features.tokens[pos_b],
+        features.punct[pos_a] != features.punct[pos_b],
+        features.nums[pos_a] == features.nums[pos_b],
+        suffix_class[pos_a] == suffix_class[pos_b],
+        penalties,
+    )
+
+
+def compute_score_components(
+    name_core_a: str,
+    name_core_b: str,
+    suffix_class_a: str,
+    suffix_class_b: str,
+    penalties: dict[str, Any],
+    settings: dict[str, Any] | None = None,
+) -> ScoreComponents:
+    """Canonical scorer function - single source of truth for similarity scoring.
+
+    Args:
+        name_core_a: Core name for first entity
+        name_core_b: Core name for second entity
+        suffix_class_a: Suffix class for first entity
+        suffix_class_b: Suffix class for second entity
+        penalties: Dictionary of penalty values
+        settings: Configuration settings for enhanced normalization
+
+    Returns:
+        Dictionary with score components and final score
+
+    """
+    # Apply enhanced normalization if available
+    try:
+        feat_a = _record_features(name_core_a, settings, enhanced=True)
+        feat_b = _record_features(name_core_b, settings, enhanced=True)
+    except ImportError:
+        # Fallback to original behavior if enhanced normalization not available
+        feat_a = _record_features(name_core_a, settings, enhanced=False)
+        feat_b = _record_features(name_core_b, settings, enhanced=False)
+
+    return _score_from_features(
+        feat_a[0],
+        feat_b[0],
+        feat_a[1],
+        feat_b[1],
+        feat_a[2] != feat_b[2],
+        feat_a[3] == feat_b[3],
+        suffix_class_a == suffix_class_b,
+        penalties,
+    )
+
+
+def _as_candidate_pairs(
+    df_norm: pd.DataFrame,
+    candidate_pairs: CandidatePairs | list[tuple[int, int]],
+) -> CandidatePairs:
+    """Normalize scorer input to positional CandidatePairs.
+
+    Lists of (label_a, label_b) tuples are resolved against ``df_norm.index``
+    for callers that still pass index labels.
+    """
+    if isinstance(candidate_pairs, CandidatePairs):
+        return candidate_pairs
+    return CandidatePairs.from_labels(df_norm.index, candidate_pairs)
+
+
 def score_pairs_parallel(
     df_norm: pd.DataFrame,
-    candidate_pairs: list[tuple[int, int]],
+    candidate_pairs: CandidatePairs | list[tuple[int, int]],
     settings: dict[str, Any],
     enable_progress: bool = False,
     parallel_executor: ExecutorLike | None = None,
@@ -115,7 +271,8 @@ def score_pairs_parallel(
 
     Args:
         df_norm: DataFrame with normalized names
-        candidate_pairs: List of candidate pair tuples
+        candidate_pairs: CandidatePairs of row positions, or a list of
+            (label_a, label_b) index-label tuples
         settings: Configuration settings
         enable_progress: Enable progress logging
         parallel_executor: Optional parallel executor
@@ -124,9 +281,11 @@ def score_pairs_parallel(
         List of score dictionaries
 
     """
-    if not candidate_pairs:
+    if not len(candidate_pairs):
         return []
 
+    pairs = _as_candidate_pairs(df_norm, candidate_pairs)
+
     # Get penalties from settings
     penalties = settings.get("similarity", {}).get("penalty", {})
 
@@ -135,76 +294,193 @@ def score_pairs_parallel(
         df_norm = df_norm.copy()
         df_norm["suffix_class"] = "NONE"
 
-    # Convert to arrays for efficient access
-    name_core_array = df_norm["name_core"].values
-    suffix_class_array = df_norm["suffix_class"].values
-    account_id_array = df_norm["account_id"].values
+    # Per-record features are computed once, then gathered by position
+    features = precompute_scoring_features(df_norm["name_core"], settings)
+    suffix_class_array = df_norm["suffix_class"].to_numpy()
+    account_id_array = df_norm["account_id"].to_numpy()
 
-    # Create index mapping
-    index_map = {old_idx: new_idx for new_idx, old_idx in enumerate(df_norm.index)}
+    def score_chunk(chunk: CandidatePairs) -> list[dict[str, Any]]:
+        return [
+            {
+                "id_a": account_id_array[pos_a],
+                "id_b": account_id_array[pos_b],
+                **_score_position(
+                    features,
+                    suffix_class_array,
+                    pos_a,
+                    pos_b,
+                    penalties,
+                ),
+            }
+            for pos_a, pos_b in chunk
+        ]
 
     # Process pairs in parallel
-    if parallel_executor and len(candidate_pairs) > 1000:
+    if parallel_executor and len(pairs) > 1000:
         # Use parallel processing for large datasets
-        chunk_size = max(100, len(candidate_pairs) // parallel_executor.workers)
-        chunks = [
-            candidate_pairs[i : i + chunk_size]
-            for i in range(0, len(candidate_pairs), chunk_size)
-        ]
+        chunk_size = max(100, len(pairs) // parallel_executor.workers)
+        chunks = [pairs[i : i + chunk_size] for i in range(0, len(pairs), chunk_size)]
 
-        def process_chunk(chunk: list[tuple[int, int]]) -> list[dict[str, Any]]:
-            return [
-                {
-                    "id_a": account_id_array[index_map[idx_a]],
-                    "id_b": account_id_array[index_map[idx_b]],
-                    **compute_score_components(
-                        name_core_array[index_map[idx_a]],
-                        name_core_array[index_map[idx_b]],
-                        suffix_class_array[index_map[idx_a]],
-                        suffix_class_array[index_map[idx_b]],
-                        penalties,
-                        settings,
-                    ),
-                }
-                for idx_a, idx_b in chunk
-            ]
-
-        results_iter = parallel_executor.map(process_chunk, chunks, chunksize=None)
+        results_iter = parallel_executor.map(score_chunk, chunks, chunksize=None)
         scores = [item for chunk_result in results_iter for item in chunk_result]
     else:
         # Sequential processing
-        scores = []
-        for idx_a, idx_b in candidate_pairs:
-            comp = compute_score_components(
-                name_core_array[index_map[idx_a]],
-                name_core_array[index_map[idx_b]],
-                suffix_class_array[index_map[idx_a]],
-                suffix_class_array[index_map[idx_b]],
-                penalties,
-                settings,
-            )
-            scores.append(
-                {
-                    "id_a": account_id_array[index_map[idx_a]],
-                    "id_b": account_id_array[index_map[idx_b]],
-                    **comp,
-                },
-            )
+        scores = score_chunk(pairs)
 
     return scores
 
 
+def gate_pairs(
+    names: np.ndarray,
+    left: np.ndarray,
+    right: np.ndarray,
+    gate_cutoff: float,
+    workers: int = -1,
+) -> np.ndarray:
+    """Return indices of pairs whose raw token_set_ratio passes the gate.
+
+    Args:
+        names: Raw name_core table
+        left: Index into ``names`` of the first record of each pair
+        right: Index into ``names`` of the second record of each pair
+        gate_cutoff: Minimum token_set_ratio to survive
+        workers: RapidFuzz worker threads
+
+    Returns:
+        Sorted indices of surviving pairs
+
+    """
+    gate_scores = process.cpdist(
+        names[left],
+        names[right],
+        scorer=fuzz.token_set_ratio,
+        dtype=np.float64,
+        workers=workers,
+    )
+    return np.flatnonzero(gate_scores >= gate_cutoff)
+
+
+def score_pair_columns(
+    left: np.ndarray,
+    right: np.ndarray,
+    enhanced: np.ndarray,
+    tokens: TokenIdSets,
+    punct_codes: np.ndarray,
+    num_codes: np.ndarray,
+    suffix_match: np.ndarray,
+    penalties: dict[str, Any],
+    workers: int = -1,
+) -> dict[str, list[Any]]:
+    """Score pairs column-wise from per-name feature tables.
+
+    RapidFuzz ratios come from ``process.cpdist``; Jaccard, penalties and the
+    final score are combined with NumPy over whole arrays, using the same
+    operation order as ``compute_score_components`` so results are identical.
+
+    Args:
+        left: Index into the feature tables of the first record of each pair
+        right: Index into the feature tables of the second record of each pair
+        enhanced: Enhanced name core table
+        tokens: Jaccard token sets as token IDs (unique per record)
+        punct_codes: Integer code of each punctuation signature
+        num_codes: Integer code of each numeric signature
+        suffix_match: Per-pair suffix class equality
+        penalties: Dictionary of penalty values
+        workers: RapidFuzz worker threads
+
+    Returns:
+        ScoreComponents fields as columns of Python scalars
+
+    """
+    ratio_name = process.cpdist(
+        enhanced[left],
+        enhanced[right],
+        scorer=fuzz.token_sort_ratio,
+        dtype=np.float64,
+        workers=workers,
+    )
+    ratio_set = process.cpdist(
+        enhanced[left],
+        enhanced[right],
+        scorer=fuzz.token_set_ratio,
+        dtype=np.float64,
+        workers=workers,
+    )
+
+    # Jaccard over token-ID sets: intersections are sorted integer merges
+    token_sizes = tokens.sizes
+    size_a = token_sizes[left]
+    size_b = token_sizes[right]
+    intersection = intersection_sizes(tokens, left, right)
+    union = size_a + size_b - intersection
+    has_tokens = (size_a > 0) & (size_b > 0) & (union > 0)
+    jaccard = np.zeros(len(left), dtype=np.float64)
+    np.divide(intersection, union, out=jaccard, where=has_tokens)
+
+    punct_mismatch = punct_codes[left] != punct_codes[right]
+    num_style_match = num_codes[left] == num_codes[right]
+
+    # Same operation order as the canonical scorer keeps floats bit-identical
+    base = 0.45 * ratio_name + 0.35 * ratio_set + 20.0 * jaccard
+    base = base - np.where(
+        num_style_match, 0, cast("int", penalties.get("num_style_mismatch", 5))
+    )
+    base = base - np.where(
+        suffix_match, 0, cast("int", penalties.get("suffix_mismatch", 25))
+    )
+    base = base - np.where(
+        punct_mismatch, cast("int", penalties.get("punctuation_mismatch", 0)), 0
+    )
+    score = np.clip(np.rint(base), 0, 100).astype(np.int64)
+
+    return {
+        "score": score.tolist(),
+        "ratio_name": ratio_name.astype(np.int64).tolist(),
+        "ratio_set": ratio_set.astype(np.int64).tolist(),
+        "jaccard": jaccard.tolist(),
+        "num_style_match": num_style_match.tolist(),
+        "suffix_match": np.asarray(suffix_match, dtype=bool).tolist(),
+        "punctuation_mismatch": punct_mismatch.tolist(),
+        "base_score": base.tolist(),
+    }
+
+
+def signature_codes(values: Iterable[Any]) -> np.ndarray:
+    """Factorize hashable per-record signatures into comparable int codes."""
+    lookup: dict[Any, int] = {}
+    return np.fromiter(
+        (lookup.setdefault(v, len(lookup)) for v in values),
+        dtype=np.int64,
+    )
+
+
+def rows_from_columns(
+    id_a: Iterable[Any],
+    id_b: Iterable[Any],
+    columns: dict[str, list[Any]],
+) -> list[dict[str, Any]]:
+    """Assemble per-pair score dictionaries from id and component columns."""
+    keys = ["id_a", "id_b", *columns]
+    return [dict(zip(keys, row)) for row in zip(id_a, id_b, *columns.values())]
+
+
 def score_pairs_bulk(
     df_norm: pd.DataFrame,
-    candidate_pairs: list[tuple[int, int]],
+    candidate_pairs: CandidatePairs | list[tuple[int, int]],
     settings: dict[str, Any],
     enable_progress: bool = False,
 ) -> list[dict[str, Any]]:
     """Compute similarity scores for candidate pairs using bulk processing.
 
+    RapidFuzz ratios are computed for all pairs at once with
+    ``process.cpdist``; Jaccard, penalties and the final score are combined
+    with NumPy over whole arrays. Results are identical to scoring each
+    pair with ``compute_score_components``.
+
     Args:
         df_norm: DataFrame with normalized names
-        candidate_pairs: List of candidate pair tuples
+        candidate_pairs: CandidatePairs of row positions, or a list of
+            (label_a, label_b) index-label tuples
         settings: Configuration settings
         enable_progress: Enable progress logging
 
@@ -212,80 +488,60 @@ def score_pairs_bulk(
         List of score dictionaries
 
     """
-    if not candidate_pairs:
+    if not len(candidate_pairs):
         return []
 
+    pairs = _as_candidate_pairs(df_norm, candidate_pairs)
+
     # Get penalties and settings
     penalties = settings.get("similarity", {}).get("penalty", {})
     scoring_settings = settings.get("similarity", {}).get("scoring", {})
-    _use_bulk_cdist = scoring_settings.get("use_bulk_cdist", True)
     gate_cutoff = scoring_settings.get("gate_cutoff", 72)
+    workers = scoring_settings.get("cdist_workers", -1)
 
     # Ensure suffix_class column exists with default values
     if "suffix_class" not in df_norm.columns:
         df_norm = df_norm.copy()
         df_norm["suffix_class"] = "NONE"
 
-    # Convert to arrays for efficient access
-    name_core_array = df_norm["name_core"].values
-    suffix_class_array = df_norm["suffix_class"].values
-    account_id_array = df_norm["account_id"].values
-
-    # Create index mapping
-    index_map = {old_idx: new_idx for new_idx, old_idx in enumerate(df_norm.index)}
+    name_core_array = df_norm["name_core"].to_numpy(dtype=object)
 
-    # Extract names and indices for bulk processing
-    a_indices = [index_map[idx_a] for idx_a, _ in candidate_pairs]
-    b_indices = [index_map[idx_b] for _, idx_b in candidate_pairs]
-    a_names = [name_core_array[idx] for idx in a_indices]
-    b_names = [name_core_array[idx] for idx in b_indices]
-
-    # Phase 1: Gate with token_set_ratio (pairwise, not full cdist)
-    gate_scores = [fuzz.token_set_ratio(a, b) for a, b in zip(a_names, b_names)]
-    gate_survivors = [i for i, s in enumerate(gate_scores) if s >= gate_cutoff]
+    # Phase 1: Gate with token_set_ratio over all pairs in one cpdist call
+    survivors = gate_pairs(
+        name_core_array, pairs.left, pairs.right, gate_cutoff, workers
+    )
     logger.info(
-        f"Bulk gate: {len(gate_survivors)}/{len(candidate_pairs)} pairs passed token_set_ratio >= {gate_cutoff}",
+        f"Bulk gate: {len(survivors)}/{len(pairs)} pairs passed token_set_ratio >= {gate_cutoff}",
     )
+    if len(survivors) == 0:
+        return []
 
     # Phase 2: Compute final scores for survivors
     logger.info("Phase 2: Computing final scores for survivors")
 
-    results = []
-    for i in gate_survivors:
-        arr_idx_a = a_indices[i]
-        arr_idx_b = b_indices[i]
-
-        # Use canonical scorer for consistent results
-        comp = compute_score_components(
-            a_names[i],
-            b_names[i],
-            suffix_class_array[arr_idx_a],
-            suffix_class_array[arr_idx_b],
-            penalties,
-            settings,
-        )
-
-        results.append(
-            {
-                "id_a": account_id_array[arr_idx_a],
-                "id_b": account_id_array[arr_idx_b],
-                **comp,
-            },
-        )
-
-    return results
-
-
-def _check_numeric_style_match(name_a: str, name_b: str) -> bool:
-    """Check if two names have matching numeric styles."""
-    import re
-
-    # Extract numeric patterns
-    nums_a = re.findall(r"\d+", name_a)
-    nums_b = re.findall(r"\d+", name_b)
-
-    # Check if numeric patterns match
-    if len(nums_a) != len(nums_b):
-        return False
+    left = pairs.left[survivors]
+    right = pairs.right[survivors]
+
+    # Per-record features are computed once, then gathered by position
+    features = precompute_scoring_features(name_core_array, settings)
+    suffix_codes = signature_codes(df_norm["suffix_class"].to_numpy())
+
+    columns = score_pair_columns(
+        left,
+        right,
+        features.enhanced,
+        features.token_ids,
+        signature_codes(features.punct),
+        signature_codes(features.nums),
+        suffix_codes[left] == suffix_codes[right],
+        penalties,
+        workers,
+    )
 
-    return nums_a == nums_b
+    # ids keep the column's scalar type, as in score_pairs_parallel
+    account_id_array = df_norm["account_id"].to_numpy()
+    return rows_from_columns(
+        list(account_id_array[left]),
+        list(account_id_array[right]),
+        columns,
+    )
@@ -0,0 +1,270 @@
+"""Process-pool similarity scoring over shared-memory feature tables.
+
+The parent computes per-name scoring features once, publishes them together
+with the candidate pair position arrays into shared memory, and dispatches
+only (start, end) bounds into the pair arrays. Workers attach to the tables
+by name, so nothing proportional to the dataset is pickled per task.
+Results are identical to ``score_pairs_bulk``.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.similarity.pairs import CandidatePairs
+from src.similarity.scoring import (
+    _as_candidate_pairs,
+    _name_feature_table,
+    gate_pairs,
+    rows_from_columns,
+    score_pair_columns,
+    signature_codes,
+)
+from src.utils.parallel_protocols import RangeExecutorLike
+from src.utils.shared_arrays import (
+    SharedArraySpec,
+    SharedArrayStore,
+    attach_shared_arrays,
+    release_shared_arrays,
+)
+from src.utils.token_vocab import TokenIdSets, encode_token_lists
+
+logger = logging.getLogger(__name__)
+
+
+def _encode_strings(values: Iterable[str]) -> tuple[np.ndarray, np.ndarray]:
+    """Pack strings into a UTF-8 byte buffer plus int64 offsets."""
+    encoded = [v.encode("utf-8") for v in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    buffer = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    return buffer, offsets
+
+
+def _decode_strings(
+    buffer: np.ndarray,
+    offsets: np.ndarray,
+    idx: np.ndarray,
+) -> np.ndarray:
+    """Decode the strings at ``idx`` into an object array."""
+    out = np.empty(len(idx), dtype=object)
+    out[:] = [
+        buffer[offsets[i] : offsets[i + 1]].tobytes().decode("utf-8")
+        for i in idx.tolist()
+    ]
+    return out
+
+
+def _encode_token_sets(
+    token_sets: Iterable[frozenset[str]],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Pack token sets as int32 token ids plus int64 offsets.
+
+    Ids are only compared for equality, so Jaccard over id sets equals
+    Jaccard over the original strings.
+    """
+    encoded = encode_token_lists(token_sets)
+    return encoded.ids, encoded.offsets
+
+
+def publish_scoring_tables(
+    store: SharedArrayStore,
+    df_norm: pd.DataFrame,
+    pairs: CandidatePairs,
+    settings: dict[str, Any],
+) -> None:
+    """Compute per-name features and publish them with the pair arrays.
+
+    Args:
+        store: Shared array store to publish into
+        df_norm: DataFrame with name_core and suffix_class columns
+        pairs: Candidate pairs of row positions
+        settings: Configuration settings for enhanced normalization
+
+    """
+    names = df_norm["name_core"].to_numpy(dtype=object)
+    name_codes, uniques = pd.factorize(names, sort=False)
+    table = _name_feature_table(uniques, settings)
+
+    raw_bytes, raw_offsets = _encode_strings(uniques)
+    enhanced_bytes, enhanced_offsets = _encode_strings(f[0] for f in table)
+    token_ids, token_offsets = _encode_token_sets(f[1] for f in table)
+
+    store.publish("left", pairs.left)
+    store.publish("right", pairs.right)
+    store.publish("name_code", name_codes.astype(np.int32))
+    store.publish("suffix_code", signature_codes(df_norm["suffix_class"].to_numpy()))
+    store.publish("raw_bytes", raw_bytes)
+    store.publish("raw_offsets", raw_offsets)
+    store.publish("enhanced_bytes", enhanced_bytes)
+    store.publish("enhanced_offsets", enhanced_offsets)
+    store.publish("token_ids", token_ids)
+    store.publish("token_offsets", token_offsets)
+    store.publish("punct_code", signature_codes(f[2] for f in table))
+    store.publish("num_code", signature_codes(f[3] for f in table))
+
+
+@dataclass(frozen=True)
+class SharedRangeScorer:
+    """Picklable worker that scores one (start, end) range of the pair arrays.
+
+    Attributes:
+        specs: Shared array specs published by ``publish_scoring_tables``
+        owner_pid: PID of the process owning the shared memory
+        penalties: Dictionary of penalty values
+        gate_cutoff: token_set_ratio gate cutoff
+
+    """
+
+    specs: dict[str, SharedArraySpec]
+    owner_pid: int
+    penalties: dict[str, Any]
+    gate_cutoff: float
+
+    def __call__(self, start: int, end: int) -> tuple[np.ndarray, dict[str, list[Any]]]:
+        """Gate and score pairs ``start:end``.
+
+        Args:
+            start: First pair index (inclusive)
+            end: Last pair index (exclusive)
+
+        Returns:
+            Tuple of (global indices of surviving pairs, component columns)
+
+        """
+        arrays, handles = attach_shared_arrays(self.specs, self.owner_pid)
+        try:
+            return self._score(arrays, start, end)
+        finally:
+            # Views must be dropped before the blocks can be closed
+            arrays.clear()
+            release_shared_arrays(handles)
+
+    def _score(
+        self,
+        arrays: dict[str, np.ndarray],
+        start: int,
+        end: int,
+    ) -> tuple[np.ndarray, dict[str, list[Any]]]:
+        left = np.array(arrays["left"][start:end])
+        right = np.array(arrays["right"][start:end])
+
+        # Remap to the distinct names touched by this range
+        name_code = arrays["name_code"]
+        used, inverse = np.unique(
+            np.concatenate([name_code[left], name_code[right]]),
+            return_inverse=True,
+        )
+        local_left = inverse[: len(left)]
+        local_right = inverse[len(left) :]
+
+        raw = _decode_strings(arrays["raw_bytes"], arrays["raw_offsets"], used)
+        survivors = gate_pairs(
+            raw, local_left, local_right, self.gate_cutoff, workers=1
+        )
+        if len(survivors) == 0:
+            return survivors + start, {}
+
+        suffix_code = arrays["suffix_code"]
+        columns = score_pair_columns(
+            local_left[survivors],
+            local_right[survivors],
+            _decode_strings(arrays["enhanced_bytes"], arrays["enhanced_offsets"], used),
+            TokenIdSets(arrays["token_ids"], arrays["token_offsets"]).take(used),
+            arrays["punct_code"][used],
+            arrays["num_code"][used],
+            suffix_code[left[survivors]] == suffix_code[right[survivors]],
+            self.penalties,
+            workers=1,
+        )
+        return survivors + start, columns
+
+
+def score_pairs_shared(
+    df_norm: pd.DataFrame,
+    candidate_pairs: CandidatePairs | list[tuple[int, int]],
+    settings: dict[str, Any],
+    parallel_executor: RangeExecutorLike,
+    enable_progress: bool = False,
+) -> list[dict[str, Any]]:
+    """Compute similarity scores with process workers over shared memory.
+
+    Args:
+        df_norm: DataFrame with normalized names
+        candidate_pairs: CandidatePairs of row positions, or a list of
+            (label_a, label_b) index-label tuples
+        settings: Configuration settings
+        parallel_executor: Executor that dispatches (start, end) ranges
+        enable_progress: Enable progress logging
+
+    Returns:
+        List of score dictionaries, identical to ``score_pairs_bulk``
+
+    """
+    if not len(candidate_pairs):
+        return []
+
+    pairs = _as_candidate_pairs(df_norm, candidate_pairs)
+
+    penalties = settings.get("similarity", {}).get("penalty", {})
+    scoring_settings = settings.get("similarity", {}).get("scoring", {})
+    gate_cutoff = scoring_settings.get("gate_cutoff", 72)
+    ranges_per_worker = scoring_settings.get("shared_ranges_per_worker", 4)
+
+    # Ensure suffix_class column exists with default values
+    if "suffix_class" not in df_norm.columns:
+        df_norm = df_norm.copy()
+        df_norm["suffix_class"] = "NONE"
+
+    with SharedArrayStore() as store:
+        publish_scoring_tables(store, df_norm, pairs, settings)
+        logger.info(
+            f"Shared scoring | pairs={len(pairs):,} | "
+            f"tables_mb={store.nbytes / (1024 * 1024):.1f} | "
+            f"workers={parallel_executor.workers}",
+        )
+        scorer = SharedRangeScorer(
+            dict(store.specs),
+            store.owner_pid,
+            dict(penalties),
+            gate_cutoff,
+        )
+        results = parallel_executor.execute_ranges(
+            scorer,
+            len(pairs),
+            operation_name="shared_scoring",
+            ranges_per_worker=ranges_per_worker,
+        )
+
+    n_ranges = len(parallel_executor.range_bounds(len(pairs), ranges_per_worker))
+    if len(results) != n_ranges:
+        raise RuntimeError(
+            f"shared scoring interrupted: {len(results)}/{n_ranges} ranges scored",
+        )
+
+    survivors = np.concatenate([r[0] for r in results]) if results else np.empty(0)
+    survivors = survivors.astype(np.int64)
+    logger.info(
+        f"Bulk gate: {len(survivors)}/{len(pairs)} pairs passed token_set_ratio >= {gate_cutoff}",
+    )
+    if len(survivors) == 0:
+        return []
+
+    columns: dict[str, list[Any]] = {}
+    for _, range_columns in results:
+        for key, values in range_columns.items():
+            columns.setdefault(key, []).extend(values)
+
+    # ids keep the column's scalar type, as in score_pairs_parallel
+    account_id_array = df_norm["account_id"].to_numpy()
+    return rows_from_columns(
+        list(account_id_array[pairs.left[survivors]]),
+        list(account_id_array[pairs.right[survivors]]),
+        columns,
+    )
@@ -0,0 +1,200 @@
+"""Streaming candidate generation and scoring.
+
+Blocks are generated, scored and filtered one at a time, and pairs at or
+above ``similarity.medium`` are appended to ``candidate_pairs.parquet`` in
+row-group batches. Peak memory is bounded by the largest block (plus the
+per-record feature tables) instead of the total candidate pair count.
+"""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.utils.io_utils import ParquetRowGroupWriter
+from src.utils.token_vocab import TokenVocabulary
+
+from .blocking import (
+    iter_blocks,
+    wants_strategy_diagnostics,
+    write_strategy_diagnostics,
+)
+from .diagnostics import merge_block_stats, write_blocking_diagnostics
+from .pairs import CandidatePairs
+from .scoring import (
+    ScoringFeatures,
+    gate_pairs,
+    precompute_scoring_features,
+    score_pair_columns,
+    signature_codes,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def stream_pair_scores(
+    df_norm: pd.DataFrame,
+    settings: dict[str, Any],
+    output_path: str | Path,
+    enable_progress: bool = False,
+    interim_dir: str | None = None,
+    token_vocab: TokenVocabulary | None = None,
+) -> dict[str, int]:
+    """Score candidate pairs block by block and append survivors to Parquet.
+
+    Produces the same pairs and scores as ``pair_scores`` with bulk scoring,
+    before its final sort.
+
+    Args:
+        df_norm: DataFrame with normalized names
+        settings: Configuration settings
+        output_path: Parquet file receiving pairs at or above ``medium``
+        enable_progress: Enable progress logging
+        interim_dir: Directory for blocking diagnostics
+        token_vocab: Optional run-level token vocabulary for blocking keys
+
+    Returns:
+        Counts of blocks, candidate pairs, gate survivors and rows written
+
+    """
+    similarity_settings = settings.get("similarity", {})
+    scoring_settings = similarity_settings.get("scoring", {})
+    streaming_settings = similarity_settings.get("streaming", {})
+    penalties = similarity_settings.get("penalty", {})
+    medium_threshold = similarity_settings.get("medium", 84)
+    gate_cutoff = (
+        scoring_settings.get("gate_cutoff", 72)
+        if scoring_settings.get("use_bulk_cdist", True)
+        else 0
+    )
+    workers = scoring_settings.get("cdist_workers", -1)
+    row_group_size = streaming_settings.get("row_group_size", 500_000)
+
+    # Ensure suffix_class column exists with default values
+    if "suffix_class" not in df_norm.columns:
+        df_norm = df_norm.copy()
+        df_norm["suffix_class"] = "NONE"
+
+    # Per-record tables are O(records); only pair arrays scale with blocks
+    name_core_array = df_norm["name_core"].to_numpy(dtype=object)
+    features = precompute_scoring_features(name_core_array, settings)
+    punct_codes = signature_codes(features.punct)
+    num_codes = signature_codes(features.nums)
+    suffix_codes = signature_codes(df_norm["suffix_class"].to_numpy())
+    account_id_array = df_norm["account_id"].to_numpy()
+
+    block_stats: list[dict[str, Any]] = []
+    # Strategy diagnostics (LSH recall) need every pair, so keep them only
+    # when those diagnostics will be written
+    keep_pairs = bool(interim_dir) and wants_strategy_diagnostics(settings)
+    streamed_pairs: list[CandidatePairs] = []
+    bigram_keys: list[np.ndarray] = []
+    seen_keys = np.empty(0, dtype=np.int64)
+    counts = {"blocks": 0, "candidate_pairs": 0, "gate_survivors": 0}
+
+    # Never leave a previous run's pairs behind if this run writes no rows
+    Path(output_path).unlink(missing_ok=True)
+
+    with ParquetRowGroupWriter(output_path, row_group_size) as writer:
+        for stats, block_pairs in iter_blocks(
+            df_norm,
+            enable_progress,
+            settings,
+            token_vocab,
+        ):
+            block_stats.append(stats)
+            block_pairs = block_pairs.unique()
+
+            # Only bigram and token blocks can overlap; bigram blocks come first
+            if stats["strategy"].startswith("allowlisted_bigram"):
+                bigram_keys.append(block_pairs.packed_keys())
+            else:
+                if bigram_keys:
+                    seen_keys = np.unique(np.concatenate([seen_keys, *bigram_keys]))
+                    bigram_keys = []
+                block_pairs = block_pairs.drop_keys(seen_keys)
+
+            counts["blocks"] += 1
+            counts["candidate_pairs"] += len(block_pairs)
+            if keep_pairs:
+                streamed_pairs.append(block_pairs)
+            batch = _score_block(
+                block_pairs,
+                name_core_array,
+                features,
+                punct_codes,
+                num_codes,
+                suffix_codes,
+                account_id_array,
+                penalties,
+                gate_cutoff,
+                workers,
+                counts,
+            )
+            if batch is not None:
+                writer.write(batch[batch["score"] >= medium_threshold])
+
+    counts["rows_written"] = writer.rows_written
+
+    if interim_dir:
+        write_blocking_diagnostics(merge_block_stats(block_stats), [], interim_dir)
+        if keep_pairs:
+            write_strategy_diagnostics(
+                df_norm,
+                CandidatePairs.concat(streamed_pairs).unique(),
+                interim_dir,
+                settings,
+            )
+
+    logger.info(
+        f"Streaming scoring | blocks={counts['blocks']} | "
+        f"candidate_pairs={counts['candidate_pairs']} | "
+        f"gate_survivors={counts['gate_survivors']} | "
+        f"rows_written={counts['rows_written']} | row_groups={writer.row_groups} | "
+        f"medium={medium_threshold} | path={output_path}",
+    )
+    return counts
+
+
+def _score_block(
+    pairs: CandidatePairs,
+    names: np.ndarray,
+    features: ScoringFeatures,
+    punct_codes: np.ndarray,
+    num_codes: np.ndarray,
+    suffix_codes: np.ndarray,
+    account_ids: np.ndarray,
+    penalties: dict[str, Any],
+    gate_cutoff: float,
+    workers: int,
+    counts: dict[str, int],
+) -> pd.DataFrame | None:
+    """Gate and score one block's pairs into a DataFrame batch."""
+    if not len(pairs):
+        return None
+
+    survivors = gate_pairs(names, pairs.left, pairs.right, gate_cutoff, workers)
+    counts["gate_survivors"] += len(survivors)
+    if len(survivors) == 0:
+        return None
+
+    left = pairs.left[survivors]
+    right = pairs.right[survivors]
+    columns = score_pair_columns(
+        left,
+        right,
+        features.enhanced,
+        features.token_ids,
+        punct_codes,
+        num_codes,
+        suffix_codes[left] == suffix_codes[right],
+        penalties,
+        workers,
+    )
+    return pd.DataFrame(
+        {"id_a": account_ids[left], "id_b": account_ids[right], **columns},
+    )
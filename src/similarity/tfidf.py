@@ -0,0 +1,443 @@
+"""Top-K nearest-neighbour candidate generation over a TF-IDF index.
+
+Each ``name_core`` is vectorized into L2-normalized character n-gram TF-IDF
+weights, and every record keeps its ``top_k`` most cosine-similar neighbours
+at or above ``min_cosine``. Candidate volume is bounded by ``N * top_k``
+regardless of how skewed the first-token distribution is, so there are no
+jumbo blocks to shard or cap.
+
+Similarities are computed chunk by chunk as a sparse product of the chunk's
+rows with the whole index. SciPy is used when installed; otherwise the same
+product is computed from an inverted index with NumPy.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .diagnostics import write_blocking_diagnostics
+from .pairs import CandidatePairs
+
+try:
+    import scipy.sparse as sp
+except ImportError:  # pragma: no cover - exercised when SciPy is absent
+    sp = None
+
+logger = logging.getLogger(__name__)
+
+# Accumulate a chunk densely when it has at most this many cells per product
+_DENSE_CELLS_PER_PRODUCT = 4
+
+
+def get_tfidf_settings(settings: dict[str, Any] | None) -> dict[str, Any]:
+    """Get TF-IDF top-K settings with defaults."""
+    tfidf_settings = (
+        (settings or {}).get("similarity", {}).get("blocking", {}).get("tfidf_topk", {})
+    )
+    return {
+        "ngram_size": tfidf_settings.get("ngram_size", 3),
+        "top_k": tfidf_settings.get("top_k", 20),
+        "min_cosine": tfidf_settings.get("min_cosine", 0.5),
+        "max_df": tfidf_settings.get("max_df", 5000),
+        "chunk_products": tfidf_settings.get("chunk_products", 5_000_000),
+    }
+
+
+@dataclass(frozen=True)
+class TfidfIndex:
+    """Row-normalized TF-IDF matrix in CSR and CSC (inverted index) form.
+
+    Attributes:
+        indptr: CSR row offsets, shape (n_records + 1,)
+        indices: CSR n-gram ids, sorted within each row
+        data: CSR weights (float64, rows have unit L2 norm)
+        doc_freq: Number of records containing each n-gram
+        term_indptr: CSC offsets, shape (n_terms + 1,)
+        term_docs: CSC record ids, ascending within each n-gram
+        term_data: CSC weights aligned with ``term_docs``
+
+    """
+
+    indptr: np.ndarray
+    indices: np.ndarray
+    data: np.ndarray
+    doc_freq: np.ndarray
+    term_indptr: np.ndarray
+    term_docs: np.ndarray
+    term_data: np.ndarray
+
+    @property
+    def n_records(self) -> int:
+        """Number of indexed records."""
+        return len(self.indptr) - 1
+
+    @property
+    def n_terms(self) -> int:
+        """Vocabulary size."""
+        return len(self.term_indptr) - 1
+
+
+def _char_ngrams(name: str, size: int) -> list[str]:
+    """Space-padded character n-grams of a whitespace-normalized name."""
+    text = " ".join(name.split())
+    if not text:
+        return []
+    padded = f" {text} "
+    if len(padded) <= size:
+        return [padded]
+    return [padded[i : i + size] for i in range(len(padded) - size + 1)]
+
+
+def build_tfidf_index(
+    names: pd.Series | np.ndarray,
+    ngram_size: int = 3,
+    max_df: int = 5000,
+) -> TfidfIndex:
+    """Vectorize names into an L2-normalized character n-gram TF-IDF index.
+
+    Weights are ``tf * (ln((1 + n) / (1 + df)) + 1)`` (smoothed IDF). N-grams
+    present in more than ``max_df`` records are dropped: they carry almost no
+    IDF weight but dominate the cost of the similarity product.
+
+    Args:
+        names: name_core values, in row-position order
+        ngram_size: Character n-gram length
+        max_df: Maximum number of records an n-gram may appear in
+
+    Returns:
+        TfidfIndex aligned with ``names``
+
+    """
+    values = np.asarray(names, dtype=object)
+    n = len(values)
+    per_record = [
+        _char_ngrams(v if isinstance(v, str) else "", ngram_size) for v in values
+    ]
+    counts = np.fromiter((len(g) for g in per_record), dtype=np.int64, count=n)
+
+    flat = np.empty(int(counts.sum()), dtype=object)
+    flat[:] = [g for grams in per_record for g in grams]
+    term_ids, _ = pd.factorize(flat, sort=False)
+    doc_ids = np.repeat(np.arange(n, dtype=np.int64), counts)
+
+    # Term frequency per (record, n-gram); keys sort by record, then n-gram
+    n_terms = int(term_ids.max()) + 1 if len(term_ids) else 0
+    keys, tf = np.unique(doc_ids * max(n_terms, 1) + term_ids, return_counts=True)
+    rows = keys // max(n_terms, 1)
+    cols = keys % max(n_terms, 1)
+
+    doc_freq = np.bincount(cols, minlength=n_terms)
+    keep = doc_freq[cols] <= max_df
+    rows, cols, tf = rows[keep], cols[keep], tf[keep]
+
+    idf = np.log((1.0 + n) / (1.0 + doc_freq)) + 1.0
+    weights = tf * idf[cols]
+    norms = np.sqrt(np.bincount(rows, weights=weights**2, minlength=n))
+    weights = weights / norms[rows]
+
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+
+    # Inverted index: stable sort by n-gram keeps record ids ascending
+    by_term = np.argsort(cols, kind="stable")
+    term_indptr = np.zeros(n_terms + 1, dtype=np.int64)
+    np.cumsum(np.bincount(cols, minlength=n_terms), out=term_indptr[1:])
+
+    return TfidfIndex(
+        indptr=indptr,
+        indices=cols,
+        data=weights,
+        doc_freq=doc_freq,
+        term_indptr=term_indptr,
+        term_docs=rows[by_term],
+        term_data=weights[by_term],
+    )
+
+
+def _chunk_bounds(index: TfidfIndex, chunk_products: int) -> list[tuple[int, int]]:
+    """Split records into row ranges of at most ``chunk_products`` products.
+
+    A row's cost is the total posting length of its n-grams, i.e. the number
+    of partial products its similarity row needs.
+    """
+    posting_sizes = np.diff(index.term_indptr)
+    entry_rows = np.repeat(np.arange(index.n_records), np.diff(index.indptr))
+    row_cost = np.bincount(
+        entry_rows,
+        weights=posting_sizes[index.indices],
+        minlength=index.n_records,
+    ).astype(np.int64)
+
+    bounds = []
+    start = 0
+    running = 0
+    for row, cost in enumerate(row_cost.tolist()):
+        if running and running + cost > chunk_products:
+            bounds.append((start, row))
+            start, running = row, 0
+        running += cost
+    if start < index.n_records:
+        bounds.append((start, index.n_records))
+    return bounds
+
+
+def _chunk_similarities(
+    index: TfidfIndex,
+    start: int,
+    end: int,
+    matrix: Any = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Cosine similarities of rows ``start:end`` against every record.
+
+    Args:
+        index: TF-IDF index
+        start: First row of the chunk
+        end: End (exclusive) row of the chunk
+        matrix: The index as a SciPy CSR matrix, or None for the NumPy path
+
+    Returns:
+        Tuple of (row, column, similarity) for nonzero entries, rows absolute
+
+    """
+    lo, hi = index.indptr[start], index.indptr[end]
+    terms = index.indices[lo:hi]
+    weights = index.data[lo:hi]
+    rows = np.repeat(
+        np.arange(start, end, dtype=np.int64),
+        np.diff(index.indptr[start : end + 1]),
+    )
+
+    if matrix is not None:
+        product = (matrix[start:end] @ matrix.T).tocoo()
+        return (
+            product.row.astype(np.int64) + start,
+            product.col.astype(np.int64),
+            product.data,
+        )
+
+    # Expand each (row, n-gram) entry over the n-gram's posting list
+    posting_starts = index.term_indptr[terms]
+    posting_sizes = index.term_indptr[terms + 1] - posting_starts
+    total = int(posting_sizes.sum())
+    if total == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, np.empty(0, dtype=np.float64)
+    entry = np.repeat(np.arange(len(terms)), posting_sizes)
+    offsets = np.arange(total) - np.repeat(
+        np.cumsum(posting_sizes) - posting_sizes,
+        posting_sizes,
+    )
+    postings = posting_starts[entry] + offsets
+
+    # Sum partial products per (row, column)
+    n = index.n_records
+    keys = (rows[entry] - start) * n + index.term_docs[postings]
+    products = weights[entry] * index.term_data[postings]
+    cells = (end - start) * n
+    if cells <= _DENSE_CELLS_PER_PRODUCT * total:
+        # Dense rows are cheaper than sorting when products nearly fill them
+        dense = np.bincount(keys, weights=products, minlength=cells)
+        nonzero = np.flatnonzero(dense)
+        return nonzero // n + start, nonzero % n, dense[nonzero]
+
+    # Stable order and a sequential sum add each cell's products in n-gram
+    # order, like the dense and SciPy paths, so a pair's similarity is the
+    # same bits whichever of its rows is queried
+    order = np.argsort(keys, kind="stable")
+    keys = keys[order]
+    new_cell = np.r_[True, keys[1:] != keys[:-1]]
+    sims = np.bincount(np.cumsum(new_cell) - 1, weights=products[order])
+    keys = keys[new_cell]
+    return keys // n + start, keys % n, sims
+
+
+def _top_k(
+    rows: np.ndarray,
+    cols: np.ndarray,
+    sims: np.ndarray,
+    top_k: int,
+    min_cosine: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+    """Keep each row's ``top_k`` neighbours at or above ``min_cosine``.
+
+    Ties are broken by the lower column so results are deterministic.
+
+    Returns:
+        Tuple of (row, column, similarity, number of qualifying neighbours
+        beyond top_k), sorted by row and then rank
+
+    """
+    # Float round-off can leave a self-similarity just under 1.0; drop by id
+    keep = (cols != rows) & (sims >= min_cosine)
+    rows, cols, sims = rows[keep], cols[keep], sims[keep]
+    order = np.lexsort((cols, -sims, rows))
+    rows, cols, sims = rows[order], cols[order], sims[order]
+
+    row_starts = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]][: len(rows)])
+    sizes = np.diff(np.append(row_starts, len(rows)))
+    rank = np.arange(len(rows)) - np.repeat(row_starts, sizes)
+    within = rank < top_k
+    return rows[within], cols[within], sims[within], int((~within).sum())
+
+
+def _owned_pairs(
+    rows: np.ndarray,
+    cols: np.ndarray,
+    sims: np.ndarray,
+    top_k: int,
+    kth_sim: np.ndarray,
+    kth_col: np.ndarray,
+) -> CandidatePairs:
+    """Orient a chunk's top-K neighbours, keeping each pair from one row only.
+
+    A pair found from both of its records belongs to the lower row. The
+    higher row keeps it only when it fell outside the lower row's top-K,
+    which is read from the lower row's k-th neighbour. Chunks run in row
+    order, so that row was ranked in this chunk or an earlier one.
+
+    Args:
+        rows: Query row of each neighbour, sorted by row and then rank
+        cols: Neighbour column
+        sims: Cosine similarity
+        top_k: Neighbours kept per row
+        kth_sim: Per-record similarity of its k-th neighbour (-inf while
+            it has fewer than ``top_k``), updated in place for ``rows``
+        kth_col: Per-record column of its k-th neighbour, updated in place
+
+    Returns:
+        CandidatePairs oriented (lower position, higher position)
+
+    """
+    if len(rows):
+        last = np.flatnonzero(np.r_[rows[1:] != rows[:-1], True])
+        sizes = np.diff(np.r_[-1, last])
+        full = last[sizes == top_k]
+        kth_sim[rows[full]] = sims[full]
+        kth_col[rows[full]] = cols[full]
+
+    # Ranks order by similarity, then lower column; rows - the higher end -
+    # is inside the lower row's top-K if it ranks at or above its k-th
+    in_lower_top = (sims > kth_sim[cols]) | (
+        (sims == kth_sim[cols]) & (rows <= kth_col[cols])
+    )
+    keep = (cols > rows) | ~in_lower_top
+    return CandidatePairs(
+        np.minimum(rows, cols)[keep],
+        np.maximum(rows, cols)[keep],
+    ).unique()
+
+
+def iter_tfidf_blocks(
+    df_norm: pd.DataFrame,
+    enable_progress: bool = False,
+    settings: dict[str, Any] | None = None,
+) -> Iterator[tuple[dict[str, Any], CandidatePairs]]:
+    """Yield top-K neighbour pairs chunk by chunk.
+
+    Pairs are oriented (lower position, higher position) and a pair found
+    from both of its records is emitted only once, so chunks are disjoint
+    and need no global dedup. Only the k-th neighbour of each record is
+    kept across chunks.
+
+    Args:
+        df_norm: DataFrame with normalized names
+        enable_progress: Enable progress logging
+        settings: Configuration settings
+
+    Yields:
+        Tuples of (per-chunk block_stats row, CandidatePairs of row positions)
+
+    """
+    if df_norm.empty or "name_core" not in df_norm.columns:
+        return
+
+    cfg = get_tfidf_settings(settings)
+    index = build_tfidf_index(df_norm["name_core"], cfg["ngram_size"], cfg["max_df"])
+    bounds = _chunk_bounds(index, cfg["chunk_products"])
+    matrix = (
+        sp.csr_matrix(
+            (index.data, index.indices, index.indptr),
+            shape=(index.n_records, index.n_terms),
+        )
+        if sp is not None
+        else None
+    )
+    logger.info(
+        f"TF-IDF top-K | records={index.n_records} | ngrams={index.n_terms} | "
+        f"top_k={cfg['top_k']} | min_cosine={cfg['min_cosine']} | "
+        f"chunks={len(bounds)} | backend={'scipy' if sp is not None else 'numpy'}",
+    )
+
+    kth_sim = np.full(index.n_records, -np.inf)
+    kth_col = np.zeros(index.n_records, dtype=np.int64)
+    for chunk, (start, end) in enumerate(bounds):
+        rows, cols, sims = _chunk_similarities(index, start, end, matrix)
+        rows, cols, sims, capped = _top_k(
+            rows,
+            cols,
+            sims,
+            cfg["top_k"],
+            cfg["min_cosine"],
+        )
+        pairs = _owned_pairs(rows, cols, sims, cfg["top_k"], kth_sim, kth_col)
+
+        if enable_progress:
+            logger.info(
+                f"TF-IDF top-K | chunk={chunk + 1}/{len(bounds)} | rows={start}-{end} | "
+                f"pairs={len(pairs)}",
+            )
+        yield (
+            {
+                "token": f"chunk_{chunk}",
+                "count": end - start,
+                "strategy": "tfidf_topk",
+                "pairs_generated": len(pairs),
+                "pairs_capped": capped,
+            },
+            pairs,
+        )
+
+
+def generate_candidate_pairs_tfidf(
+    df_norm: pd.DataFrame,
+    enable_progress: bool = False,
+    interim_dir: str | None = None,
+    settings: dict[str, Any] | None = None,
+) -> CandidatePairs:
+    """Generate candidate pairs from TF-IDF top-K cosine neighbours.
+
+    Args:
+        df_norm: DataFrame with normalized names
+        enable_progress: Enable progress logging
+        interim_dir: Directory for interim files
+        settings: Configuration settings
+
+    Returns:
+        Deduplicated CandidatePairs of row positions into df_norm
+
+    """
+    if df_norm.empty or "name_core" not in df_norm.columns:
+        return CandidatePairs.empty()
+
+    chunk_stats: list[dict[str, Any]] = []
+    parts: list[CandidatePairs] = []
+    for stats, pairs in iter_tfidf_blocks(df_norm, enable_progress, settings):
+        chunk_stats.append(stats)
+        parts.append(pairs)
+
+    pairs = CandidatePairs.concat(parts).unique()
+
+    if interim_dir:
+        write_blocking_diagnostics(chunk_stats, [], interim_dir)
+
+    logger.info(
+        f"TF-IDF top-K blocking: Generated {len(pairs)} candidate pairs from "
+        f"{len(chunk_stats)} chunks ({pairs.nbytes / 1e6:.1f} MB)",
+    )
+    return pairs
@@ -8,8 +8,9 @@ This module handles:
 
 import json
 import logging
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
+import numpy as np
 import pandas as pd
 
 try:
@@ -194,6 +195,13 @@ def _select_primary_records_vectorized(
 ) -> pd.DataFrame:
     """Fully vectorized primary selection for maximum performance.
 
+    Singletons are marked with a mask. Multi-record groups are ordered by one
+    ``np.lexsort`` over integer codes (group, relationship rank, then the
+    ``created_date``/``account_id`` tie-breakers as sorted factorize codes,
+    missing values last), which selects the same primary as
+    ``_select_primary_from_group``. The same pass records which key decided
+    each primary in ``survivorship_reason``.
+
     Args:
         df_groups: DataFrame with group assignments
         relationship_ranks: Dictionary mapping relationship names to ranks
@@ -201,17 +209,11 @@ def _select_primary_records_vectorized(
         enable_progress: Enable progress logging
 
     Returns:
-        DataFrame with primary records marked
+        DataFrame with primary records and survivorship reasons marked
 
     """
     logger.info("Using vectorized primary selection")
 
-    # Ensure pandas strings for consistent operations
-    from src.utils.duckdb_utils import ensure_pandas_strings
-
-    df_groups = ensure_pandas_strings(df_groups, ["group_id", "account_id"])
-    logger.info("Ensured pandas string types for consistent operations")
-
     df = df_groups.copy()
 
     # Vectorized relationship rank mapping
@@ -226,43 +228,64 @@ def _select_primary_records_vectorized(
     else:
         df["relationship_rank"] = 60
 
-    # Skip unassigned records
-    df = df[df["group_id"] != -1].copy()
+    # Integer group codes; unassigned records (-1) take no part
+    group_codes, group_uniques = pd.factorize(df["group_id"])
+    assigned = (group_codes >= 0) & (df["group_id"] != -1).to_numpy()
+    group_sizes = np.bincount(group_codes[assigned], minlength=len(group_uniques))
+    row_sizes = np.where(assigned, group_sizes[group_codes], 0)
+    singleton_rows = np.flatnonzero(row_sizes == 1)
+    multi_rows = np.flatnonzero(row_sizes > 1)
 
-    # Get tie-breakers
+    # Sort keys, most significant first (same tie-breakers as
+    # _select_primary_from_group)
     tie_breakers = settings.get("survivorship", {}).get(
         "tie_breakers",
         ["created_date", "account_id"],
     )
-
-    # Build sort columns
-    sort_columns = ["relationship_rank"]
+    key_names = ["relationship_rank"]
+    keys = [df["relationship_rank"].to_numpy()[multi_rows]]
     for tie_breaker in tie_breakers:
-        if tie_breaker in df.columns:
-            sort_columns.append(tie_breaker)
-
-    # Vectorized primary selection using groupby + transform
-    df_sorted = df.sort_values(sort_columns)
-
-    # Mark first record in each group as primary
-    df_sorted["is_primary"] = df_sorted.groupby("group_id").cumcount() == 0
-
-    # Restore original order
-    df_sorted = df_sorted.sort_index()
-
-    # Log statistics
-    total_groups = df_sorted["group_id"].nunique()
-    singletons = (df_sorted.groupby("group_id").size() == 1).sum()
-    multi_groups = total_groups - singletons
+        if tie_breaker in ("created_date", "account_id") and tie_breaker in df.columns:
+            codes, uniques = pd.factorize(df[tie_breaker].iloc[multi_rows], sort=True)
+            key_names.append(tie_breaker)
+            keys.append(np.where(codes < 0, len(uniques), codes))
+
+    # One stable lexsort for all multi-record groups; the first row of each
+    # group is its primary
+    multi_groups = group_codes[multi_rows]
+    order = np.lexsort([*reversed(keys), multi_groups])
+    sorted_groups = multi_groups[order]
+    group_starts = np.ones(len(sorted_groups), dtype=bool)
+    group_starts[1:] = sorted_groups[1:] != sorted_groups[:-1]
+    firsts = np.flatnonzero(group_starts)
+
+    # Reason: the first key on which the primary beats the runner-up
+    reasons = np.full(len(firsts), "input_order", dtype=object)
+    undecided = np.ones(len(firsts), dtype=bool)
+    for name, key in zip(key_names, keys):
+        sorted_key = key[order]
+        decided = undecided & (sorted_key[firsts] != sorted_key[firsts + 1])
+        reasons[decided] = name
+        undecided &= ~decided
+
+    is_primary = np.zeros(len(df), dtype=bool)
+    is_primary[singleton_rows] = True
+    is_primary[multi_rows[order[firsts]]] = True
+    survivorship_reason = np.full(len(df), "", dtype=object)
+    survivorship_reason[singleton_rows] = "singleton"
+    survivorship_reason[multi_rows[order[firsts]]] = reasons
+    df["is_primary"] = is_primary
+    df["survivorship_reason"] = pd.array(survivorship_reason.tolist(), dtype="string")
 
     logger.info(
-        f"Vectorized survivorship: {total_groups} groups, {singletons} singletons, {multi_groups} multi-groups",
+        f"Vectorized survivorship: {len(singleton_rows) + len(firsts)} groups, "
+        f"{len(singleton_rows)} singletons, {len(firsts)} multi-groups",
     )
 
     # Ensure output has consistent pandas string types
-    df_sorted = ensure_pandas_strings(df_sorted, ["group_id", "account_id"])
+    from src.utils.duckdb_utils import ensure_pandas_strings
 
-    return df_sorted
+    return ensure_pandas_strings(df, ["group_id", "account_id"])
 
 
 def _select_primary_records_original(
@@ -545,24 +568,15 @@ def _generate_merge_preview_by_group(
             def json_dumps(x: Any) -> str:
                 return json.dumps(x)
 
-        # Process groups in batches for better performance
-        batch_size = 1000
-        for i in range(0, len(conflicted_groups), batch_size):
-            batch = conflicted_groups[i : i + batch_size]
-
-            for group_id in batch:
-                group_mask = df["group_id"] == group_id
-                group_data = df[group_mask]
-
-                if len(group_data) > 1:
-                    merge_preview = _generate_group_merge_preview(
-                        group_data,
-                        available_fields,
-                    )
-                    preview_json = json_dumps(merge_preview)
-
-                    # Add to all records in the group
-                    result_df.loc[group_data.index, "merge_preview_json"] = preview_json
+        # One columnar pass over all conflicted groups, joined back by group_id
+        previews = _conflicted_group_previews(
+            df[df["group_id"].isin(conflicted_groups)],
+            available_fields,
+            json_dumps,
+        )
+        result_df["merge_preview_json"] = (
+            result_df["group_id"].map(previews).fillna("").astype(object)
+        )
 
     # Skip clean groups if requested
     if skip_clean_groups:
@@ -590,6 +604,131 @@ def _generate_merge_preview_by_group(
     return result_df
 
 
+def _safe_str_values(values: pd.Series) -> list[str]:
+    """Column-wise ``safe_str``: NA values become "", others ``str(value)``."""
+    objects = values.astype(object)
+    return objects.where(objects.notna(), "").astype(str).tolist()
+
+
+def _conflicted_group_previews(
+    df: pd.DataFrame,
+    fields: list[str],
+    json_dumps: Callable[[Any], str],
+) -> pd.Series:
+    """Encode the merge preview of every group in ``df`` in one sorted pass.
+
+    Rows are stably sorted by group, so each group is a contiguous slice in
+    input order. Record summaries and per-field distinct values (in order of
+    first appearance, via ``drop_duplicates`` + ``groupby().agg``) are built
+    column-wise; each group's preview is then assembled and JSON-encoded once.
+    The output matches ``_generate_group_merge_preview`` group by group.
+
+    Args:
+        df: Assigned records of the groups to preview
+        fields: List of fields to compare
+        json_dumps: JSON encoder for one preview
+
+    Returns:
+        Series of preview JSON strings indexed by group_id
+
+    """
+    codes, group_keys = pd.factorize(df["group_id"])
+    order = np.argsort(codes, kind="stable")
+    df = df.iloc[order]
+    codes = codes[order]
+    n_groups = len(group_keys)
+    offsets = np.zeros(n_groups + 1, dtype=np.int64)
+    np.cumsum(np.bincount(codes, minlength=n_groups), out=offsets[1:])
+
+    # First primary record of each group (-1 when the group has none)
+    is_primary = df["is_primary"].fillna(False).to_numpy(dtype=bool)
+    primary_rows = np.flatnonzero(is_primary)
+    primary_groups, first = np.unique(codes[primary_rows], return_index=True)
+    primary_of = np.full(n_groups, -1, dtype=np.int64)
+    primary_of[primary_groups] = primary_rows[first]
+
+    # Record summaries, column-wise
+    def column(name: str, default: Any) -> list[Any]:
+        if name in df.columns:
+            return df[name].tolist()
+        return [default] * len(df)
+
+    ranks = [int(rank) for rank in column("relationship_rank", 60)]
+    summaries = [
+        {
+            "index": int(str(label)),
+            "account_id": account_id,
+            "account_name": account_name,
+            "relationship": relationship,
+            "relationship_rank": rank,
+        }
+        for label, account_id, account_name, relationship, rank in zip(
+            df.index,
+            _safe_str_values(pd.Series(column("account_id", ""), dtype=object)),
+            _safe_str_values(pd.Series(column("account_name", ""), dtype=object)),
+            _safe_str_values(pd.Series(column("Relationship", ""), dtype=object)),
+            ranks,
+        )
+    ]
+    weakest_edges = column("weakest_edge_to_primary", 0.0)
+
+    # Distinct non-null values per group and field, in order of appearance
+    field_strings = {}
+    field_distinct = {}
+    for field in fields:
+        values = df[field]
+        field_strings[field] = _safe_str_values(values)
+        present = values.notna().to_numpy()
+        distinct = pd.DataFrame(
+            {"group": codes[present], "value": values[present].astype(object)},
+        ).drop_duplicates()
+        field_distinct[field] = (
+            distinct["value"]
+            .astype(str)
+            .groupby(distinct["group"].to_numpy(), sort=False)
+            .agg(list)
+            .to_dict()
+        )
+
+    encoded = []
+    for group in range(n_groups):
+        primary = int(primary_of[group])
+        if primary < 0:
+            encoded.append(json_dumps({"error": "No primary record found"}))
+            continue
+
+        field_comparisons = {}
+        for field in fields:
+            primary_value = field_strings[field][primary]
+            distinct_values = field_distinct[field].get(group, [])
+            has_conflict = len(distinct_values) > 1
+            field_comparisons[field] = {
+                "primary_value": primary_value,
+                "alternative_values": (
+                    [value for value in distinct_values if value != primary_value]
+                    if has_conflict
+                    else []
+                ),
+                "has_conflict": has_conflict,
+            }
+
+        start, end = offsets[group], offsets[group + 1]
+        non_primary_records = [
+            {**summaries[row], "weakest_edge_to_primary": weakest_edges[row]}
+            for row in range(start, end)
+            if not is_primary[row]
+        ]
+        preview = {
+            "primary_record": summaries[primary],
+            "group_size": int(end - start),
+            "field_comparisons": field_comparisons,
+            "non_primary_records": non_primary_records,
+        }
+        encoded.append(json_dumps(preview))
+
+    return pd.Series(encoded, index=group_keys, dtype=object)
+
+
 def _generate_group_merge_preview(
     group_data: pd.DataFrame,
     fields: list[str],
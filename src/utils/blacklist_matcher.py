@@ -0,0 +1,166 @@
+"""Aho-Corasick multi-pattern matcher for disposition blacklists.
+
+All blacklist terms are compiled into one automaton, so each name is scanned
+once regardless of how many terms (configured or manual) are blacklisted.
+``pyahocorasick`` is used when installed; otherwise a pure-Python automaton
+with the same results is built.
+
+Terms are matched case-insensitively. Word-boundary terms follow regex
+``\\b`` semantics on both ends; substring terms match anywhere.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+import pandas as pd
+
+try:
+    import ahocorasick  # optional dep
+except ImportError:
+    ahocorasick = None
+
+logger = logging.getLogger(__name__)
+
+
+def _is_word_char(char: str) -> bool:
+    """Whether ``char`` is a regex ``\\w`` character."""
+    return char.isalnum() or char == "_"
+
+
+def _at_word_boundaries(text: str, start: int, end: int) -> bool:
+    """Whether ``text[start:end]`` has a regex ``\\b`` on both ends."""
+    before = start > 0 and _is_word_char(text[start - 1])
+    after = end < len(text) and _is_word_char(text[end])
+    return before != _is_word_char(text[start]) and after != _is_word_char(
+        text[end - 1],
+    )
+
+
+class _PythonAutomaton:
+    """Pure-Python Aho-Corasick automaton (goto, fail and output tables)."""
+
+    def __init__(self, patterns: dict[str, bool]) -> None:
+        self.goto: list[dict[str, int]] = [{}]
+        self.fail: list[int] = [0]
+        self.out: list[list[tuple[str, bool]]] = [[]]
+
+        for term, boundary in patterns.items():
+            node = 0
+            for char in term:
+                child = self.goto[node].get(char)
+                if child is None:
+                    child = len(self.goto)
+                    self.goto[node][char] = child
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append([])
+                node = child
+            self.out[node].append((term, boundary))
+
+        # Breadth-first fail links; outputs inherit those of their fail node
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self.goto[node].items():
+                fallback = self.fail[node]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+                self.out[child] = self.out[child] + self.out[self.fail[child]]
+                queue.append(child)
+
+    def iter(self, text: str) -> Iterator[tuple[int, tuple[str, bool]]]:
+        """Yield ``(end_index, (term, boundary))`` for every occurrence."""
+        goto, fail, out = self.goto, self.fail, self.out
+        node = 0
+        for index, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for value in out[node]:
+                yield index, value
+
+
+class BlacklistMatcher:
+    """Match company names against blacklist terms in a single scan.
+
+    Attributes:
+        backend: ``"pyahocorasick"`` or ``"python"``
+
+    """
+
+    def __init__(
+        self,
+        boundary_terms: Iterable[str] = (),
+        substring_terms: Iterable[str] = (),
+    ) -> None:
+        """Compile the automaton.
+
+        Args:
+            boundary_terms: Terms that must start and end on word boundaries
+            substring_terms: Terms that match anywhere in a name
+
+        """
+        # A term listed both ways only needs to match as a substring;
+        # empty terms are ignored
+        patterns: dict[str, bool] = {}
+        for term in boundary_terms:
+            if term and term.strip():
+                patterns.setdefault(term.lower(), True)
+        for term in substring_terms:
+            if term and term.strip():
+                patterns[term.lower()] = False
+        self._size = len(patterns)
+
+        self._automaton: Any
+        if ahocorasick is not None:
+            self.backend = "pyahocorasick"
+            self._automaton = ahocorasick.Automaton()
+            for term, boundary in patterns.items():
+                self._automaton.add_word(term, (term, boundary))
+            if patterns:
+                self._automaton.make_automaton()
+        else:
+            self.backend = "python"
+            self._automaton = _PythonAutomaton(patterns)
+
+        logger.info(
+            f"Blacklist matcher | backend={self.backend} | terms={self._size}",
+        )
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _matches(self, name: Any) -> Iterator[str]:
+        """Yield the terms matching ``name``, in order of their end position."""
+        if not self._size or pd.isna(name) or not name:
+            return
+        text = str(name)
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # Keep positions aligned for the boundary checks
+            lowered = "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
+        for end_index, (term, boundary) in self._automaton.iter(lowered):
+            start = end_index - len(term) + 1
+            if not boundary or _at_word_boundaries(lowered, start, end_index + 1):
+                yield term
+
+    def search(self, name: Any) -> bool:
+        """Whether any blacklist term matches ``name``."""
+        return next(self._matches(name), None) is not None
+
+    def find_all(self, name: Any) -> list[str]:
+        """Distinct blacklist terms matching ``name``, in order of appearance."""
+        return list(dict.fromkeys(self._matches(name)))
+
+    def mask(self, names: pd.Series) -> pd.Series:
+        """Boolean Series that is True where a name is blacklisted."""
+        return pd.Series(
+            [self.search(name) for name in names.tolist()],
+            index=names.index,
+            dtype=bool,
+        )
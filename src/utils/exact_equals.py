@@ -8,14 +8,29 @@ This module handles:
 """
 
 import logging
+import re
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
 
+_WHITESPACE_RUN = re.compile(r"\s+")
+
+
+def _exact_settings(settings: dict[str, Any]) -> dict[str, Any]:
+    """Return the ``pipeline.exact_equals_first_pass`` settings block."""
+    block: dict[str, Any] = settings.get("pipeline", {}).get(
+        "exact_equals_first_pass",
+        {},
+    )
+    return block
+
+
 def build_raw_exact_key(account_name: str, settings: dict[str, Any]) -> str:
     """Build raw exact key by trim + collapse whitespace (no case/punct changes).
 
@@ -31,17 +46,9 @@ def build_raw_exact_key(account_name: str, settings: dict[str, Any]) -> str:
         return ""  # type: ignore[unreachable]
 
     # Phase 1.35.2: Simple trim + whitespace collapse (no case/punct changes)
-    if (
-        settings.get("pipeline", {})
-        .get("exact_equals_first_pass", {})
-        .get("key_trim", True)
-    ):
-        # Trim leading/trailing whitespace
-        key = account_name.strip()
-        # Collapse multiple whitespace to single space
-        import re
-
-        key = re.sub(r"\s+", " ", key)
+    if _exact_settings(settings).get("key_trim", True):
+        # Trim leading/trailing whitespace, then collapse whitespace runs
+        key = _WHITESPACE_RUN.sub(" ", account_name.strip())
         # Return empty string if result is only whitespace
         return "" if key.strip() == "" else key
     # No trimming - use original, but still handle whitespace-only
@@ -50,6 +57,31 @@ def build_raw_exact_key(account_name: str, settings: dict[str, Any]) -> str:
     return account_name
 
 
+def build_raw_exact_keys(names: pd.Series, settings: dict[str, Any]) -> pd.Series:
+    """Vectorized ``build_raw_exact_key`` over a column of account names.
+
+    Args:
+        names: Raw account names
+        settings: Configuration settings
+
+    Returns:
+        Series of raw exact keys ("" for missing, non-string or blank names)
+
+    """
+    values = names.astype(object)
+    # .str methods yield NaN for non-string values, which become ""
+    try:
+        stripped = values.str.strip()
+    except AttributeError:
+        # No string values at all
+        return pd.Series("", index=names.index, dtype=object)
+    if _exact_settings(settings).get("key_trim", True):
+        keys = stripped.str.replace(_WHITESPACE_RUN, " ", regex=True)
+    else:
+        keys = values.where(stripped.fillna("") != "")
+    return keys.fillna("").astype(object)
+
+
 def find_exact_equals_groups(
     df: pd.DataFrame,
     settings: dict[str, Any],
@@ -57,6 +89,11 @@ def find_exact_equals_groups(
 ) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """Find exact equals groups before normalization.
 
+    Keys are built with vectorized string operations and integer-coded in
+    one hash pass; members, representatives and the pair and map artifacts
+    are then assembled with array operations. Groups are ordered by key and
+    members keep their input row order.
+
     Args:
         df: Input DataFrame with account data
         settings: Configuration settings
@@ -69,127 +106,87 @@ def find_exact_equals_groups(
     logger.info(
         f"exact_equals | backend=pandas | records={len(df)} | name_column={name_column}",
     )
-
-    # Build raw exact keys
-    df_with_keys = df.copy()
-    df_with_keys["raw_exact_key"] = df_with_keys[name_column].apply(
-        lambda x: build_raw_exact_key(x, settings),
+    exact_settings = _exact_settings(settings)
+    min_group_size = exact_settings.get("min_group_size", 2)
+    representative_policy = exact_settings.get(
+        "representative_policy",
+        "min_account_id",
     )
 
-    # Filter out empty keys
-    valid_keys_mask = df_with_keys["raw_exact_key"].str.len() > 0
-    df_with_keys = df_with_keys[valid_keys_mask].copy()
-
-    if len(df_with_keys) == 0:
+    # Build raw exact keys and drop empty ones
+    keys = build_raw_exact_keys(df[name_column], settings).to_numpy()
+    positions = np.flatnonzero(keys != "")
+    if len(positions) == 0:
         logger.warning("exact_equals | no_valid_keys | all_keys_empty")
         return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
 
-    # Group by raw exact key
-    exact_groups = (
-        df_with_keys.groupby("raw_exact_key")
-        .agg({"account_id": list, name_column: list})
-        .reset_index()
-    )
-
-    # Filter groups with size >= min_group_size
-    min_group_size = (
-        settings.get("pipeline", {})
-        .get("exact_equals_first_pass", {})
-        .get("min_group_size", 2)
-    )
-    exact_groups["group_size"] = exact_groups["account_id"].apply(len)
-    exact_groups = exact_groups[exact_groups["group_size"] >= min_group_size].copy()
-
-    if len(exact_groups) == 0:
+    # Integer-code the keys (sorted, so groups come out in key order)
+    codes, uniques = pd.factorize(keys[positions], sort=True)
+    key_sizes = np.bincount(codes, minlength=len(uniques))
+    kept_keys = key_sizes >= min_group_size
+    if not kept_keys.any():
         logger.info(f"exact_equals | no_groups_found | min_group_size={min_group_size}")
         return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
 
-    # Select representatives using deterministic policy
-    representative_policy = (
-        settings.get("pipeline", {})
-        .get("exact_equals_first_pass", {})
-        .get("representative_policy", "min_account_id")
-    )
+    # Members grouped by key; a stable sort keeps input order within groups
+    member_mask = kept_keys[codes]
+    order = np.argsort(codes[member_mask], kind="stable")
+    member_rows = positions[member_mask][order]
+    group_of = (np.cumsum(kept_keys) - 1)[codes[member_mask][order]]
+    group_sizes = key_sizes[kept_keys]
+    offsets = np.zeros(len(group_sizes) + 1, dtype=np.int64)
+    np.cumsum(group_sizes, out=offsets[1:])
 
-    representatives = []
-    for _, group in exact_groups.iterrows():
-        account_ids = group["account_id"]
-        names = group[name_column]
+    member_ids = df["account_id"].to_numpy()[member_rows]
+    member_names = df[name_column].to_numpy()[member_rows]
+    group_keys = np.asarray(uniques, dtype=object)[kept_keys]
 
-        if representative_policy == "min_account_id":
-            # Select representative with minimum account_id (deterministic)
-            rep_idx = min(range(len(account_ids)), key=lambda i: account_ids[i])
-        else:
-            # Default to first (fallback)
-            rep_idx = 0
-
-        representatives.append(
-            {
-                "raw_exact_key": group["raw_exact_key"],
-                "representative_id": account_ids[rep_idx],
-                "representative_name": names[rep_idx],
-                "group_size": group["group_size"],
-                "all_account_ids": account_ids,
-                "all_names": names,
-            },
+    # Select representatives using deterministic policy
+    if representative_policy == "min_account_id":
+        # Minimum account_id per group; ties keep the first member
+        rep_rows = (
+            pd.Series(member_ids, dtype=object)
+            .groupby(group_of, sort=True)
+            .idxmin()
+            .to_numpy()
         )
+    else:
+        # Default to first (fallback)
+        rep_rows = offsets[:-1]
+    rep_ids = member_ids[rep_rows]
+    rep_names = member_names[rep_rows]
 
     # Create exact raw groups DataFrame
-    exact_raw_groups = pd.DataFrame(representatives)
+    bounds = offsets[1:-1]
+    exact_raw_groups = pd.DataFrame(
+        {
+            "raw_exact_key": group_keys,
+            "representative_id": rep_ids,
+            "representative_name": rep_names,
+            "group_size": group_sizes,
+            "all_account_ids": [ids.tolist() for ids in np.split(member_ids, bounds)],
+            "all_names": [names.tolist() for names in np.split(member_names, bounds)],
+        },
+    )
 
     # Create raw exact map (original -> representative)
-    raw_exact_map = []
-    for _, group in exact_groups.iterrows():
-        raw_exact_key = group["raw_exact_key"]
-        account_ids = group["account_id"]
-        names = group[name_column]
-
-        # Find representative
-        rep_data = exact_raw_groups[
-            exact_raw_groups["raw_exact_key"] == raw_exact_key
-        ].iloc[0]
-        rep_id = rep_data["representative_id"]
-
-        # Map each member to representative
-        for acc_id, name in zip(account_ids, names):
-            raw_exact_map.append(
-                {
-                    "account_id": acc_id,
-                    "account_name": name,
-                    "raw_exact_key": raw_exact_key,
-                    "representative_id": rep_id,
-                    "representative_name": rep_data["representative_name"],
-                    "group_size": group["group_size"],
-                },
-            )
-
-    raw_exact_map_df = pd.DataFrame(raw_exact_map)
+    raw_exact_map_df = pd.DataFrame(
+        {
+            "account_id": member_ids,
+            "account_name": member_names,
+            "raw_exact_key": group_keys[group_of],
+            "representative_id": rep_ids[group_of],
+            "representative_name": rep_names[group_of],
+            "group_size": group_sizes[group_of],
+        },
+    )
 
     # Create candidate pairs for exact equals (100-score edges)
-    candidate_pairs_exact_raw = []
-    for _, group in exact_groups.iterrows():
-        account_ids = group["account_id"]
-        if len(account_ids) >= 2:
-            # Create pairs between all members (spanning tree approach)
-            for i in range(len(account_ids)):
-                for j in range(i + 1, len(account_ids)):
-                    candidate_pairs_exact_raw.append(
-                        {
-                            "id_a": account_ids[i],
-                            "id_b": account_ids[j],
-                            "score": 100.0,  # Exact match
-                            "group_join_reason": "exact_equal_raw",
-                            "raw_exact_key": group["raw_exact_key"],
-                        },
-                    )
-
-    candidate_pairs_df = pd.DataFrame(candidate_pairs_exact_raw)
+    candidate_pairs_df = _exact_pairs(member_ids, group_keys, group_sizes, offsets)
 
     # Log results with standardized format
-    total_members = sum(
-        len(group["account_id"]) for _, group in exact_groups.iterrows()
-    )
-    total_reps = len(exact_groups)
+    total_members = len(member_rows)
+    total_reps = len(group_sizes)
     singletons = len(df) - total_members
 
     logger.info(
@@ -200,6 +197,63 @@ def find_exact_equals_groups(
     return exact_raw_groups, raw_exact_map_df, candidate_pairs_df
 
 
+def _exact_pairs(
+    member_ids: np.ndarray,
+    group_keys: np.ndarray,
+    group_sizes: np.ndarray,
+    offsets: np.ndarray,
+) -> pd.DataFrame:
+    """Build all within-group member pairs, group by group in member order.
+
+    Groups of the same size share one ``triu_indices`` pattern; a stable sort
+    on the group index restores group order.
+    """
+    pair_groups = []
+    pair_left = []
+    pair_right = []
+    for size in np.unique(group_sizes[group_sizes >= 2]):
+        groups = np.flatnonzero(group_sizes == size)
+        i, j = np.triu_indices(size, k=1)
+        starts = np.repeat(offsets[groups], len(i))
+        pair_groups.append(np.repeat(groups, len(i)))
+        pair_left.append(starts + np.tile(i, len(groups)))
+        pair_right.append(starts + np.tile(j, len(groups)))
+
+    if not pair_groups:
+        return pd.DataFrame()
+
+    pair_group = np.concatenate(pair_groups)
+    order = np.argsort(pair_group, kind="stable")
+    pair_group = pair_group[order]
+    return pd.DataFrame(
+        {
+            "id_a": member_ids[np.concatenate(pair_left)[order]],
+            "id_b": member_ids[np.concatenate(pair_right)[order]],
+            "score": 100.0,  # Exact match
+            "group_join_reason": "exact_equal_raw",
+            "raw_exact_key": group_keys[pair_group],
+        },
+    )
+
+
+def _no_overwrite_path(base_path: str) -> str:
+    """Return ``base_path``, or a timestamped sibling if it already exists."""
+    if Path(base_path).exists():
+        # Create suffixed variant
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        name_parts = Path(base_path).name.split(".")
+        if len(name_parts) >= 2:
+            new_name = f"{name_parts[0]}_{timestamp}.{'.'.join(name_parts[1:])}"
+        else:
+            new_name = f"{base_path}_{timestamp}"
+        new_path = str(Path(base_path).parent / new_name)
+        logger.info(
+            f"exact_equals | existing_file_present | fallback_path={new_path} | reason=no_overwrite_policy",
+        )
+        return new_path
+    return base_path
+
+
 def write_exact_equals_artifacts(
     exact_raw_groups: pd.DataFrame,
     raw_exact_map: pd.DataFrame,
@@ -221,30 +275,10 @@ def write_exact_equals_artifacts(
     """
     logger.info(f"exact_equals | writing_artifacts | run_id={run_id}")
 
-    # Helper function to handle no-overwrite policy
-    def get_safe_path(base_path: str, suffix: str = "") -> str:
-        """Get safe file path with no-overwrite policy."""
-        if Path(base_path).exists():
-            # Create suffixed variant
-            from datetime import datetime
-
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            name_parts = Path(base_path).name.split(".")
-            if len(name_parts) >= 2:
-                new_name = f"{name_parts[0]}_{timestamp}.{'.'.join(name_parts[1:])}"
-            else:
-                new_name = f"{base_path}_{timestamp}"
-            new_path = str(Path(base_path).parent / new_name)
-            logger.info(
-                f"exact_equals | existing_file_present | fallback_path={new_path} | reason=no_overwrite_policy",
-            )
-            return new_path
-        return base_path
-
     # Write exact_raw_groups.parquet
     if not exact_raw_groups.empty:
         groups_path = f"{interim_dir}/exact_raw_groups.parquet"
-        safe_groups_path = get_safe_path(groups_path)
+        safe_groups_path = _no_overwrite_path(groups_path)
         exact_raw_groups.to_parquet(safe_groups_path, index=False)
         logger.info(
             f"exact_equals | written=exact_raw_groups.parquet | groups={len(exact_raw_groups)} | path={safe_groups_path}",
@@ -253,7 +287,7 @@ def write_exact_equals_artifacts(
     # Write raw_exact_map.parquet
     if not raw_exact_map.empty:
         map_path = f"{interim_dir}/raw_exact_map.parquet"
-        safe_map_path = get_safe_path(map_path)
+        safe_map_path = _no_overwrite_path(map_path)
         raw_exact_map.to_parquet(safe_map_path, index=False)
         logger.info(
             f"exact_equals | written=raw_exact_map.parquet | mappings={len(raw_exact_map)} | path={safe_map_path}",
@@ -262,7 +296,7 @@ def write_exact_equals_artifacts(
     # Write candidate_pairs_exact_raw.parquet
     if not candidate_pairs_exact_raw.empty:
         pairs_path = f"{interim_dir}/candidate_pairs_exact_raw.parquet"
-        safe_pairs_path = get_safe_path(pairs_path)
+        safe_pairs_path = _no_overwrite_path(pairs_path)
         candidate_pairs_exact_raw.to_parquet(safe_pairs_path, index=False)
         logger.info(
             f"exact_equals | written=candidate_pairs_exact_raw.parquet | pairs={len(candidate_pairs_exact_raw)} | path={safe_pairs_path}",
@@ -0,0 +1,385 @@
+"""DuckDB backend for the exact-equals Phase-0 pass.
+
+Selected with ``pipeline.exact_equals_first_pass.backend: duckdb``. Keys,
+groups and representatives are computed with ``GROUP BY`` and window
+functions, and the artifacts are written with ``COPY ... TO`` Parquet, so
+the pass can run over CSV or Parquet inputs larger than memory. Results
+match ``find_exact_equals_groups`` and ``create_unique_normalized``.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+import duckdb
+import numpy as np
+import pandas as pd
+
+from src.utils.exact_equals import _exact_settings, _no_overwrite_path
+
+logger = logging.getLogger(__name__)
+
+# Characters Python's str.strip()/re "\s" treat as whitespace (RE2's \s is
+# ASCII-only, so the rest are listed explicitly)
+_WHITESPACE_CLASS = r"[\s\x{0B}\x{1C}-\x{1F}\x{85}\p{Z}]"
+
+_GROUPS_QUERY = """
+SELECT
+    raw_exact_key,
+    any_value(representative_id) AS representative_id,
+    any_value(representative_name) AS representative_name,
+    count(*) AS group_size,
+    list(account_id ORDER BY _row) AS all_account_ids,
+    list(name ORDER BY _row) AS all_names
+FROM exact_members
+GROUP BY raw_exact_key
+ORDER BY raw_exact_key
+"""
+
+_MAP_QUERY = """
+SELECT
+    account_id,
+    name AS account_name,
+    raw_exact_key,
+    representative_id,
+    representative_name,
+    group_size
+FROM exact_members
+ORDER BY raw_exact_key, _row
+"""
+
+_PAIRS_QUERY = """
+SELECT
+    a.account_id AS id_a,
+    b.account_id AS id_b,
+    CAST(100.0 AS DOUBLE) AS score,
+    'exact_equal_raw' AS group_join_reason,
+    a.raw_exact_key
+FROM exact_members a
+JOIN exact_members b
+    ON a.raw_exact_key = b.raw_exact_key AND a._row < b._row
+ORDER BY a.raw_exact_key, a._row, b._row
+"""
+
+# Rows kept in the unique dataset: representatives and ungrouped accounts
+_UNIQUE_ROWS_QUERY = """
+SELECT k._row
+FROM exact_keys k
+WHERE EXISTS (
+        SELECT 1 FROM exact_members m WHERE m.representative_id = k.account_id
+    )
+    OR NOT EXISTS (
+        SELECT 1 FROM exact_members m WHERE m.account_id = k.account_id
+    )
+ORDER BY k._row
+"""
+
+
+def _sql_string(value: str) -> str:
+    """Quote a value as a SQL string literal."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _sql_identifier(name: str) -> str:
+    """Quote a column name as a SQL identifier."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+class DuckDBExactEquals:
+    """Exact-equals pass over a DataFrame or a CSV/Parquet file in DuckDB.
+
+    Use as a context manager; members and representatives are computed once
+    on entry and shared by the group, artifact and unique-dataset queries.
+    """
+
+    def __init__(
+        self,
+        source: pd.DataFrame | str | Path,
+        settings: dict[str, Any],
+        name_column: str = "Account Name",
+    ):
+        """Initialize the pass.
+
+        Args:
+            source: Accounts DataFrame, or path to a CSV or Parquet file
+            settings: Configuration settings
+            name_column: Column name for account names
+
+        """
+        self.source = source
+        self.settings = settings
+        self.name_column = name_column
+
+        exact_settings = _exact_settings(settings)
+        self.key_trim = exact_settings.get("key_trim", True)
+        self.min_group_size = int(exact_settings.get("min_group_size", 2))
+        self.representative_policy = exact_settings.get(
+            "representative_policy",
+            "min_account_id",
+        )
+
+        duckdb_config = settings.get("engine", {}).get("duckdb", {})
+        threads = duckdb_config.get("threads", "auto")
+        self.threads = None if threads == "auto" else int(threads)
+        self.memory_limit = duckdb_config.get("memory_limit") or os.environ.get(
+            "DUCKDB_MEMORY_LIMIT",
+        )
+        self.conn: duckdb.DuckDBPyConnection | None = None
+
+    def __enter__(self) -> DuckDBExactEquals:
+        self.conn = duckdb.connect(":memory:")
+        if self.threads is not None:
+            self.conn.execute(f"SET threads={self.threads}")
+        if self.memory_limit:
+            self.conn.execute(f"SET memory_limit='{self.memory_limit}'")
+        self.conn.execute("PRAGMA preserve_insertion_order=true")
+        self._build_members()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    @property
+    def _con(self) -> duckdb.DuckDBPyConnection:
+        if self.conn is None:
+            raise RuntimeError("DuckDBExactEquals must be used as a context manager")
+        return self.conn
+
+    def _fetch_row(self, query: str) -> tuple[Any, ...]:
+        """Run an aggregate query and return its single row."""
+        row = self._con.execute(query).fetchone()
+        if row is None:
+            raise RuntimeError(f"Query returned no rows: {query.strip()}")
+        return row
+
+    def _source_view(self) -> str:
+        """Create the ``exact_source`` view (_row, account_id, name)."""
+        if isinstance(self.source, pd.DataFrame):
+            names = self.source[self.name_column].astype(object)
+            # Non-string names never form a key, as in the pandas backend
+            is_string = names.map(lambda value: isinstance(value, str)).to_numpy(
+                dtype=bool,
+            )
+            account_ids = self.source["account_id"]
+            frame = pd.DataFrame(
+                {
+                    "_row": np.arange(len(self.source), dtype=np.int64),
+                    "account_id": account_ids.astype(object)
+                    .where(account_ids.notna(), None)
+                    .to_numpy(),
+                    "name": names.where(is_string, None).to_numpy(),
+                },
+            )
+            self._con.register("exact_source", frame)
+            return "dataframe"
+
+        path = str(self.source)
+        name = _sql_identifier(self.name_column)
+        if Path(path).suffix.lower() == ".parquet":
+            relation = f"read_parquet({_sql_string(path)}, file_row_number=true)"
+            row = "file_row_number"
+        else:
+            relation = f"read_csv({_sql_string(path)}, all_varchar=true)"
+            row = "row_number() OVER () - 1"
+        self._con.execute(
+            f"""
+            CREATE TEMP VIEW exact_source AS
+            SELECT
+                {row} AS _row,
+                CAST(account_id AS VARCHAR) AS account_id,
+                CAST({name} AS VARCHAR) AS name
+            FROM {relation}
+            """,
+        )
+        return path
+
+    def _key_expression(self) -> str:
+        """SQL for the raw exact key (mirrors ``build_raw_exact_key``)."""
+        if self.key_trim:
+            # Collapse whitespace runs to one space, then trim that space
+            collapsed = f"regexp_replace(name, '{_WHITESPACE_CLASS}+', ' ', 'g')"
+            return f"coalesce(trim({collapsed}, ' '), '')"
+        return (
+            f"CASE WHEN name IS NULL OR regexp_full_match(name, "
+            f"'{_WHITESPACE_CLASS}*') THEN '' ELSE name END"
+        )
+
+    def _build_members(self) -> None:
+        """Materialize keyed rows and the members of kept groups."""
+        source = self._source_view()
+        self._con.execute(
+            f"""
+            CREATE TEMP TABLE exact_keys AS
+            SELECT _row, account_id, name, {self._key_expression()} AS raw_exact_key
+            FROM exact_source
+            """,
+        )
+
+        if self.representative_policy == "min_account_id":
+            # Minimum account_id per group; ties keep the first member
+            rep_order = "account_id, _row"
+        else:
+            # Default to first (fallback)
+            rep_order = "_row"
+        self._con.execute(
+            f"""
+            CREATE TEMP TABLE exact_members AS
+            SELECT
+                _row,
+                account_id,
+                name,
+                raw_exact_key,
+                first_value(account_id) OVER rep AS representative_id,
+                first_value(name) OVER rep AS representative_name,
+                count(*) OVER (PARTITION BY raw_exact_key) AS group_size
+            FROM exact_keys
+            WHERE raw_exact_key <> ''
+            WINDOW rep AS (
+                PARTITION BY raw_exact_key ORDER BY {rep_order}
+                ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
+            )
+            QUALIFY group_size >= {self.min_group_size}
+            """,
+        )
+
+        records, members, groups = self._fetch_row(
+            """
+            SELECT
+                (SELECT count(*) FROM exact_keys),
+                count(*),
+                count(DISTINCT raw_exact_key)
+            FROM exact_members
+            """,
+        )
+        self.records, self.members, self.groups = records, members, groups
+        logger.info(
+            f"exact_equals | backend=duckdb | records={records} | source={source} | "
+            f"name_column={self.name_column}",
+        )
+        logger.info(
+            f"exact_equals | built_groups={groups} | total_members={members} | "
+            f"reps={groups} | singletons={records - members} | "
+            f"representative_policy={self.representative_policy}",
+        )
+
+    def find_groups(self) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        """Return (exact_raw_groups, raw_exact_map, candidate_pairs_exact_raw).
+
+        Same frames as ``find_exact_equals_groups``; empty frames when no
+        group reaches ``min_group_size``.
+        """
+        if self.members == 0:
+            return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+
+        groups = self._con.execute(_GROUPS_QUERY).df()
+        for column in ("all_account_ids", "all_names"):
+            groups[column] = [list(values) for values in groups[column]]
+        raw_map = self._con.execute(_MAP_QUERY).df()
+        pairs = self._con.execute(_PAIRS_QUERY).df()
+        return groups, raw_map, pairs if len(pairs) else pd.DataFrame()
+
+    def write_artifacts(self, interim_dir: str, run_id: str) -> None:
+        """COPY the three artifacts to Parquet with the no-overwrite policy.
+
+        Args:
+            interim_dir: Interim directory path
+            run_id: Run ID for logging
+
+        """
+        logger.info(
+            f"exact_equals | writing_artifacts | run_id={run_id} | backend=duckdb"
+        )
+        if self.members == 0:
+            return
+
+        n_pairs = self._fetch_row(
+            """
+            SELECT coalesce(sum(n * (n - 1) // 2), 0)
+            FROM (SELECT count(*) AS n FROM exact_members GROUP BY raw_exact_key)
+            """,
+        )[0]
+        for artifact, query, count in (
+            ("exact_raw_groups", _GROUPS_QUERY, f"groups={self.groups}"),
+            ("raw_exact_map", _MAP_QUERY, f"mappings={self.members}"),
+            ("candidate_pairs_exact_raw", _PAIRS_QUERY, f"pairs={n_pairs}"),
+        ):
+            if artifact == "candidate_pairs_exact_raw" and n_pairs == 0:
+                continue
+            path = _no_overwrite_path(f"{interim_dir}/{artifact}.parquet")
+            self._con.execute(
+                f"COPY ({query}) TO {_sql_string(path)} (FORMAT PARQUET)",
+            )
+            logger.info(
+                f"exact_equals | written={artifact}.parquet | {count} | path={path}",
+            )
+
+    def unique_normalized(self) -> pd.DataFrame:
+        """Representatives and singletons only, in input order.
+
+        DataFrame sources keep their dtypes and index (rows are selected
+        by position); file sources are read back through DuckDB.
+        """
+        unique_df: pd.DataFrame
+        if isinstance(self.source, pd.DataFrame):
+            if self.members == 0:
+                return self.source
+            rows = self._con.execute(_UNIQUE_ROWS_QUERY).fetchnumpy()["_row"]
+            unique_df = self.source.iloc[rows].copy()
+        else:
+            unique_df = self._con.execute(self._unique_file_query()).df()
+
+        logger.info(
+            f"exact_equals | unique_normalized | representatives={self.groups} | "
+            f"total_unique={len(unique_df)}",
+        )
+        return unique_df
+
+    def write_unique_normalized(self, output_path: str) -> int:
+        """COPY the unique dataset of a file source to Parquet.
+
+        Args:
+            output_path: Parquet path to write
+
+        Returns:
+            Number of rows written
+
+        """
+        if isinstance(self.source, pd.DataFrame):
+            unique_df = self.unique_normalized()
+            unique_df.to_parquet(output_path, index=False)
+            return len(unique_df)
+        self._con.execute(
+            f"COPY ({self._unique_file_query()}) TO {_sql_string(output_path)} "
+            "(FORMAT PARQUET)",
+        )
+        return int(self._fetch_row(f"SELECT count(*) FROM ({_UNIQUE_ROWS_QUERY})")[0])
+
+    def _unique_file_query(self) -> str:
+        """SELECT of the unique rows of a file source, all columns."""
+        path = _sql_string(str(self.source))
+        if Path(str(self.source)).suffix.lower() == ".parquet":
+            relation = f"read_parquet({path}, file_row_number=true)"
+            numbered = f"SELECT * FROM {relation}"
+            drop = "EXCLUDE (file_row_number)"
+            row = "file_row_number"
+        else:
+            relation = f"read_csv({path}, all_varchar=true)"
+            numbered = f"SELECT *, row_number() OVER () - 1 AS _src_row FROM {relation}"
+            drop = "EXCLUDE (_src_row)"
+            row = "_src_row"
+        return (
+            f"SELECT * {drop} FROM ({numbered}) src "
+            f"SEMI JOIN ({_UNIQUE_ROWS_QUERY}) u ON src.{row} = u._row "
+            f"ORDER BY src.{row}"
+        )
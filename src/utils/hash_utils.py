@@ -6,6 +6,7 @@ and resume functionality.
 
 import hashlib
 import json
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any, Union
 
@@ -153,10 +154,32 @@ def stable_group_id(member_ids: list[str], cfg_dict: dict, n: int = 10) -> str:
     Returns:
         Stable group ID as hex string
 
+    """
+    return stable_group_id_for_hash(member_ids, config_hash(cfg_dict), n)
+
+
+def stable_group_id_for_hash(
+    member_ids: Iterable[str],
+    cfg_hash: str,
+    n: int = 10,
+) -> str:
+    """Generate a stable group ID from a precomputed config hash.
+
+    Same result as ``stable_group_id`` with ``cfg_hash = config_hash(cfg_dict)``,
+    so callers assigning many groups serialize the config only once.
+
+    Args:
+        member_ids: Member account IDs
+        cfg_hash: Hash returned by ``config_hash``
+        n: Length of the group ID (default 10)
+
+    Returns:
+        Stable group ID as hex string
+
     """
     payload = {
         "members": sorted(map(str, member_ids)),
-        "config_hash": config_hash(cfg_dict),
+        "config_hash": cfg_hash,
     }
 
     # Use consistent JSON serialization
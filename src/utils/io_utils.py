@@ -434,3 +434,130 @@ def validate_csv_file(file_path: str) -> bool:
     except Exception as e:
         logger.error(f"CSV validation failed for {file_path}: {e}")
         return False
+
+
+class ParquetRowGroupWriter:
+    """Append DataFrame batches to a Parquet file as row groups.
+
+    The schema is fixed by the first batch; later batches are cast to it.
+    Use as a context manager so the file footer is always written.
+    """
+
+    def __init__(self, path: str | Path, row_group_size: int = 500_000) -> None:
+        """Initialize the writer.
+
+        Args:
+            path: Output Parquet path
+            row_group_size: Rows buffered before a row group is flushed
+
+        """
+        self.path = Path(path)
+        self.row_group_size = max(1, row_group_size)
+        self.rows_written = 0
+        self.row_groups = 0
+        self._buffer: list[pd.DataFrame] = []
+        self._buffered_rows = 0
+        self._writer: Any = None
+        self._schema: Any = None
+
+    def write(self, batch: pd.DataFrame) -> None:
+        """Buffer a batch, flushing a row group once enough rows accumulate."""
+        if batch.empty:
+            return
+        self._buffer.append(batch)
+        self._buffered_rows += len(batch)
+        if self._buffered_rows >= self.row_group_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered rows as one row group."""
+        if not self._buffer:
+            return
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        frame = pd.concat(self._buffer, ignore_index=True)
+        self._buffer = []
+        self._buffered_rows = 0
+
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        if self._writer is None:
+            self._schema = table.schema
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._writer = pq.ParquetWriter(str(self.path), self._schema)
+        else:
+            table = table.cast(self._schema)
+
+        self._writer.write_table(table, row_group_size=len(frame))
+        self.rows_written += len(frame)
+        self.row_groups += 1
+
+    def close(self) -> None:
+        """Flush remaining rows and finalize the file."""
+        self.flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self) -> "ParquetRowGroupWriter":
+        """Enter the context."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Finalize the file."""
+        self.close()
+
+
+def dataframe_to_record_batch(frame: pd.DataFrame) -> Any:
+    """Convert a DataFrame to an Arrow record batch for process hand-off.
+
+    Record batches pickle as Arrow IPC buffers, so worker results cross the
+    process boundary as columnar data instead of per-row Python objects.
+
+    Args:
+        frame: DataFrame to convert (the index is dropped)
+
+    Returns:
+        pyarrow.RecordBatch
+
+    """
+    import pyarrow as pa
+
+    return pa.RecordBatch.from_pandas(frame, preserve_index=False)
+
+
+def record_batches_to_dataframe(
+    batches: Sequence[Any],
+    columns: Sequence[str],
+) -> pd.DataFrame:
+    """Concatenate Arrow record batches back into one DataFrame.
+
+    Batches may disagree on list value types (an all-empty list column is
+    inferred as ``list<null>``), so columns are converted batch by batch.
+    List columns come back as Python lists, as pandas would hold them.
+
+    Args:
+        batches: Record batches in row order
+        columns: Column names to extract, in output order
+
+    Returns:
+        DataFrame with a RangeIndex
+
+    """
+    import pyarrow as pa
+
+    data: dict[str, Any] = {}
+    for name in columns:
+        parts = [batch.column(name) for batch in batches]
+        if any(pa.types.is_list(part.type) for part in parts):
+            values = [value for part in parts for value in part.to_pylist()]
+            data[name] = pd.Series(values, dtype=object)
+        elif parts:
+            data[name] = pd.concat(
+                [part.to_pandas() for part in parts],
+                ignore_index=True,
+            )
+        else:
+            data[name] = pd.Series([], dtype=object)
+    return pd.DataFrame(data, columns=list(columns))
@@ -5,7 +5,7 @@ coupling to specific implementations.
 """
 
 from collections.abc import Iterable
-from typing import Callable, Optional, Protocol, TypeVar
+from typing import Any, Callable, Optional, Protocol, TypeVar, runtime_checkable
 
 T = TypeVar("T")
 R = TypeVar("R")
@@ -42,3 +42,74 @@ class ExecutorLike(Protocol):
 
         """
         ...
+
+
+@runtime_checkable
+class RangeExecutorLike(ExecutorLike, Protocol):
+    """Executor that can dispatch (start, end) ranges as individual tasks."""
+
+    def execute_ranges(
+        self,
+        func: Callable[[int, int], Any],
+        total: int,
+        operation_name: str = ...,
+        ranges_per_worker: int = ...,
+    ) -> list[Any]:
+        """Apply ``func(start, end)`` over contiguous ranges of ``total`` items.
+
+        Args:
+            func: Function taking (start, end) bounds
+            total: Number of items to cover
+            operation_name: Name of operation for logging
+            ranges_per_worker: Ranges per worker for load balancing
+
+        Returns:
+            List of per-range results, in range order
+
+        """
+        ...
+
+    def range_bounds(
+        self,
+        total: int,
+        ranges_per_worker: int = ...,
+    ) -> list[tuple[int, int]]:
+        """Split ``total`` items into the ranges ``execute_ranges`` dispatches.
+
+        Args:
+            total: Number of items to cover
+            ranges_per_worker: Ranges per worker for load balancing
+
+        Returns:
+            List of (start, end) bounds, in order
+
+        """
+        ...
+
+
+@runtime_checkable
+class ChunkedExecutorLike(ExecutorLike, Protocol):
+    """Executor that can apply a batch function over balanced chunks of items."""
+
+    def execute_chunked(
+        self,
+        func: Callable[[list[Any]], Any],
+        items: list[Any],
+        chunk_size: Optional[int] = ...,
+        operation_name: str = ...,
+        work_size: Optional[int] = ...,
+    ) -> list[Any]:
+        """Apply ``func`` to chunks of ``items``.
+
+        Args:
+            func: Function taking a list of items
+            items: Items to process
+            chunk_size: Chunk size hint
+            operation_name: Name of operation for logging
+            work_size: Total work represented by the items, if not their count
+
+        Returns:
+            List of per-chunk results, in chunk order
+
+        """
+        ...
@@ -429,6 +429,7 @@ class ParallelExecutor:
         items: list[Any],
         chunk_size: Optional[int] = None,
         operation_name: str = "parallel_operation",
+        work_size: Optional[int] = None,
     ) -> list[Any]:
         """Execute function in parallel with custom chunking.
 
@@ -437,6 +438,9 @@ class ParallelExecutor:
             items: List of items to process
             chunk_size: Custom chunk size (None for default)
             operation_name: Name of operation for logging
+            work_size: Total work represented by ``items`` when items are
+                pre-balanced work units; decides parallel vs sequential
+                instead of the item count (None for ``len(items)``)
 
         Returns:
             List of results
@@ -446,6 +450,7 @@ class ParallelExecutor:
             chunk_size = self.chunk_size
 
         input_size = len(items)
+        plan_size = input_size if work_size is None else work_size
 
         # Create balanced chunks: target ~N_workers × 2-4 chunks
         target_chunks = min(
@@ -465,21 +470,21 @@ class ParallelExecutor:
         ]
 
         # Log parallel plan summary
-        if self.should_use_parallel(input_size):
+        if self.should_use_parallel(plan_size):
             logger.info(
-                f"Parallel plan: N={input_size}, chunks={len(chunks)}, "
+                f"Parallel plan: N={plan_size}, chunks={len(chunks)}, "
                 f"avg_size={balanced_chunk_size}, strategy=parallel "
                 f"(workers={self.workers}, backend={self.backend})",
             )
         else:
             logger.info(
-                f"Sequential plan: N={input_size}, chunks={len(chunks)}, "
+                f"Sequential plan: N={plan_size}, chunks={len(chunks)}, "
                 f"avg_size={balanced_chunk_size}, strategy=sequential "
                 f"(reason=input_size < {self.small_input_threshold})",
             )
 
-        if not self.should_use_parallel(input_size):
-            logger.info(f"Executing {operation_name} sequentially (size: {input_size})")
+        if not self.should_use_parallel(plan_size):
+            logger.info(f"Executing {operation_name} sequentially (size: {plan_size})")
             # For sequential execution, process items in chunks to match parallel behavior
             results = []
             for chunk in chunks:
@@ -528,6 +533,93 @@ class ParallelExecutor:
                     results.append(chunk_result)
             return results
 
+    def range_bounds(
+        self,
+        total: int,
+        ranges_per_worker: int = 4,
+    ) -> list[tuple[int, int]]:
+        """Split ``total`` items into the ranges ``execute_ranges`` dispatches.
+
+        Args:
+            total: Number of items to cover
+            ranges_per_worker: Ranges per worker for load balancing
+
+        Returns:
+            List of (start, end) bounds, in order
+
+        """
+        if total <= 0:
+            return []
+        use_parallel = self.should_use_parallel(total)
+        n_ranges = max(1, self.workers * ranges_per_worker) if use_parallel else 1
+        step = max(1, (total + n_ranges - 1) // n_ranges)
+        return [(start, min(start + step, total)) for start in range(0, total, step)]
+
+    def execute_ranges(
+        self,
+        func: Callable[[int, int], Any],
+        total: int,
+        operation_name: str = "parallel_operation",
+        ranges_per_worker: int = 4,
+    ) -> list[Any]:
+        """Execute ``func(start, end)`` over contiguous ranges of ``total`` items.
+
+        Each range is dispatched as its own task, so only the two bounds are
+        sent to workers. Data must be reachable by other means (e.g. shared
+        memory).
+
+        Args:
+            func: Function taking (start, end) bounds
+            total: Number of items to cover
+            operation_name: Name of operation for logging
+            ranges_per_worker: Ranges per worker for load balancing
+
+        Returns:
+            List of per-range results, in range order
+
+        """
+        bounds = self.range_bounds(total, ranges_per_worker)
+        if not bounds:
+            return []
+
+        use_parallel = self.should_use_parallel(total)
+        step = bounds[0][1] - bounds[0][0]
+
+        if not use_parallel:
+            logger.info(f"Executing {operation_name} sequentially (size: {total})")
+            return [func(start, end) for start, end in bounds]
+
+        monitor_parallel_execution(self.workers, operation_name)
+        logger.info(
+            f"Executing {operation_name} in parallel: "
+            f"workers={self.workers}, backend={self.backend}, "
+            f"ranges={len(bounds)}, range_size={step}, items={total}",
+        )
+
+        try:
+            results = list(
+                Parallel(
+                    n_jobs=self.workers,
+                    backend=self.backend,
+                    batch_size=1,
+                    verbose=0,
+                )(delayed(func)(start, end) for start, end in bounds),
+            )
+
+            logger.info(f"Completed {operation_name}: {len(results)} ranges")
+            return results
+
+        except Exception as e:
+            logger.error(f"Parallel execution failed: {e}")
+            logger.info(f"Falling back to sequential execution for {operation_name}")
+            results = []
+            for start, end in bounds:
+                if self.stop_flag.is_set():
+                    logger.info(f"Stop flag set, interrupting {operation_name}")
+                    break
+                results.append(func(start, end))
+            return results
+
     def map(
         self,
         fn: Callable[[Any], Any],
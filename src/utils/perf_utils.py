@@ -48,11 +48,16 @@ def narrow_sort(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
     return df.reindex(sorted_df.index)
 
 
-def parse_name_core_tokens(value: Union[str, list, None]) -> frozenset[str]:
+def parse_name_core_tokens(
+    value: Union[str, list, tuple, np.ndarray, None],
+) -> frozenset[str]:
     """Parse name_core_tokens, auto-detecting format.
 
+    Token lists are stored natively (``list<string>`` in Parquet, read back as
+    NumPy arrays); JSON strings from older interim files are still accepted.
+
     Args:
-        value: Value to parse (string, list, or None)
+        value: Value to parse (list, array, JSON string, or None)
 
     Returns:
         Frozen set of tokens
@@ -61,7 +66,7 @@ def parse_name_core_tokens(value: Union[str, list, None]) -> frozenset[str]:
     if value is None:
         return frozenset()
 
-    if isinstance(value, list):
+    if isinstance(value, (list, tuple, np.ndarray)):
         return frozenset(str(token) for token in value)
 
     if isinstance(value, str):
@@ -0,0 +1,167 @@
+"""Shared-memory NumPy arrays for process-pool workers.
+
+This module publishes read-only NumPy arrays into
+``multiprocessing.shared_memory`` blocks once, so process workers can attach
+to them by name instead of receiving pickled copies with every task.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+from types import TracebackType
+from typing import Any
+
+import numpy as np
+
+from src.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Serializes the pre-3.13 resource_tracker.register swap in _attach_block
+_REGISTER_SWAP_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class SharedArraySpec:
+    """Picklable description of one published array.
+
+    Attributes:
+        shm_name: Name of the shared memory block
+        shape: Array shape
+        dtype: NumPy dtype string
+
+    """
+
+    shm_name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+
+class SharedArrayStore:
+    """Owner of a set of shared memory arrays.
+
+    Use as a context manager; blocks are unlinked on exit. Only the specs
+    (names, shapes, dtypes) need to be sent to workers.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty store owned by the current process."""
+        self.owner_pid = os.getpid()
+        self.specs: dict[str, SharedArraySpec] = {}
+        self._blocks: list[shared_memory.SharedMemory] = []
+
+    def publish(self, key: str, array: np.ndarray) -> None:
+        """Copy an array into a new shared memory block.
+
+        Args:
+            key: Name the worker uses to look the array up
+            array: Array to publish; object dtypes are not supported
+
+        Raises:
+            TypeError: If the array has object dtype
+
+        """
+        array = np.ascontiguousarray(array)
+        if array.dtype == object:
+            raise TypeError(f"Cannot publish object array '{key}' to shared memory")
+
+        # Zero-size blocks are not allowed; keep at least one byte
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        self._blocks.append(block)
+        view: np.ndarray = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+        view[...] = array
+        self.specs[key] = SharedArraySpec(block.name, array.shape, array.dtype.str)
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the published blocks."""
+        return sum(block.size for block in self._blocks)
+
+    def close(self) -> None:
+        """Close and unlink every block."""
+        for block in self._blocks:
+            try:
+                block.close()
+                block.unlink()
+            except FileNotFoundError:
+                logger.debug(f"Shared memory block already removed | name={block.name}")
+        self._blocks.clear()
+        self.specs.clear()
+
+    def __enter__(self) -> SharedArrayStore:
+        """Enter the context."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Release all blocks."""
+        self.close()
+
+
+def _attach_block(name: str, track: bool) -> shared_memory.SharedMemory:
+    """Attach to an existing block, optionally skipping resource tracking.
+
+    Attaching registers the block with the resource tracker, which unlinks
+    it when a worker process exits (or double-unregisters it when the tracker
+    is shared with the owner). Workers attach untracked; the owner remains
+    responsible for unlinking. Python 3.13+ supports this directly; older
+    interpreters briefly swap out ``resource_tracker.register``, serialized
+    by a lock against other attaches in this process.
+    """
+    if track:
+        return shared_memory.SharedMemory(name=name)
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+
+    with _REGISTER_SWAP_LOCK:
+        register = resource_tracker.register
+        resource_tracker.register = lambda *args, **kwargs: None
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+def attach_shared_arrays(
+    specs: dict[str, SharedArraySpec],
+    owner_pid: int,
+) -> tuple[dict[str, np.ndarray], list[Any]]:
+    """Attach to published arrays from a worker.
+
+    Args:
+        specs: Specs from ``SharedArrayStore.specs``
+        owner_pid: PID of the owning process
+
+    Returns:
+        Tuple of (read-only array views by key, block handles). Keep the
+        handles alive while the views are in use, then close them.
+
+    """
+    arrays: dict[str, np.ndarray] = {}
+    handles: list[Any] = []
+    in_worker = os.getpid() != owner_pid
+    for key, spec in specs.items():
+        block = _attach_block(spec.shm_name, track=not in_worker)
+        handles.append(block)
+        view: np.ndarray = np.ndarray(
+            spec.shape,
+            dtype=np.dtype(spec.dtype),
+            buffer=block.buf,
+        )
+        view.flags.writeable = False
+        arrays[key] = view
+    return arrays, handles
+
+
+def release_shared_arrays(handles: list[Any]) -> None:
+    """Close worker-side block handles (the owner unlinks)."""
+    for block in handles:
+        block.close()
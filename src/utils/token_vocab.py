@@ -0,0 +1,333 @@
+"""Run-level token vocabulary with int32 token IDs.
+
+The vocabulary is built once from the normalized ``name_core_tokens`` and
+persisted as ``token_vocab.parquet`` in the interim directory. Records are
+encoded as CSR token-ID arrays (int32 IDs plus int64 offsets, the layout
+shared scoring already publishes), so stages intersect integer arrays
+instead of re-splitting names and hashing token strings.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+from itertools import chain
+from pathlib import Path
+from typing import Any, cast
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+TOKEN_VOCAB_FILENAME = "token_vocab.parquet"
+
+# Pairs intersected per sort pass; bounds the key array to a few hundred MB
+_INTERSECTION_CHUNK_PAIRS = 1_000_000
+
+
+def _ranges(starts: np.ndarray, sizes: np.ndarray) -> np.ndarray:
+    """Concatenate ``arange(start, start + size)`` for every (start, size)."""
+    total = int(sizes.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    ends = np.cumsum(sizes)
+    shift = np.repeat(starts - (ends - sizes), sizes)
+    return cast("np.ndarray", np.arange(total, dtype=np.int64) + shift)
+
+
+def _offsets_from_sizes(sizes: np.ndarray) -> np.ndarray:
+    """CSR offsets for the given per-record sizes."""
+    offsets = np.zeros(len(sizes) + 1, dtype=np.int64)
+    np.cumsum(sizes, out=offsets[1:])
+    return offsets
+
+
+@dataclass(frozen=True)
+class TokenIdSets:
+    """Per-record token IDs in CSR layout.
+
+    Attributes:
+        ids: int32 token IDs of all records, concatenated
+        offsets: int64 offsets; record ``i`` owns ``ids[offsets[i]:offsets[i + 1]]``
+
+    """
+
+    ids: np.ndarray
+    offsets: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def sizes(self) -> np.ndarray:
+        """Number of token IDs per record."""
+        return np.diff(self.offsets)
+
+    @property
+    def id_bound(self) -> int:
+        """One past the largest token ID (at least 1)."""
+        return int(self.ids.max()) + 1 if len(self.ids) else 1
+
+    def record(self, position: int) -> np.ndarray:
+        """Token IDs of one record."""
+        return self.ids[self.offsets[position] : self.offsets[position + 1]]
+
+    def take(self, positions: np.ndarray) -> TokenIdSets:
+        """Select records by position, in the given order."""
+        positions = np.asarray(positions, dtype=np.int64)
+        sizes = self.sizes[positions]
+        flat = _ranges(self.offsets[positions], sizes)
+        return TokenIdSets(self.ids[flat], _offsets_from_sizes(sizes))
+
+    def unique(self) -> TokenIdSets:
+        """Sorted, de-duplicated IDs per record (set semantics)."""
+        n = len(self)
+        bound = self.id_bound
+        rows = np.repeat(np.arange(n, dtype=np.int64), self.sizes)
+        keys = np.unique(rows * bound + self.ids)
+        sizes = np.bincount(keys // bound, minlength=n)
+        return TokenIdSets(
+            (keys % bound).astype(np.int32),
+            _offsets_from_sizes(sizes),
+        )
+
+    def first(self, skip: np.ndarray | None = None) -> np.ndarray:
+        """First token ID of each record, ``-1`` for records without tokens.
+
+        Args:
+            skip: Optional boolean mask over token IDs; the first token not
+                skipped is returned, falling back to the first token when
+                every token of a record is skipped
+
+        Returns:
+            int32 array with one token ID per record
+
+        """
+        sizes = self.sizes
+        present = sizes > 0
+        first = np.full(len(self), -1, dtype=np.int32)
+        starts = self.offsets[:-1][present]
+        first[present] = self.ids[starts]
+        if skip is None or not len(self.ids):
+            return first
+
+        # Position of the first kept token per record, via a reduceat over
+        # positions (skipped tokens are pushed past the end)
+        kept = ~skip[self.ids]
+        positions = np.where(kept, np.arange(len(self.ids)), len(self.ids))
+        first_kept = np.minimum.reduceat(positions, starts)
+        has_kept = first_kept < self.offsets[1:][present]
+        rows = np.flatnonzero(present)[has_kept]
+        first[rows] = self.ids[first_kept[has_kept]]
+        return first
+
+    def to_frozensets(self) -> np.ndarray:
+        """Per-record frozensets of token IDs, as an object array."""
+        out = np.empty(len(self), dtype=object)
+        ids = self.ids.tolist()
+        bounds = self.offsets.tolist()
+        out[:] = [frozenset(ids[a:b]) for a, b in zip(bounds[:-1], bounds[1:])]
+        return out
+
+
+@dataclass(frozen=True)
+class TokenVocabulary:
+    """Sorted token strings; a token's ID is its position.
+
+    Attributes:
+        tokens: Object array of token strings in ID order
+        doc_freq: int32 number of records containing each token
+
+    """
+
+    tokens: np.ndarray
+    doc_freq: np.ndarray
+
+    @property
+    def size(self) -> int:
+        """Number of tokens in the vocabulary."""
+        return len(self.tokens)
+
+    def lookup(self, terms: Iterable[str]) -> np.ndarray:
+        """Token IDs of ``terms``, ``-1`` for tokens not in the vocabulary."""
+        values = (
+            terms
+            if isinstance(terms, np.ndarray)
+            else np.asarray(list(terms), dtype=object)
+        )
+        if not len(values):
+            return np.empty(0, dtype=np.int32)
+        return cast(
+            "np.ndarray",
+            pd.Index(self.tokens).get_indexer(values).astype(np.int32),
+        )
+
+    def mask(self, terms: Iterable[str], bound: int | None = None) -> np.ndarray:
+        """Boolean mask over token IDs that is True for ``terms``.
+
+        Args:
+            terms: Token strings to mark
+            bound: Mask length; defaults to the vocabulary size (pass
+                ``TokenIdSets.id_bound`` when sets hold out-of-vocabulary IDs)
+
+        Returns:
+            Boolean array indexed by token ID
+
+        """
+        mask = np.zeros(max(self.size, bound or 0), dtype=bool)
+        ids = self.lookup(terms)
+        mask[ids[ids >= 0]] = True
+        return mask
+
+    def encode(self, token_lists: Iterable[Any]) -> TokenIdSets:
+        """Encode token lists against the vocabulary, preserving token order.
+
+        Tokens missing from the vocabulary get fresh IDs past ``size`` (equal
+        tokens share an ID), so equality between records is preserved.
+        """
+        flat, sizes = _flatten(token_lists)
+        ids = self.lookup(flat).astype(np.int64)
+        unknown = ids < 0
+        if unknown.any():
+            codes, _ = pd.factorize(flat[unknown], sort=True)
+            ids[unknown] = self.size + codes
+        return TokenIdSets(ids.astype(np.int32), _offsets_from_sizes(sizes))
+
+
+def _token_list(value: Any) -> Any:
+    """Token list of one ``name_core_tokens`` value (list, set, array or JSON)."""
+    if isinstance(value, (list, tuple, set, frozenset, np.ndarray)):
+        return value
+    if isinstance(value, str):
+        try:
+            parsed = json.loads(value)
+        except ValueError:
+            # Python-repr lists, as written by CSV interim files
+            tokens = value.strip("[]").split(",")
+            return [t.strip().strip("\"'") for t in tokens if t.strip()]
+        return parsed if isinstance(parsed, list) else []
+    return []
+
+
+def _flatten(token_lists: Iterable[Any]) -> tuple[np.ndarray, np.ndarray]:
+    """Flatten token lists into one object array plus per-record sizes."""
+    # Plain lists (in-memory name_core_tokens) skip the per-value dispatch
+    lists = [v if type(v) is list else _token_list(v) for v in token_lists]
+    sizes = np.fromiter(map(len, lists), dtype=np.int64, count=len(lists))
+    flat = np.empty(int(sizes.sum()), dtype=object)
+    flat[:] = list(map(str, chain.from_iterable(lists)))
+    return flat, sizes
+
+
+def tokenize_names(names: Iterable[Any]) -> list[list[str]]:
+    """Whitespace-split each name (missing names have no tokens)."""
+    series = pd.Series(names, dtype=object)
+    return series.where(series.notna(), "").astype(str).str.split().tolist()
+
+
+def _factorize_tokens(token_lists: Iterable[Any]) -> tuple[TokenIdSets, np.ndarray]:
+    """Encode token lists with IDs in sorted token order, plus the tokens."""
+    flat, sizes = _flatten(token_lists)
+    codes, uniques = pd.factorize(flat, sort=True)
+    tokens = np.empty(len(uniques), dtype=object)
+    tokens[:] = list(uniques)
+    return TokenIdSets(codes.astype(np.int32), _offsets_from_sizes(sizes)), tokens
+
+
+def encode_token_lists(token_lists: Iterable[Any]) -> TokenIdSets:
+    """Encode token lists with IDs local to this call.
+
+    IDs are only meaningful within the returned sets, which is enough for
+    intersections and Jaccard over the records encoded together.
+    """
+    return _factorize_tokens(token_lists)[0]
+
+
+def build_token_vocabulary(
+    token_lists: Iterable[Any],
+) -> tuple[TokenVocabulary, TokenIdSets]:
+    """Build the vocabulary and encode the records it was built from.
+
+    Args:
+        token_lists: One token list per record (lists, arrays read back from
+            Parquet, or JSON strings from older interim files)
+
+    Returns:
+        Tuple of (vocabulary, per-record token IDs in original token order)
+
+    """
+    sets, tokens = _factorize_tokens(token_lists)
+    doc_freq = np.bincount(sets.unique().ids, minlength=len(tokens))
+    vocab = TokenVocabulary(tokens, doc_freq.astype(np.int32))
+    logger.info(
+        f"Token vocabulary | records={len(sets)} | tokens={vocab.size} | "
+        f"token_occurrences={len(sets.ids)}",
+    )
+    return vocab, sets
+
+
+def intersection_sizes(
+    sets: TokenIdSets,
+    left: np.ndarray,
+    right: np.ndarray,
+    exclude: np.ndarray | None = None,
+) -> np.ndarray:
+    """Count shared token IDs for each (left, right) record pair.
+
+    ``sets`` must hold de-duplicated IDs per record (see ``TokenIdSets.unique``).
+    Both sides are keyed by ``pair * bound + id`` and sorted together, so a
+    shared token is an adjacent equal key.
+
+    Args:
+        sets: Per-record unique token IDs
+        left: Record position of the first side of each pair
+        right: Record position of the second side of each pair
+        exclude: Optional boolean mask over token IDs not to count
+
+    Returns:
+        int64 array of shared token counts, one per pair
+
+    """
+    left = np.asarray(left, dtype=np.int64)
+    right = np.asarray(right, dtype=np.int64)
+    counts = np.zeros(len(left), dtype=np.int64)
+    bound = max(sets.id_bound, len(exclude) if exclude is not None else 0)
+
+    for start in range(0, len(left), _INTERSECTION_CHUNK_PAIRS):
+        end = min(len(left), start + _INTERSECTION_CHUNK_PAIRS)
+        keys = []
+        for side in (left[start:end], right[start:end]):
+            sizes = sets.sizes[side]
+            ids = sets.ids[_ranges(sets.offsets[side], sizes)].astype(np.int64)
+            pair = np.repeat(np.arange(end - start, dtype=np.int64), sizes)
+            if exclude is not None:
+                kept = ~exclude[ids]
+                ids, pair = ids[kept], pair[kept]
+            keys.append(pair * bound + ids)
+        merged = np.sort(np.concatenate(keys))
+        shared = merged[1:][merged[1:] == merged[:-1]]
+        counts[start:end] = np.bincount(shared // bound, minlength=end - start)
+    return counts
+
+
+def save_token_vocabulary(vocab: TokenVocabulary, path: str | Path) -> None:
+    """Write the vocabulary as a Parquet table (token_id, token, doc_freq)."""
+    pd.DataFrame(
+        {
+            "token_id": np.arange(vocab.size, dtype=np.int32),
+            "token": pd.Series(vocab.tokens, dtype="string"),
+            "doc_freq": vocab.doc_freq,
+        },
+    ).to_parquet(path, index=False)
+    logger.info(f"Token vocabulary | written | tokens={vocab.size} | path={path}")
+
+
+def load_token_vocabulary(path: str | Path) -> TokenVocabulary:
+    """Read a vocabulary written by ``save_token_vocabulary``."""
+    table = pd.read_parquet(path).sort_values("token_id")
+    tokens = np.empty(len(table), dtype=object)
+    tokens[:] = table["token"].astype(object).tolist()
+    return TokenVocabulary(tokens, table["doc_freq"].to_numpy(dtype=np.int32))
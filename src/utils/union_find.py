@@ -1,11 +1,14 @@
 """Union-Find data structure for efficient grouping operations.
 
 This module provides a DisjointSet implementation with size tracking
-for canopy bound checks in the grouping stage.
+for canopy bound checks in the grouping stage, and an array-backed
+variant over integer node IDs for large runs.
 """
 
 import logging
-from typing import Any
+from typing import Any, Optional
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -172,3 +175,234 @@ class DisjointSet:
     def __contains__(self, x: Any) -> bool:
         """Check if element x is in the disjoint set."""
         return x in self.parent
+
+
+class ArrayUnionFind:
+    """Union-Find over integer node IDs ``0..n-1`` backed by NumPy arrays.
+
+    Parent and size are int32 and rank is int8, so the structure costs a few
+    bytes per node whatever the external ID type; callers map their IDs to
+    positions once and map roots back only at output. The arrays are public
+    so batch kernels can run unions on them in place.
+    """
+
+    def __init__(self, n: int, tie_break: str = "first") -> None:
+        """Initialize ``n`` singleton sets.
+
+        Args:
+            n: Number of nodes
+            tie_break: Root kept when two roots have equal rank: ``"first"``
+                keeps the root of the first union argument (as DisjointSet
+                does), ``"smaller"`` keeps the smaller node ID
+
+        """
+        if tie_break not in ("first", "smaller"):
+            raise ValueError(f"Unknown tie_break: {tie_break}")
+        self.parent = np.arange(n, dtype=np.int32)
+        self.rank = np.zeros(n, dtype=np.int8)
+        self.size = np.ones(n, dtype=np.int32)
+        self.tie_break = tie_break
+
+    def find(self, x: int) -> int:
+        """Find the root of node x, compressing the path to it.
+
+        Args:
+            x: Node ID
+
+        Returns:
+            Root node ID
+
+        """
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return int(root)
+
+    def union(self, x: int, y: int) -> bool:
+        """Merge the sets containing x and y (union by rank).
+
+        Args:
+            x: First node ID
+            y: Second node ID
+
+        Returns:
+            True if the sets were merged, False if they were already in the same set
+
+        """
+        root_x = self.find(x)
+        root_y = self.find(y)
+        if root_x == root_y:
+            return False
+
+        rank = self.rank
+        if rank[root_x] < rank[root_y] or (
+            rank[root_x] == rank[root_y]
+            and self.tie_break == "smaller"
+            and root_y < root_x
+        ):
+            root_x, root_y = root_y, root_x
+
+        self.parent[root_y] = root_x
+        self.size[root_x] += self.size[root_y]
+        if rank[root_x] == rank[root_y]:
+            rank[root_x] += 1
+
+        return True
+
+    def union_many(
+        self,
+        xs: np.ndarray,
+        ys: np.ndarray,
+        roots_out: Optional[np.ndarray] = None,
+    ) -> int:
+        """Union node pairs in order, as repeated ``union`` calls would.
+
+        The arrays are converted to plain lists once and the pairs run
+        through ``_union_pairs``, so no NumPy scalar is indexed per pair.
+
+        Args:
+            xs: First node ID of each pair
+            ys: Second node ID of each pair
+            roots_out: Optional array of ``len(xs)`` filled with
+                ``find(xs[i])`` as it was right after pair i was unioned
+
+        Returns:
+            Number of merges performed
+
+        """
+        parent = self.parent.tolist()
+        rank = self.rank.tolist()
+        size = self.size.tolist()
+        roots: Optional[list[int]] = [] if roots_out is not None else None
+        merges = _union_pairs(
+            parent,
+            rank,
+            size,
+            np.asarray(xs, dtype=np.int64).tolist(),
+            np.asarray(ys, dtype=np.int64).tolist(),
+            self.tie_break == "smaller",
+            roots,
+        )
+        self.parent[:] = parent
+        self.rank[:] = rank
+        self.size[:] = size
+        if roots_out is not None:
+            roots_out[:] = roots
+        return merges
+
+    def get_size(self, x: int) -> int:
+        """Get the size of the set containing node x."""
+        return int(self.size[self.find(x)])
+
+    def find_all(self) -> np.ndarray:
+        """Roots of all nodes, fully compressing every path.
+
+        Returns:
+            int32 array mapping each node ID to its root
+
+        """
+        # Pointer jumping: each pass halves the remaining path lengths
+        parent = self.parent
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+        self.parent[:] = parent
+        return parent.copy()
+
+    def get_set_count(self) -> int:
+        """Get the total number of sets (nodes that are their own root)."""
+        return int(np.count_nonzero(self.parent == np.arange(len(self.parent))))
+
+    def __len__(self) -> int:
+        """Get the total number of nodes."""
+        return len(self.parent)
+
+
+def _union_pairs(
+    parent: list[int],
+    rank: list[int],
+    size: list[int],
+    xs: list[int],
+    ys: list[int],
+    prefer_smaller: bool,
+    roots: Optional[list[int]] = None,
+) -> int:
+    """Union-by-rank over (xs[i], ys[i]) in order, updating the lists in place.
+
+    Same decisions as ``ArrayUnionFind.union``; roots are found with path
+    halving. When ``roots`` is given, the root of ``xs[i]`` after each pair
+    is appended to it. Returns the number of merges performed.
+    """
+    merges = 0
+    for i in range(len(xs)):
+        root_x = xs[i]
+        while parent[root_x] != root_x:
+            parent[root_x] = parent[parent[root_x]]
+            root_x = parent[root_x]
+        root_y = ys[i]
+        while parent[root_y] != root_y:
+            parent[root_y] = parent[parent[root_y]]
+            root_y = parent[root_y]
+        if root_x == root_y:
+            if roots is not None:
+                roots.append(root_x)
+            continue
+
+        if rank[root_x] < rank[root_y] or (
+            rank[root_x] == rank[root_y] and prefer_smaller and root_y < root_x
+        ):
+            root_x, root_y = root_y, root_x
+
+        if roots is not None:
+            roots.append(root_x)
+        parent[root_y] = root_x
+        size[root_x] += size[root_y]
+        if rank[root_x] == rank[root_y]:
+            rank[root_x] += 1
+        merges += 1
+    return merges
+
+
+def connected_component_labels(
+    num_nodes: int,
+    xs: np.ndarray,
+    ys: np.ndarray,
+) -> np.ndarray:
+    """Label every node with the smallest node ID of its connected component.
+
+    Vectorized min-label hooking with pointer jumping over the edge list, so
+    no per-edge Python work is done.
+
+    Args:
+        num_nodes: Number of nodes
+        xs: First node ID of each edge
+        ys: Second node ID of each edge
+
+    Returns:
+        int64 array of component labels, one per node
+
+    """
+    labels = np.arange(num_nodes, dtype=np.int64)
+    xs = np.asarray(xs, dtype=np.int64)
+    ys = np.asarray(ys, dtype=np.int64)
+    while True:
+        # Hook the larger label of every edge onto the smaller one
+        label_x, label_y = labels[xs], labels[ys]
+        hooked = labels.copy()
+        low = np.minimum(label_x, label_y)
+        np.minimum.at(hooked, label_x, low)
+        np.minimum.at(hooked, label_y, low)
+        # Pointer jumping until every node points at its root
+        while True:
+            jumped = hooked[hooked]
+            if np.array_equal(jumped, hooked):
+                break
+            hooked = jumped
+        if np.array_equal(hooked, labels):
+            return labels
+        labels = hooked
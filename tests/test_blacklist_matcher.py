@@ -0,0 +1,100 @@
+"""Tests for the Aho-Corasick blacklist matcher."""
+
+import re
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.disposition import get_blacklist_matcher
+from src.utils import blacklist_matcher
+from src.utils.blacklist_matcher import BlacklistMatcher
+
+TOKENS = ["temp", "na", "n/a", "test", "(x)", "1099"]
+PHRASES = ["no paystub", "pay stub", "not sure", "none"]
+PARTS = [
+    "temp",
+    "Temporary",
+    "N/A",
+    "na",
+    "test",
+    "contest",
+    "_test",
+    "(x)",
+    "a(x)",
+    "x1099",
+    "1099",
+    "No Paystubs",
+    "nonesuch",
+    "Acme",
+    "-",
+    "/",
+    "é",
+]
+
+
+@pytest.fixture(params=["python", "pyahocorasick"])
+def backend(request, monkeypatch):
+    """Run each test with the pure-Python and (if installed) native automaton."""
+    if request.param == "python":
+        monkeypatch.setattr(blacklist_matcher, "ahocorasick", None)
+    elif blacklist_matcher.ahocorasick is None:
+        pytest.skip("pyahocorasick not installed")
+    return request.param
+
+
+class TestBlacklistMatcher:
+    """Test matching semantics against the equivalent regexes."""
+
+    def test_matches_regex_semantics(self, backend):
+        """Tokens behave like \\b(?:...)\\b, phrases like substrings."""
+        token_regex = re.compile(
+            r"\b(?:" + "|".join(map(re.escape, TOKENS)) + r")\b",
+            re.IGNORECASE,
+        )
+        matcher = BlacklistMatcher(TOKENS, PHRASES)
+        assert matcher.backend == backend
+
+        rng = np.random.default_rng(2)
+        for _ in range(3000):
+            separator = rng.choice(["", " "])
+            name = separator.join(rng.choice(PARTS, rng.integers(1, 5)))
+            expected = bool(token_regex.search(name)) or any(
+                phrase in name.lower() for phrase in PHRASES
+            )
+            assert matcher.search(name) == expected, name
+
+    def test_find_all_and_missing_names(self, backend):
+        """Matched terms come back once, in order; missing names never match."""
+        matcher = BlacklistMatcher(TOKENS, PHRASES)
+
+        assert matcher.find_all("TEMP test n/a temp") == ["temp", "test", "n/a"]
+        assert matcher.find_all("contest nonesuch") == ["none"]
+        assert not matcher.search(None)
+        assert not matcher.search("")
+        assert matcher.mask(pd.Series(["temp", None, "acme"])).tolist() == [
+            True,
+            False,
+            False,
+        ]
+
+    def test_empty_terms(self, backend):
+        """Empty and blank terms are ignored."""
+        matcher = BlacklistMatcher(["", " "], [""])
+
+        assert len(matcher) == 0
+        assert not matcher.search("anything")
+
+
+def test_matchers_cached_per_configuration():
+    """Equal term lists share one matcher regardless of order."""
+    first = get_blacklist_matcher(["temp", "na"], ["no paystub"])
+
+    assert get_blacklist_matcher(["na", "temp", "na"], ["no paystub"]) is first
+    assert get_blacklist_matcher(["temp"], ["no paystub"]) is not first
@@ -0,0 +1,149 @@
+"""Tests for the inverted-index block builder used by soft-ban blocking.
+
+This module verifies that building blocks from a single factorize pass:
+- Groups row positions exactly like a per-key boolean mask would
+- Produces the same candidate pair set as mask-based blocking
+- Reports identical per-block stats to write_blocking_diagnostics
+"""
+
+import sys
+import tempfile
+from itertools import combinations
+from pathlib import Path
+
+import pandas as pd
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.similarity.blocking import (
+    _build_block_index,
+    generate_candidate_pairs_soft_ban,
+)
+
+
+def _settings() -> dict:
+    return {
+        "similarity": {
+            "blocking": {
+                "allowlist_tokens": ["7"],
+                "allowlist_bigrams": ["99 cents"],
+                "denylist_tokens": [],
+                "stop_tokens": ["inc", "llc", "ltd"],
+                "soft_ban": {"block_cap": 800},
+            },
+        },
+    }
+
+
+def _mask_reference_pairs(df_norm: pd.DataFrame, stop_tokens: set[str]) -> set:
+    """Reference implementation: one boolean mask per block key."""
+
+    def first_token(name: str) -> str:
+        tokens = name.split()
+        for token in tokens:
+            if token.lower() not in stop_tokens:
+                return token.lower()
+        return tokens[0].lower() if tokens else ""
+
+    keys = df_norm["name_core"].apply(first_token)
+    bigrams = df_norm["name_core"].apply(
+        lambda n: " ".join(n.lower().split()[:2]) if len(n.split()) >= 2 else "",
+    )
+    pairs = set()
+    for bg in bigrams.unique():
+        if bg == "99 cents":
+            pairs.update(combinations(df_norm[bigrams == bg].index, 2))
+    for key in keys.unique():
+        if key:
+            pairs.update(combinations(df_norm[keys == key].index, 2))
+    return pairs
+
+
+class TestBuildBlockIndex:
+    """Test the factorize-based key -> positions index."""
+
+    def test_positions_match_boolean_masks(self):
+        """Each key's positions equal the nonzero positions of its mask."""
+        keys = pd.Series(["b", "a", "b", "", "c", "a", "b"], dtype="string")
+        uniques, offsets, positions = _build_block_index(keys)
+
+        # First-appearance order, same as Series.unique()
+        assert list(uniques) == list(keys.unique())
+        for i, key in enumerate(uniques):
+            block = positions[offsets[i] : offsets[i + 1]].tolist()
+            expected = [p for p, k in enumerate(keys) if k == key]
+            assert block == expected
+
+    def test_missing_keys_are_excluded(self):
+        """NA keys never appear in any block."""
+        keys = pd.Series(["a", None, "a"], dtype="string")
+        uniques, offsets, positions = _build_block_index(keys)
+
+        assert list(uniques) == ["a"]
+        assert positions.tolist() == [0, 2]
+        assert offsets.tolist() == [0, 2]
+
+
+class TestBlockingParity:
+    """Test that indexed blocking matches mask-based blocking."""
+
+    def test_pair_set_matches_mask_reference(self):
+        """Indexed blocking emits the same pair set as per-key masks."""
+        df_norm = pd.DataFrame(
+            {
+                "account_id": [f"A{i}" for i in range(9)],
+                "name_core": [
+                    "acme store",
+                    "99 cents only",
+                    "acme shop",
+                    "inc beta corp",
+                    "beta holdings",
+                    "99 cents store",
+                    "7 eleven",
+                    "7 market",
+                    "gamma",
+                ],
+                "suffix_class": ["NONE"] * 9,
+            },
+            # Non-contiguous labels make position/label mix-ups visible
+            index=[10, 3, 7, 42, 8, 1, 99, 5, 6],
+        )
+
+        pairs = generate_candidate_pairs_soft_ban(df_norm, settings=_settings())
+        expected = _mask_reference_pairs(df_norm, {"inc", "llc", "ltd"})
+
+        labelled = pairs.to_labels(df_norm.index)
+        assert set(labelled) == expected
+        assert len(labelled) == len(expected)
+
+    def test_block_stats_are_reported_per_block(self):
+        """write_blocking_diagnostics receives one row per multi-record block."""
+        df_norm = pd.DataFrame(
+            {
+                "account_id": ["A1", "A2", "A3", "A4", "A5"],
+                "name_core": [
+                    "acme one",
+                    "beta one",
+                    "acme two",
+                    "acme three",
+                    "beta two",
+                ],
+                "suffix_class": ["NONE"] * 5,
+            },
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            generate_candidate_pairs_soft_ban(
+                df_norm,
+                interim_dir=temp_dir,
+                settings=_settings(),
+            )
+            stats = pd.read_csv(Path(temp_dir) / "block_stats.csv")
+
+        assert stats["token"].tolist() == ["acme", "beta"]
+        assert stats["count"].tolist() == [3, 2]
+        assert stats["strategy"].tolist() == ["full_pairs", "full_pairs"]
+        assert stats["pairs_generated"].tolist() == [3, 1]
+        assert stats["pairs_capped"].tolist() == [0, 0]
@@ -0,0 +1,260 @@
+"""Tests for the MinHash/LSH blocking strategy.
+
+This module verifies that:
+- MinHash signatures are deterministic and estimate Jaccard similarity
+- LSH emits each colliding pair exactly once across bands
+- Buckets above bucket_cap are split into linked, capped sub-buckets
+- Reordered names, which first-token blocking misses, become candidates
+- Strategy dispatch, recall diagnostics and streaming use the strategy
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.similarity.blocking import (
+    generate_candidate_pairs,
+    generate_candidate_pairs_soft_ban,
+)
+from src.similarity.diagnostics import merge_block_stats
+from src.similarity.lsh import (
+    _band_codes,
+    iter_lsh_blocks,
+    lsh_recall_diagnostics,
+    minhash_signatures,
+)
+from src.similarity.streaming import stream_pair_scores
+from src.utils.union_find import connected_component_labels
+
+NAMES = [
+    "acme store",
+    "store acme",
+    "acme stores",
+    "beta holdings",
+    "holdings beta",
+    "gamma",
+    "",
+    "acme store",
+]
+
+
+def _df_norm(names: list[str] = NAMES) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "account_id": [f"A{i}" for i in range(len(names))],
+            "name_core": names,
+            "suffix_class": ["NONE"] * len(names),
+        },
+    )
+
+
+def _settings(**overrides) -> dict:
+    lsh = {"num_perm": 32, "bands": 16, "seed": 7}
+    lsh.update(overrides)
+    return {
+        "similarity": {
+            "medium": 50,
+            "blocking": {"strategy": "minhash_lsh", "minhash_lsh": lsh},
+            "scoring": {"gate_cutoff": 0},
+        },
+    }
+
+
+class TestMinHashSignatures:
+    """Test MinHash signature computation."""
+
+    def test_deterministic_and_identical_for_equal_names(self):
+        """Same input gives the same signatures; equal names match exactly."""
+        first = minhash_signatures(pd.Series(NAMES), num_perm=16, seed=3)
+        second = minhash_signatures(pd.Series(NAMES), num_perm=16, seed=3)
+
+        assert first.dtype == np.uint64
+        assert np.array_equal(first, second)
+        assert np.array_equal(first[0], first[7])
+
+    def test_agreement_tracks_jaccard(self):
+        """Signature agreement is high for near-duplicates, low otherwise."""
+        sig = minhash_signatures(
+            pd.Series(["acme store", "acme stores", "zeta pharma"]),
+            num_perm=256,
+        )
+
+        near = (sig[0] == sig[1]).mean()
+        far = (sig[0] == sig[2]).mean()
+        assert near > 0.6
+        assert far < 0.2
+
+    def test_empty_names_never_collide(self):
+        """Records with no shingles emit no pairs."""
+        sig = minhash_signatures(pd.Series(["", " ", "acme"]), num_perm=8)
+        codes, sizes, _ = _band_codes(sig, bands=4, bucket_cap=10)
+
+        assert codes[:, 0].tolist() != codes[:, 1].tolist()
+        assert (sizes[:, :2] == 0).all()
+
+
+class TestLshBlocking:
+    """Test LSH candidate generation."""
+
+    def test_reordered_names_are_candidates(self):
+        """LSH pairs reordered names that first-token blocking misses."""
+        df_norm = _df_norm()
+        settings = _settings()
+
+        lsh_pairs = set(generate_candidate_pairs(df_norm, settings=settings))
+        soft_ban_pairs = set(generate_candidate_pairs_soft_ban(df_norm, settings={}))
+
+        assert (0, 1) in lsh_pairs
+        assert (3, 4) in lsh_pairs
+        assert (0, 1) not in soft_ban_pairs
+
+    def test_pairs_emitted_once_and_match_bucket_reference(self):
+        """Batches are disjoint and cover every emitting-bucket co-member pair."""
+        df_norm = _df_norm(NAMES * 3)
+        settings = _settings(batch_pairs=2)
+
+        emitted = []
+        for _, pairs in iter_lsh_blocks(df_norm, settings=settings):
+            emitted.extend(pairs)
+
+        sig = minhash_signatures(df_norm["name_core"], num_perm=32, seed=7)
+        codes, _, _ = _band_codes(sig, bands=16, bucket_cap=800)
+        n = len(df_norm)
+        expected = {
+            (a, b)
+            for a in range(n)
+            for b in range(a + 1, n)
+            if (codes[:, a] == codes[:, b]).any()
+        }
+
+        assert len(emitted) == len(set(emitted))
+        assert set(emitted) == expected
+
+    def test_bucket_cap_shards_duplicate_cluster(self):
+        """A duplicate cluster above bucket_cap is split, not dropped.
+
+        Sub-buckets hold at most bucket_cap records, each pair is emitted
+        once, and the alternating split still links the whole cluster.
+        """
+        n = 23
+        df_norm = _df_norm(["acme store"] * n + ["beta holdings"] * 2)
+        settings = _settings(num_perm=8, bands=4, bucket_cap=4)
+
+        stats = {}
+        pairs = []
+        for row, batch in iter_lsh_blocks(df_norm, settings=settings):
+            stats[row["token"]] = row
+            pairs.extend(batch)
+
+        sig = minhash_signatures(df_norm["name_core"], num_perm=8, seed=7)
+        _, sizes, _ = _band_codes(sig, bands=4, bucket_cap=4)
+        assert sizes.max() <= 4
+        assert (sizes[:, :n] > 0).all()
+
+        assert len(pairs) == len(set(pairs))
+        assert (n, n + 1) in pairs
+        cluster = np.array([p for p in pairs if p[1] < n])
+        labels = connected_component_labels(n, cluster[:, 0], cluster[:, 1])
+        assert (labels == 0).all()
+
+        # Six shards of 4, 4, 4, 4, 4, 3 keep 33 of the cluster's 253 pairs
+        assert stats["band_0"]["pairs_generated"] == 33 + 1
+        assert stats["band_1"]["pairs_generated"] == 33
+        assert all(row["pairs_capped"] == 253 - 33 for row in stats.values())
+
+    def test_unknown_strategy_raises(self):
+        """Misconfigured strategies fail loudly."""
+        settings = {"similarity": {"blocking": {"strategy": "nope"}}}
+        with pytest.raises(ValueError):
+            generate_candidate_pairs(_df_norm(), settings=settings)
+
+
+class TestLshDiagnostics:
+    """Test recall diagnostics and streaming integration."""
+
+    def test_recall_against_soft_ban(self):
+        """Recall compares LSH pairs with soft-ban pairs, orientation-free."""
+        df_norm = _df_norm()
+        settings = _settings()
+        lsh_pairs = generate_candidate_pairs(df_norm, settings=settings)
+
+        recall = lsh_recall_diagnostics(df_norm, lsh_pairs, settings)
+
+        assert recall["lsh_pairs"] == len(lsh_pairs)
+        assert 0.0 <= recall["recall"] <= 1.0
+        assert recall["shared_pairs"] + recall["lsh_only_pairs"] == recall["lsh_pairs"]
+
+    def test_recall_csv_written(self):
+        """recall_diagnostics writes blocking_recall.csv next to block stats."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            generate_candidate_pairs(
+                _df_norm(),
+                interim_dir=temp_dir,
+                settings=_settings(recall_diagnostics=True),
+            )
+            recall = pd.read_csv(Path(temp_dir) / "blocking_recall.csv")
+            stats = pd.read_csv(Path(temp_dir) / "block_stats.csv")
+
+        assert "match_recall" in recall.columns
+        assert set(stats["strategy"]) == {"minhash_lsh"}
+
+    def test_streaming_uses_lsh(self):
+        """Streaming scores exactly the LSH candidate set."""
+        df_norm = _df_norm()
+        settings = _settings(batch_pairs=1)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "candidate_pairs.parquet"
+            counts = stream_pair_scores(df_norm, settings, path)
+
+        assert counts["candidate_pairs"] == len(
+            generate_candidate_pairs(df_norm, settings=settings),
+        )
+
+    def test_streaming_writes_same_diagnostics(self):
+        """Streaming writes the same block stats and recall as the batch path."""
+        df_norm = _df_norm()
+        settings = _settings(batch_pairs=1, recall_diagnostics=True)
+
+        with tempfile.TemporaryDirectory() as batch_dir:
+            generate_candidate_pairs(df_norm, interim_dir=batch_dir, settings=settings)
+            batch_stats = pd.read_csv(Path(batch_dir) / "block_stats.csv")
+            batch_recall = pd.read_csv(Path(batch_dir) / "blocking_recall.csv")
+        with tempfile.TemporaryDirectory() as stream_dir:
+            stream_pair_scores(
+                df_norm,
+                settings,
+                Path(stream_dir) / "candidate_pairs.parquet",
+                interim_dir=stream_dir,
+            )
+            stream_stats = pd.read_csv(Path(stream_dir) / "block_stats.csv")
+            stream_recall = pd.read_csv(Path(stream_dir) / "blocking_recall.csv")
+
+        pd.testing.assert_frame_equal(stream_stats, batch_stats)
+        pd.testing.assert_frame_equal(stream_recall, batch_recall)
+        assert stream_stats["token"].is_unique
+
+    def test_merge_block_stats_by_strategy(self):
+        """Only cumulative strategies collapse repeated tokens."""
+        rows = [
+            {"token": "acme", "strategy": "soft_ban", "pairs_generated": 1},
+            {"token": "band_0", "strategy": "minhash_lsh", "pairs_generated": 1},
+            {"token": "acme", "strategy": "soft_ban", "pairs_generated": 2},
+            {"token": "band_0", "strategy": "minhash_lsh", "pairs_generated": 3},
+        ]
+
+        merged = merge_block_stats(rows)
+
+        assert [(r["token"], r["pairs_generated"]) for r in merged] == [
+            ("acme", 1),
+            ("band_0", 3),
+            ("acme", 2),
+        ]
@@ -0,0 +1,155 @@
+"""Tests for parallel soft-ban block generation.
+
+This module verifies that generating blocks across workers:
+- Emits exactly the same pairs, in the same order, as sequential blocking
+- Reports block_stats rows in the same order as sequential blocking
+- Balances blocks into work units of similar n² cost
+- Raises instead of dropping blocks when generation is interrupted
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.similarity.blocking import (
+    _balance_units,
+    _plan_block_tasks,
+    generate_candidate_pairs_soft_ban,
+    iter_candidate_blocks,
+)
+from src.utils.parallel_utils import ParallelExecutor
+
+
+def _settings() -> dict:
+    return {
+        "similarity": {
+            "blocking": {
+                "allowlist_tokens": ["acme"],
+                "allowlist_bigrams": ["blue river"],
+                "denylist_tokens": ["global"],
+                "stop_tokens": ["inc", "llc"],
+                "soft_ban": {"block_cap": 20, "max_shard_size": 8},
+            },
+        },
+    }
+
+
+def _df_norm() -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    heads = ["acme", "global", "blue river", "delta", "omega", "zeta"]
+    tails = ["foods", "supply", "logistics", "systems", "partners", "labs"]
+    names = [
+        f"{heads[rng.integers(len(heads))]} {tails[rng.integers(len(tails))]} "
+        f"{rng.integers(100)}"
+        for _ in range(300)
+    ]
+    return pd.DataFrame(
+        {
+            "account_id": [f"A{i}" for i in range(len(names))],
+            "name_core": names,
+            "suffix_class": ["NONE"] * len(names),
+        },
+    )
+
+
+def _executor() -> ParallelExecutor:
+    executor = ParallelExecutor(backend="threading", small_input_threshold=0)
+    executor.workers = 2
+    executor.backend = "threading"
+    return executor
+
+
+class TestParallelBlockingParity:
+    """Test that parallel block generation matches sequential generation."""
+
+    def test_blocks_match_sequential_order(self):
+        """Every block's stats and pairs match, in the same order."""
+        df_norm = _df_norm()
+        sequential = list(iter_candidate_blocks(df_norm, settings=_settings()))
+        parallel = list(
+            iter_candidate_blocks(
+                df_norm,
+                settings=_settings(),
+                parallel_executor=_executor(),
+            ),
+        )
+
+        assert [s for s, _ in parallel] == [s for s, _ in sequential]
+        assert {s["strategy"] for s, _ in sequential} >= {
+            "allowlisted_sharded",
+            "soft_ban_sharded",
+            "standard_sharded",
+        }
+        for (_, seq_pairs), (_, par_pairs) in zip(sequential, parallel):
+            np.testing.assert_array_equal(par_pairs.left, seq_pairs.left)
+            np.testing.assert_array_equal(par_pairs.right, seq_pairs.right)
+
+    def test_candidate_pairs_and_diagnostics_match(self):
+        """Deduplicated pairs and block_stats.csv are identical."""
+        df_norm = _df_norm()
+        with tempfile.TemporaryDirectory() as seq_dir, tempfile.TemporaryDirectory() as par_dir:
+            sequential = generate_candidate_pairs_soft_ban(
+                df_norm,
+                interim_dir=seq_dir,
+                settings=_settings(),
+            )
+            parallel = generate_candidate_pairs_soft_ban(
+                df_norm,
+                parallel_executor=_executor(),
+                interim_dir=par_dir,
+                settings=_settings(),
+            )
+            seq_stats = pd.read_csv(Path(seq_dir) / "block_stats.csv")
+            par_stats = pd.read_csv(Path(par_dir) / "block_stats.csv")
+
+        np.testing.assert_array_equal(parallel.left, sequential.left)
+        np.testing.assert_array_equal(parallel.right, sequential.right)
+        pd.testing.assert_frame_equal(par_stats, seq_stats)
+
+    def test_interrupted_generation_raises(self):
+        """A stop flag that cuts blocking short raises rather than dropping blocks."""
+        executor = _executor()
+        # Chunks run in-process (stop-flag checked between chunks); stop at once
+        executor.disable_parallel = True
+        executor.stop_flag.set()
+
+        with pytest.raises(RuntimeError, match="blocking interrupted"):
+            list(
+                iter_candidate_blocks(
+                    _df_norm(),
+                    settings=_settings(),
+                    parallel_executor=executor,
+                ),
+            )
+
+
+class TestBalanceUnits:
+    """Test cost-balanced partitioning of block tasks."""
+
+    def test_units_cover_all_tasks_with_balanced_cost(self):
+        """Each task lands in exactly one unit and unit costs stay close."""
+        tasks = _plan_block_tasks(_df_norm(), _settings())
+        units = _balance_units(tasks, 4)
+
+        seqs = sorted(task.seq for unit in units for task in unit)
+        assert seqs == list(range(len(tasks)))
+
+        costs = [sum(task.cost for task in unit) for unit in units]
+        largest = max(task.cost for task in tasks)
+        assert max(costs) - min(costs) <= largest
+
+    def test_unit_count_never_exceeds_tasks(self):
+        """Asking for more units than tasks yields one task per unit."""
+        tasks = _plan_block_tasks(_df_norm(), _settings())[:3]
+        units = _balance_units(tasks, 10)
+
+        assert len(units) == 3
+        assert all(len(unit) == 1 for unit in units)
@@ -0,0 +1,103 @@
+"""Tests for the vectorized soft-ban shard prefilter.
+
+This module verifies that _apply_prefiltering, which runs its gates over
+packed bitsets, emits exactly the pairs (and order) of the pairwise loop,
+including the max_candidates_per_record cap.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.similarity.blocking import _apply_prefiltering, _char_bigram_overlap
+
+VOCAB = ["acme", "Acme", "store", "shop", "co", "the", "7", "a", "café", "st-james"]
+
+
+def _reference(
+    shard_df: pd.DataFrame,
+    char_bigram_gate: float,
+    length_window: int,
+    min_token_overlap: int,
+    max_candidates_per_record: int,
+) -> list[tuple[int, int]]:
+    """Pairwise reference implementation of the shard prefilter."""
+    names = shard_df["name_core"].tolist()
+    indices = shard_df.index.tolist()
+    token_sets = [set(n.split()) for n in names]
+    pairs = []
+    for i in range(len(indices)):
+        candidates_for_i = 0
+        for j in range(i + 1, len(indices)):
+            if candidates_for_i >= max_candidates_per_record:
+                break
+            if abs(len(names[i]) - len(names[j])) > length_window:
+                continue
+            if len(token_sets[i] & token_sets[j]) < min_token_overlap:
+                continue
+            if _char_bigram_overlap(names[i], names[j]) < char_bigram_gate:
+                continue
+            pairs.append((indices[i], indices[j]))
+            candidates_for_i += 1
+    return pairs
+
+
+def _shard(n: int, seed: int) -> pd.DataFrame:
+    rng = random.Random(seed)
+    names = [
+        " ".join(rng.choice(VOCAB) for _ in range(rng.randint(0, 4))) for _ in range(n)
+    ]
+    return pd.DataFrame({"name_core": names}, index=rng.sample(range(10 * n), n))
+
+
+class TestPrefilterParity:
+    """Test vectorized prefiltering against the pairwise loop."""
+
+    @pytest.mark.parametrize(
+        ("gate", "window", "overlap", "cap"),
+        [
+            (0.1, 10, 1, 50),
+            (0.0, 150, 0, 3),
+            (0.4, 5, 2, 1),
+            (0.1, 10, 1, 0),
+        ],
+    )
+    def test_matches_pairwise_loop(self, gate, window, overlap, cap):
+        """Same pairs in the same order for a range of gate settings."""
+        shard_df = _shard(120, seed=cap + window)
+
+        expected = _reference(shard_df, gate, window, overlap, cap)
+        result = _apply_prefiltering(shard_df, gate, window, overlap, cap)
+
+        assert result == expected
+
+    def test_small_chunks_match(self, monkeypatch):
+        """Row chunking does not change the output."""
+        import src.similarity.blocking as blocking
+
+        shard_df = _shard(60, seed=2)
+        expected = _apply_prefiltering(shard_df, 0.1, 10, 1, 5)
+
+        monkeypatch.setattr(blocking, "_PREFILTER_CHUNK_ELEMENTS", 1)
+        assert _apply_prefiltering(shard_df, 0.1, 10, 1, 5) == expected
+
+    def test_popcount_fallback_matches(self, monkeypatch):
+        """The byte lookup-table popcount gives the same result."""
+        import src.similarity.blocking as blocking
+
+        shard_df = _shard(60, seed=4)
+        expected = _apply_prefiltering(shard_df, 0.1, 10, 1, 5)
+
+        monkeypatch.setattr(blocking, "_HAS_BITWISE_COUNT", False)
+        assert _apply_prefiltering(shard_df, 0.1, 10, 1, 5) == expected
+
+    def test_tiny_shards(self):
+        """Shards with fewer than two records yield nothing."""
+        assert _apply_prefiltering(_shard(1, seed=0), 0.1, 10, 1, 50) == []
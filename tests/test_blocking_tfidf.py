@@ -0,0 +1,210 @@
+"""Tests for the TF-IDF top-K candidate generator.
+
+This module verifies that:
+- The TF-IDF index has unit-norm rows and drops over-frequent n-grams
+- Chunked sparse similarities match a dense cosine reference
+- Each record keeps at most top_k neighbours above the cosine cutoff
+- Chunks emit every top-K pair exactly once, without a global seen set
+- Strategy dispatch, pair_scores and streaming use the generator
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.similarity import pair_scores, tfidf
+from src.similarity.blocking import generate_candidate_pairs
+from src.similarity.streaming import stream_pair_scores
+from src.similarity.tfidf import (
+    _chunk_similarities,
+    _top_k,
+    build_tfidf_index,
+    generate_candidate_pairs_tfidf,
+    iter_tfidf_blocks,
+)
+
+NAMES = [
+    "acme store",
+    "store acme",
+    "acme stores",
+    "beta holdings",
+    "holdings beta",
+    "beta holding",
+    "gamma",
+    "",
+    "acme store",
+]
+
+
+def _df_norm(names: list[str] = NAMES) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "account_id": [f"A{i}" for i in range(len(names))],
+            "name_core": names,
+            "suffix_class": ["NONE"] * len(names),
+        },
+    )
+
+
+def _settings(**overrides) -> dict:
+    tfidf = {"top_k": 5, "min_cosine": 0.3}
+    tfidf.update(overrides)
+    return {
+        "similarity": {
+            "medium": 50,
+            "blocking": {"strategy": "tfidf_topk", "tfidf_topk": tfidf},
+            "scoring": {"gate_cutoff": 0},
+        },
+    }
+
+
+def _dense(index) -> np.ndarray:
+    matrix = np.zeros((index.n_records, index.n_terms))
+    rows = np.repeat(np.arange(index.n_records), np.diff(index.indptr))
+    matrix[rows, index.indices] = index.data
+    return matrix
+
+
+class TestTfidfIndex:
+    """Test TF-IDF vectorization."""
+
+    def test_rows_are_unit_norm(self):
+        """Non-empty rows are L2-normalized; empty names have no entries."""
+        index = build_tfidf_index(pd.Series(NAMES))
+        norms = np.linalg.norm(_dense(index), axis=1)
+
+        assert np.allclose(norms[[i for i, n in enumerate(NAMES) if n]], 1.0)
+        assert norms[NAMES.index("")] == 0.0
+
+    def test_max_df_drops_frequent_ngrams(self):
+        """N-grams in more than max_df records are removed from the index."""
+        index = build_tfidf_index(pd.Series(NAMES), max_df=2)
+
+        assert np.diff(index.term_indptr).max() <= 2
+
+    @pytest.mark.parametrize("dense_cells", [0, 1_000])
+    def test_chunk_similarities_match_dense_cosine(self, monkeypatch, dense_cells):
+        """Sorted and dense accumulation both equal the dense cosine matrix."""
+        monkeypatch.setattr(tfidf, "_DENSE_CELLS_PER_PRODUCT", dense_cells)
+        index = build_tfidf_index(pd.Series(NAMES))
+        dense = _dense(index)
+        expected = dense[2:6] @ dense.T
+
+        rows, cols, sims = _chunk_similarities(index, 2, 6)
+        actual = np.zeros_like(expected)
+        actual[rows - 2, cols] = sims
+
+        assert np.allclose(actual, expected)
+
+
+class TestTopKCandidates:
+    """Test top-K neighbour pair generation."""
+
+    def test_reordered_names_are_candidates(self):
+        """Token order does not matter, unlike first-token blocking."""
+        pairs = generate_candidate_pairs(_df_norm(), settings=_settings())
+        found = set(pairs)
+
+        assert (0, 1) in found
+        assert (3, 4) in found
+        assert all(a < b for a, b in found)
+        assert not any(NAMES.index("") in pair for pair in found)
+
+    def test_top_k_bounds_neighbours(self):
+        """No record gains more than top_k neighbours from its own row."""
+        names = [f"acme store {i}" for i in range(30)]
+        pairs = generate_candidate_pairs_tfidf(
+            _df_norm(names),
+            settings=_settings(top_k=2, min_cosine=0.0),
+        )
+
+        assert len(pairs) <= 2 * len(names)
+        assert len(pairs) >= len(names)
+
+    def test_chunking_does_not_change_pairs(self):
+        """Tiny and large chunk budgets produce the same pair set."""
+        df_norm = _df_norm()
+        small = generate_candidate_pairs_tfidf(
+            df_norm,
+            settings=_settings(chunk_products=1),
+        )
+        large = generate_candidate_pairs_tfidf(df_norm, settings=_settings())
+
+        assert list(small) == list(large)
+
+    @pytest.mark.parametrize("backend", ["scipy", "numpy"])
+    @pytest.mark.parametrize("dense_cells", [0, 1_000])
+    def test_chunks_emit_each_pair_once(self, monkeypatch, backend, dense_cells):
+        """One-row chunks yield each top-K pair once, found from either end."""
+        monkeypatch.setattr(tfidf, "_DENSE_CELLS_PER_PRODUCT", dense_cells)
+        if backend == "numpy":
+            monkeypatch.setattr(tfidf, "sp", None)
+        elif tfidf.sp is None:
+            pytest.skip("SciPy not installed")
+        rng = np.random.default_rng(7)
+        words = ["acme", "store", "beta", "holding", "north", "star", "blue"]
+        names = [" ".join(rng.choice(words, rng.integers(1, 4))) for _ in range(80)]
+
+        index = build_tfidf_index(pd.Series(names))
+        rows, cols, sims = _chunk_similarities(index, 0, index.n_records)
+        rows, cols, _, _ = _top_k(rows, cols, sims, 3, 0.3)
+        expected = set(zip(np.minimum(rows, cols), np.maximum(rows, cols)))
+
+        emitted = [
+            pair
+            for _, pairs in iter_tfidf_blocks(
+                _df_norm(names),
+                settings=_settings(top_k=3, chunk_products=1),
+            )
+            for pair in pairs
+        ]
+
+        assert len(emitted) == len(set(emitted))
+        assert set(emitted) == expected
+
+    def test_block_stats_written(self):
+        """Each chunk reports one block_stats row."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            generate_candidate_pairs(
+                _df_norm(),
+                interim_dir=temp_dir,
+                settings=_settings(chunk_products=1),
+            )
+            stats = pd.read_csv(Path(temp_dir) / "block_stats.csv")
+
+        assert set(stats["strategy"]) == {"tfidf_topk"}
+        assert stats["count"].sum() == len(NAMES)
+
+
+class TestTfidfIntegration:
+    """Test scoring integration."""
+
+    def test_pair_scores_schema(self):
+        """pair_scores keeps its output schema with TF-IDF candidates."""
+        result = pair_scores(_df_norm(), _settings())
+
+        assert {"id_a", "id_b", "score", "ratio_name", "jaccard"} <= set(
+            result.columns,
+        )
+        assert len(result) > 0
+
+    def test_streaming_uses_tfidf(self):
+        """Streaming scores exactly the TF-IDF candidate set."""
+        df_norm = _df_norm()
+        settings = _settings(chunk_products=1)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "candidate_pairs.parquet"
+            counts = stream_pair_scores(df_norm, settings, path)
+
+        assert counts["candidate_pairs"] == len(
+            generate_candidate_pairs(df_norm, settings=settings),
+        )
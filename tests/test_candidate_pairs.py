@@ -0,0 +1,120 @@
+"""Tests for the columnar CandidatePairs representation.
+
+This module verifies that:
+- Positions are stored as contiguous int32 arrays
+- Block expansion and dedup match itertools/set semantics
+- Scorers accept both CandidatePairs and label-tuple lists
+"""
+
+import sys
+from itertools import combinations
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.similarity.pairs import CandidatePairs
+from src.similarity.scoring import score_pairs_bulk, score_pairs_parallel
+
+
+class TestCandidatePairs:
+    """Test construction and set operations on CandidatePairs."""
+
+    def test_arrays_are_int32(self):
+        """Both sides are coerced to int32."""
+        pairs = CandidatePairs(np.array([0, 1]), np.array([2, 3], dtype=np.int64))
+
+        assert pairs.left.dtype == np.int32
+        assert pairs.right.dtype == np.int32
+        assert pairs.nbytes == 16
+
+    def test_mismatched_lengths_raise(self):
+        """Left and right must have the same length."""
+        with pytest.raises(ValueError):
+            CandidatePairs(np.array([0, 1]), np.array([2]))
+
+    def test_all_pairs_matches_combinations(self):
+        """Block expansion follows itertools.combinations order."""
+        positions = np.array([7, 2, 9, 4])
+        pairs = CandidatePairs.all_pairs(positions)
+
+        assert list(pairs) == list(combinations(positions.tolist(), 2))
+
+    def test_unique_matches_set_semantics(self):
+        """Duplicates are dropped but reversed pairs are kept."""
+        raw = [(3, 1), (0, 2), (3, 1), (1, 3), (0, 2)]
+        pairs = CandidatePairs.from_tuples(raw).unique()
+
+        assert set(pairs) == set(raw)
+        assert list(pairs) == sorted(set(raw))
+
+    def test_concat_and_slice(self):
+        """Concatenation preserves order and slices are pair sets."""
+        a = CandidatePairs.from_tuples([(0, 1)])
+        b = CandidatePairs.from_tuples([(2, 3), (4, 5)])
+        merged = CandidatePairs.concat([a, CandidatePairs.empty(), b])
+
+        assert list(merged) == [(0, 1), (2, 3), (4, 5)]
+        assert list(merged[1:]) == [(2, 3), (4, 5)]
+
+    def test_label_round_trip(self):
+        """Labels map to positions and back."""
+        index = pd.Index([10, 3, 7])
+        pairs = CandidatePairs.from_labels(index, [(10, 7), (3, 10)])
+
+        assert list(pairs) == [(0, 2), (1, 0)]
+        assert pairs.to_labels(index) == [(10, 7), (3, 10)]
+
+    def test_unknown_label_raises(self):
+        """Labels missing from the index are rejected."""
+        with pytest.raises(KeyError):
+            CandidatePairs.from_labels(pd.Index([0, 1]), [(0, 5)])
+
+
+class TestScorerInputs:
+    """Test that scorers accept positional pairs and label tuples alike."""
+
+    def _df(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "account_id": ["A1", "A2", "A3"],
+                "name_core": ["acme corp", "acme corporation", "acme corp"],
+                "suffix_class": ["INC", "INC", "INC"],
+            },
+            index=[10, 3, 7],
+        )
+
+    @pytest.mark.parametrize("scorer", [score_pairs_bulk, score_pairs_parallel])
+    def test_positions_and_labels_agree(self, scorer):
+        """CandidatePairs positions and label tuples yield identical scores."""
+        df_norm = self._df()
+        settings = {"similarity": {"scoring": {"gate_cutoff": 0}}}
+        labels = [(10, 3), (10, 7)]
+        positions = CandidatePairs.from_labels(df_norm.index, labels)
+
+        from_labels = scorer(df_norm, labels, settings)
+        from_positions = scorer(df_norm, positions, settings)
+
+        assert from_labels == from_positions
+        assert [(r["id_a"], r["id_b"]) for r in from_positions] == [
+            ("A1", "A2"),
+            ("A1", "A3"),
+        ]
+
+
+class TestPackedKeys:
+    """Test packed-key helpers used for cross-block dedup."""
+
+    def test_drop_keys_removes_seen_pairs(self):
+        """Only pairs whose exact (left, right) key was seen are dropped."""
+        seen = CandidatePairs.from_tuples([(0, 1), (5, 9)]).packed_keys()
+        pairs = CandidatePairs.from_tuples([(0, 1), (1, 0), (5, 9), (9, 10)])
+
+        kept = pairs.drop_keys(np.sort(seen))
+
+        assert list(kept) == [(1, 0), (9, 10)]
@@ -0,0 +1,136 @@
+"""Tests for the DuckDB exact-equals backend.
+
+The DuckDB pass must produce the same groups, map, pairs and unique
+dataset as the pandas implementation, from DataFrames and from files.
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.exact_equals import (
+    create_unique_normalized,
+    find_exact_equals_groups,
+)
+from src.utils.exact_equals_duckdb import DuckDBExactEquals
+
+NAMES = [
+    "Acme  Inc",
+    " Acme Inc",
+    "Acme\tInc",
+    "Acme Inc",
+    "Blue",
+    "   ",
+    "",
+    None,
+    "Zed Co",
+    "Zed Co",
+    "Zed\u00a0 Co\u2003",
+    "Solo",
+]
+IDS = ["B2", "B1", "A7", "B1", "C1", "C2", "C3", "C4", "D9", "D1", "D5", "E1"]
+
+
+def _settings(**overrides: object) -> dict:
+    return {"pipeline": {"exact_equals_first_pass": dict(overrides)}}
+
+
+def _accounts() -> pd.DataFrame:
+    df = pd.DataFrame(
+        {
+            "account_id": pd.Series(IDS, dtype="string"),
+            "Account Name": pd.Series(NAMES, dtype=object),
+            "extra": range(len(IDS)),
+        },
+    )
+    # A non-default index, as left behind by earlier filtering stages
+    df.index = range(100, 100 + len(IDS))
+    return df
+
+
+@pytest.mark.parametrize("key_trim", [True, False])
+@pytest.mark.parametrize("policy", ["min_account_id", "first"])
+@pytest.mark.parametrize("min_group_size", [1, 2, 3])
+def test_dataframe_parity(key_trim: bool, policy: str, min_group_size: int) -> None:
+    """Groups, map, pairs and the unique dataset match the pandas backend."""
+    df = _accounts()
+    settings = _settings(
+        key_trim=key_trim,
+        representative_policy=policy,
+        min_group_size=min_group_size,
+    )
+    expected = find_exact_equals_groups(df, settings)
+
+    with DuckDBExactEquals(df, settings) as engine:
+        actual = engine.find_groups()
+        unique_df = engine.unique_normalized()
+
+    for got, want in zip(actual, expected):
+        pd.testing.assert_frame_equal(got, want, check_dtype=False)
+    pd.testing.assert_frame_equal(
+        unique_df,
+        create_unique_normalized(df, expected[1], settings),
+    )
+
+
+@pytest.mark.parametrize("suffix", ["parquet", "csv"])
+def test_file_source_and_artifacts(tmp_path, suffix: str) -> None:
+    """File inputs are grouped in DuckDB and artifacts are COPY'd to Parquet."""
+    df = _accounts().dropna(subset=["Account Name"])
+    df = df[df["Account Name"].str.strip() != ""].reset_index(drop=True)
+    source = tmp_path / f"accounts.{suffix}"
+    if suffix == "parquet":
+        df.to_parquet(source, index=False)
+    else:
+        df.to_csv(source, index=False)
+    settings = _settings()
+    groups, raw_map, pairs = find_exact_equals_groups(df, settings)
+
+    with DuckDBExactEquals(source, settings) as engine:
+        engine.write_artifacts(str(tmp_path), "test_run")
+        engine.write_artifacts(str(tmp_path), "test_run")
+        rows = engine.write_unique_normalized(str(tmp_path / "unique.parquet"))
+
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(tmp_path / "raw_exact_map.parquet"),
+        raw_map,
+        check_dtype=False,
+    )
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(tmp_path / "candidate_pairs_exact_raw.parquet"),
+        pairs,
+        check_dtype=False,
+    )
+    written = pd.read_parquet(tmp_path / "exact_raw_groups.parquet")
+    assert written["raw_exact_key"].tolist() == groups["raw_exact_key"].tolist()
+    assert [list(ids) for ids in written["all_account_ids"]] == groups[
+        "all_account_ids"
+    ].tolist()
+
+    # The second write falls back to timestamped names (no-overwrite policy)
+    assert len(list(tmp_path.glob("raw_exact_map*.parquet"))) == 2
+
+    unique_df = create_unique_normalized(df, raw_map, settings)
+    assert rows == len(unique_df)
+    assert (
+        pd.read_parquet(tmp_path / "unique.parquet")["account_id"].tolist()
+        == unique_df["account_id"].tolist()
+    )
+
+
+def test_no_groups() -> None:
+    """Without groups the frames are empty and the input is returned as is."""
+    df = pd.DataFrame({"account_id": ["A1", "A2"], "Account Name": ["Acme", "Blue"]})
+
+    with DuckDBExactEquals(df, _settings()) as engine:
+        frames = engine.find_groups()
+        unique_df = engine.unique_normalized()
+
+    assert all(frame.empty for frame in frames)
+    assert unique_df is df
@@ -12,6 +12,7 @@ import pytest
 
 from src.utils.exact_equals import (
     build_raw_exact_key,
+    build_raw_exact_keys,
     create_unique_normalized,
     find_exact_equals_groups,
 )
@@ -183,5 +184,59 @@ def test_min_group_size_filtering() -> None:
     assert exact_groups.iloc[0]["group_size"] == 3
 
 
+def test_vectorized_keys_match_scalar_keys() -> None:
+    """Test the column key builder matches build_raw_exact_key per value."""
+    names = pd.Series(
+        ["  Acme   Inc ", "Acme\tInc", "   ", "", None, 42, "Zed\u00a0 Co"],
+        dtype=object,
+    )
+    for key_trim in (True, False):
+        settings = {"pipeline": {"exact_equals_first_pass": {"key_trim": key_trim}}}
+        expected = [build_raw_exact_key(name, settings) for name in names]
+        assert build_raw_exact_keys(names, settings).tolist() == expected
+
+
+def test_group_order_representatives_and_pairs() -> None:
+    """Test key-ordered groups, first-on-tie representatives and pair order."""
+    settings = {
+        "pipeline": {
+            "exact_equals_first_pass": {
+                "min_group_size": 2,
+                "representative_policy": "min_account_id",
+            },
+        },
+    }
+    df = pd.DataFrame(
+        {
+            "account_id": ["B3", "B1", "A9", "B1", "A2", "C1"],
+            "Account Name": ["Zeta", "Zeta ", "Acme", "Zeta", " Acme", "Solo"],
+        },
+    )
+
+    exact_groups, raw_map, candidate_pairs = find_exact_equals_groups(df, settings)
+
+    assert exact_groups["raw_exact_key"].tolist() == ["Acme", "Zeta"]
+    assert exact_groups["all_account_ids"].tolist() == [
+        ["A9", "A2"],
+        ["B3", "B1", "B1"],
+    ]
+    assert exact_groups["representative_id"].tolist() == ["A2", "B1"]
+    # The first B1 (named "Zeta ") wins the tie
+    assert exact_groups["representative_name"].tolist() == [" Acme", "Zeta "]
+
+    assert raw_map["account_id"].tolist() == ["A9", "A2", "B3", "B1", "B1"]
+    assert raw_map["representative_id"].tolist() == ["A2", "A2", "B1", "B1", "B1"]
+    assert raw_map["group_size"].tolist() == [2, 2, 3, 3, 3]
+
+    assert list(zip(candidate_pairs["id_a"], candidate_pairs["id_b"])) == [
+        ("A9", "A2"),
+        ("B3", "B1"),
+        ("B3", "B1"),
+        ("B1", "B1"),
+    ]
+    assert (candidate_pairs["score"] == 100.0).all()
+    assert (candidate_pairs["group_join_reason"] == "exact_equal_raw").all()
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,56 @@
+"""Tests for single-pass group metadata in disposition."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.disposition import _is_blacklisted, compute_group_metadata
+
+NAMES = [
+    "Acme Inc",
+    "temp co",
+    "TEST",
+    "Contest Corp",
+    "the and of",
+    "..!!",
+    "ab",
+    "x" * 120,
+    "No Paystub LLC",
+    None,
+    "",
+    "Blue River",
+]
+
+
+def test_metadata_matches_per_group_checks():
+    """Sizes, suffix classes, primaries and blacklist hits match per group."""
+    rng = np.random.default_rng(3)
+    n = 500
+    df = pd.DataFrame(
+        {
+            "group_id": rng.choice([-1, *range(80)], n),
+            "account_name": rng.choice(np.array(NAMES, dtype=object), n),
+            "suffix_class": rng.choice(np.array(["INC", "LLC", None]), n),
+            "is_primary": rng.random(n) < 0.4,
+        },
+    )
+
+    metadata = compute_group_metadata(df)
+
+    assigned = df[df["group_id"] != -1]
+    assert list(metadata) == assigned["group_id"].unique().tolist()
+    for group_id, group_data in assigned.groupby("group_id"):
+        suffix_classes = group_data["suffix_class"].unique()
+        assert metadata[group_id] == {
+            "group_size": len(group_data),
+            "has_suffix_mismatch": len(suffix_classes) > 1,
+            "blacklist_hits": group_data["account_name"].apply(_is_blacklisted).sum(),
+            "suffix_classes": list(suffix_classes),
+            "has_primary": group_data["is_primary"].any(),
+        }
@@ -1,9 +1,14 @@
 """Tests for grouping functionality with edge-gating and stable group IDs."""
 
+import ast
+import json
 import sys
+from collections import defaultdict
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pytest
 
 # Add src to path for imports
 sys.path.append(str(Path(__file__).parent.parent / "src"))
@@ -14,7 +19,12 @@ from src.edge_grouping import (
     create_groups_standard,
     create_groups_with_edge_gating,
 )
-from src.utils.hash_utils import config_hash, stable_group_id
+from src.utils.hash_utils import (
+    config_hash,
+    stable_group_id,
+    stable_group_id_for_hash,
+)
+from src.utils.parallel_utils import ParallelExecutor
 
 
 class TestConfigHash:
@@ -78,6 +88,16 @@ class TestStableGroupId:
 
         assert id1 != id2
 
+    def test_stable_group_id_for_precomputed_hash(self) -> None:
+        """Test that a precomputed config hash gives the same group ID."""
+        member_ids = ["789", "123", "456"]
+        config = {"similarity": {"high": 92}}
+
+        assert stable_group_id_for_hash(
+            member_ids,
+            config_hash(config),
+        ) == stable_group_id(member_ids, config)
+
 
 class TestCanJoinGroup:
     """Test edge-gating logic."""
@@ -338,6 +358,88 @@ class TestGroupCreation:
         group_ids = groups_df["group_id"].unique()
         assert len(group_ids) == 2  # Two groups: one with 123+456, one with 789
 
+    def test_group_ids_cover_whole_components(self) -> None:
+        """Test that chained joins give every member the full component."""
+        accounts_df = pd.DataFrame(
+            {
+                "account_id": ["001A", "001B", "001C", "001D"],
+                "name_core": ["acme", "acme", "acme", "other"],
+                "name_core_tokens": [["acme"], ["acme"], ["acme"], ["other"]],
+            },
+        )
+        pairs_df = pd.DataFrame(
+            {
+                "id_a": ["001A", "001B"],
+                "id_b": ["001B", "001C"],
+                "score": [95.0, 96.0],
+            },
+        )
+        config = {"similarity": {"high": 92, "medium": 84}}
+
+        groups_df = create_groups_with_edge_gating(
+            accounts_df,
+            pairs_df,
+            config,
+            set(),
+        ).set_index("account_id")
+
+        expected_id = stable_group_id(["001A", "001B", "001C"], config)
+        assert (
+            groups_df.loc[["001A", "001B", "001C"], "group_id"] == expected_id
+        ).all()
+        assert groups_df["group_size"].tolist() == [3, 3, 3, 1]
+        assert groups_df["is_primary"].tolist() == [True, False, False, True]
+        assert groups_df.loc["001D", "group_id"] == stable_group_id(["001D"], config)
+
+    def test_edge_gating_native_token_lists(self) -> None:
+        """Test native token lists (as read from Parquet) match JSON tokens."""
+        ids = ["001Hs000054S8kI", "001Hs000054SAQt", "001Hs000054SDWt"]
+        tokens = [["company", "inc"], ["company", "llc"], ["different", "corp"]]
+        pairs_df = pd.DataFrame(
+            {
+                "account_id_1": [ids[0], ids[0]],
+                "account_id_2": [ids[1], ids[2]],
+                "score": [90.0, 85.0],
+            },
+        )
+        config = {
+            "similarity": {"high": 92, "medium": 84},
+            "grouping": {
+                "edge_gating": {
+                    "enabled": True,
+                    "allow_medium_plus_shared_token": True,
+                },
+            },
+        }
+        stop_tokens = {"inc", "llc", "corp"}
+
+        results = []
+        for token_values in (
+            [json.dumps(t) for t in tokens],
+            [np.array(t, dtype=object) for t in tokens],
+        ):
+            accounts_df = pd.DataFrame(
+                {
+                    "account_id": ids,
+                    "name_core": ["company inc", "company llc", "different corp"],
+                    "name_core_tokens": token_values,
+                },
+            )
+            results.append(
+                create_groups_with_edge_gating(
+                    accounts_df,
+                    pairs_df,
+                    config,
+                    stop_tokens,
+                ),
+            )
+
+        pd.testing.assert_frame_equal(
+            results[0].drop(columns="name_core_tokens"),
+            results[1].drop(columns="name_core_tokens"),
+        )
+        assert results[1]["group_id"].nunique() == 2
+
     def test_create_groups_standard_fallback(self) -> None:
         """Test standard group creation as fallback."""
         # Create test data
@@ -369,3 +471,325 @@ class TestGroupCreation:
         assert "group_id" in groups_df.columns
         assert "group_join_reason" in groups_df.columns
         assert groups_df["group_join_reason"].iloc[0] == "standard_grouping"
+
+
+def _original_edge_gating(
+    pairs_df: pd.DataFrame,
+    token_sets: dict[str, set[str]],
+    config: dict,
+    stop_tokens: set[str],
+) -> tuple[dict[str, str], dict[str, tuple[str, float]]]:
+    """Original per-pair gating loop with ``maintain_unionfind_size`` off.
+
+    Exact-equals members are filed under ``find(id1)`` at union time and
+    the canopy bound counts the members filed under the primary.
+
+    Returns:
+        Root of every account and (reason, score) of each joined candidate
+
+    """
+    parent = {i: i for i in token_sets}
+    rank = dict.fromkeys(token_sets, 0)
+
+    def find(x: str) -> str:
+        while parent[x] != x:
+            x = parent[x]
+        return x
+
+    def union(x: str, y: str) -> None:
+        px, py = find(x), find(y)
+        if px == py:
+            return
+        if rank[px] < rank[py]:
+            parent[px] = py
+        elif rank[px] > rank[py]:
+            parent[py] = px
+        elif px < py:
+            parent[py] = px
+            rank[px] += 1
+        else:
+            parent[px] = py
+            rank[py] += 1
+
+    edge_scores = dict(
+        zip(zip(pairs_df["id_a"], pairs_df["id_b"]), pairs_df["score"]),
+    )
+    group_members: dict[str, list[str]] = defaultdict(list)
+    is_exact = pairs_df["group_join_reason"] == "exact_equal_raw"
+    for id1, id2 in zip(pairs_df.loc[is_exact, "id_a"], pairs_df.loc[is_exact, "id_b"]):
+        union(id1, id2)
+        group_members[find(id1)].extend([id1, id2])
+
+    explain: dict[str, tuple[str, float]] = {}
+    ordered = pairs_df[~is_exact].sort_values(["score", "id_a", "id_b"])
+    for id1, id2 in zip(ordered["id_a"], ordered["id_b"]):
+        if find(id1) == find(id2):
+            continue
+        primary_id, candidate_id = min(id1, id2), max(id1, id2)
+        can_join, reason, score = can_join_group(
+            primary_id,
+            candidate_id,
+            edge_scores,
+            token_sets,
+            config,
+            stop_tokens,
+        )
+        if not can_join or not apply_canopy_bound(
+            len(group_members[primary_id]) + 1,
+            primary_id,
+            candidate_id,
+            edge_scores,
+            config,
+        ):
+            continue
+        union(primary_id, candidate_id)
+        group_members[primary_id].append(candidate_id)
+        explain[candidate_id] = (reason, score)
+
+    return {node: find(node) for node in parent}, explain
+
+
+class TestGatingKernel:
+    """Test the array gating kernel against the per-pair helpers."""
+
+    @pytest.mark.parametrize(
+        "performance",
+        [{}, {"jit_kernel": True}, {"parallel_components": True}],
+    )
+    def test_matches_original_loop_without_size_tracking(
+        self,
+        performance: dict,
+    ) -> None:
+        """Groups, primaries and explain columns match the original loop.
+
+        Runs with size tracking off and a small canopy bound, with
+        exact-equals pairs mixed in, so canopy decisions depend on which
+        node each exact-equals pair was filed under.
+        """
+        words = ["acme", "blue", "river", "co", "inc", "north"]
+        stop_tokens = {"inc"}
+        executor = ParallelExecutor(backend="threading", small_input_threshold=0)
+        executor.workers = 2
+        executor.backend = "threading"
+
+        for seed in range(40):
+            rng = np.random.default_rng(seed)
+            n = int(rng.integers(8, 40))
+            ids = [f"001{i:05d}" for i in rng.permutation(n)]
+            tokens = [list(rng.choice(words, rng.integers(0, 3))) for _ in ids]
+            accounts_df = pd.DataFrame(
+                {
+                    "account_id": ids,
+                    "name_core": [" ".join(t) for t in tokens],
+                    "name_core_tokens": tokens,
+                },
+            )
+            left = rng.integers(0, n, 3 * n)
+            right = rng.integers(0, n, 3 * n)
+            pairs_df = pd.DataFrame(
+                {
+                    "id_a": [ids[i] for i in left],
+                    "id_b": [ids[j] for j in right],
+                    "score": rng.choice([80.0, 84.0, 86.0, 90.0, 92.0, 95.0], 3 * n),
+                    "group_join_reason": np.where(
+                        rng.random(3 * n) < 0.3,
+                        "exact_equal_raw",
+                        "",
+                    ),
+                },
+            )
+            pairs_df = pairs_df[pairs_df["id_a"] != pairs_df["id_b"]]
+            pairs_df = pairs_df.drop_duplicates(["id_a", "id_b"])
+            pairs_df.loc[pairs_df["group_join_reason"] != "", "score"] = 100.0
+            config = {
+                "similarity": {"high": 92, "medium": 84},
+                "grouping": {
+                    "edge_gating": {
+                        "enabled": True,
+                        "canopy_bound": {
+                            "enabled": True,
+                            "max_without_high_edge": int(rng.integers(2, 5)),
+                        },
+                        "performance": {
+                            "maintain_unionfind_size": False,
+                            **performance,
+                        },
+                    },
+                },
+            }
+
+            roots, explain = _original_edge_gating(
+                pairs_df,
+                {i: set(t) for i, t in zip(ids, tokens)},
+                config,
+                stop_tokens,
+            )
+            groups_df = create_groups_with_edge_gating(
+                accounts_df,
+                pairs_df,
+                config,
+                stop_tokens,
+                parallel_executor=executor,
+            ).set_index("account_id")
+
+            group_of = groups_df["group_id"]
+            for node in ids:
+                for other in ids:
+                    same_reference = roots[node] == roots[other]
+                    assert (group_of[node] == group_of[other]) == same_reference
+            for node in ids:
+                row = groups_df.loc[node]
+                reason, score = explain.get(node, ("primary", 0.0))
+                assert row["is_primary"] == (roots[node] == node), (seed, node)
+                assert row["group_join_reason"] == reason, (seed, node)
+                assert row["weakest_edge_to_primary"] == score, (seed, node)
+
+    def test_kernel_matches_per_pair_decisions(self, caplog) -> None:
+        """Unions and gating reason counts match can_join_group/apply_canopy_bound."""
+        rng = np.random.default_rng(11)
+        ids = [f"001{i:05d}" for i in range(60)]
+        words = ["acme", "blue", "river", "co", "inc", "the"]
+        tokens = [list(rng.choice(words, rng.integers(1, 3))) for _ in ids]
+        accounts_df = pd.DataFrame(
+            {
+                "account_id": ids,
+                "name_core": [" ".join(t) for t in tokens],
+                "name_core_tokens": tokens,
+            },
+        )
+        left = rng.integers(0, 60, 150)
+        right = rng.integers(0, 60, 150)
+        pairs_df = pd.DataFrame(
+            {
+                "id_a": [ids[i] for i in left],
+                "id_b": [ids[j] for j in right],
+                "score": rng.integers(80, 101, 150).astype(float),
+            },
+        )
+        pairs_df = pairs_df[pairs_df["id_a"] != pairs_df["id_b"]].drop_duplicates(
+            ["id_a", "id_b"],
+        )
+        config = {
+            "similarity": {"high": 95, "medium": 84},
+            "grouping": {
+                "edge_gating": {
+                    "enabled": True,
+                    "canopy_bound": {"enabled": True, "max_without_high_edge": 3},
+                    "performance": {"maintain_unionfind_size": True},
+                },
+            },
+        }
+        stop_tokens = {"the", "inc"}
+
+        # Reference: the original per-pair loop over the helpers
+        edge_scores = dict(
+            zip(zip(pairs_df["id_a"], pairs_df["id_b"]), pairs_df["score"]),
+        )
+        token_sets = {i: set(t) for i, t in zip(ids, tokens)}
+        parent = {i: i for i in ids}
+
+        def find(x: str) -> str:
+            while parent[x] != x:
+                x = parent[x]
+            return x
+
+        reasons: dict[str, int] = {}
+        ordered = pairs_df.sort_values(["score", "id_a", "id_b"])
+        for id1, id2 in zip(ordered["id_a"], ordered["id_b"]):
+            if find(id1) == find(id2):
+                continue
+            primary_id, candidate_id = min(id1, id2), max(id1, id2)
+            can_join, reason, _ = can_join_group(
+                primary_id,
+                candidate_id,
+                edge_scores,
+                token_sets,
+                config,
+                stop_tokens,
+            )
+            reasons[reason] = reasons.get(reason, 0) + 1
+            size = sum(find(node) == find(primary_id) for node in ids)
+            if can_join and apply_canopy_bound(
+                size,
+                primary_id,
+                candidate_id,
+                edge_scores,
+                config,
+            ):
+                parent[find(candidate_id)] = find(primary_id)
+
+        with caplog.at_level("INFO", logger="src.edge_grouping"):
+            groups_df = create_groups_with_edge_gating(
+                accounts_df,
+                pairs_df,
+                config,
+                stop_tokens,
+            )
+
+        breakdown = next(
+            r.getMessage()
+            for r in caplog.records
+            if "edge_gating_breakdown" in r.getMessage()
+        )
+        assert ast.literal_eval(breakdown.split("reasons=")[1]) == reasons
+
+        group_of = groups_df.set_index("account_id")["group_id"]
+        for node in ids:
+            for other in ids:
+                same_reference = find(node) == find(other)
+                assert (group_of[node] == group_of[other]) == same_reference
+
+    def test_parallel_components_match_sequential(self) -> None:
+        """Gating components across workers gives the same groups."""
+        rng = np.random.default_rng(23)
+        ids = [f"001{i:05d}" for i in range(300)]
+        words = ["acme", "blue", "river", "co", "inc", "the", "north", "star"]
+        tokens = [list(rng.choice(words, rng.integers(1, 3))) for _ in ids]
+        accounts_df = pd.DataFrame(
+            {
+                "account_id": ids,
+                "name_core": [" ".join(t) for t in tokens],
+                "name_core_tokens": tokens,
+            },
+        )
+        left = rng.integers(0, 300, 400)
+        right = rng.integers(0, 300, 400)
+        pairs_df = pd.DataFrame(
+            {
+                "id_a": [ids[i] for i in left],
+                "id_b": [ids[j] for j in right],
+                "score": rng.integers(80, 101, 400).astype(float),
+            },
+        ).drop_duplicates(["id_a", "id_b"])
+        config = {
+            "similarity": {"high": 95, "medium": 84},
+            "grouping": {
+                "edge_gating": {
+                    "canopy_bound": {"enabled": True, "max_without_high_edge": 3},
+                    "performance": {
+                        "maintain_unionfind_size": True,
+                        "parallel_components": True,
+                    },
+                },
+            },
+        }
+        executor = ParallelExecutor(backend="threading", small_input_threshold=0)
+        executor.workers = 2
+        executor.backend = "threading"
+
+        sequential = create_groups_with_edge_gating(
+            accounts_df,
+            pairs_df,
+            config,
+            {"the", "inc"},
+        )
+        parallel = create_groups_with_edge_gating(
+            accounts_df,
+            pairs_df,
+            config,
+            {"the", "inc"},
+            parallel_executor=executor,
+        )
+
+        pd.testing.assert_frame_equal(sequential, parallel)
+        assert sequential["group_id"].nunique() < len(ids)
@@ -1,15 +1,26 @@
 """Tests for name normalization functionality."""
 
 import sys
+import tempfile
 import unittest
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 # Add src directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 
-from src.normalize import excel_serial_to_datetime, normalize_dataframe, normalize_name
+from src.normalize import (
+    excel_serial_to_datetime,
+    extract_suffix,
+    get_name_matcher,
+    normalize_dataframe,
+    normalize_name,
+)
+from src.utils.parallel_utils import ParallelExecutor
+from src.utils.perf_utils import parse_name_core_tokens
 
 
 class TestNormalize(unittest.TestCase):
@@ -237,6 +248,123 @@ class TestNormalize(unittest.TestCase):
         self.assertEqual(result.name_core, "don roberto jewelers")
         # The (1) should be removed from the core name for scoring
 
+    def test_custom_suffix_table(self) -> None:
+        """Test suffix and blacklist entries from settings."""
+        settings = {
+            "legal_suffixes": {"S.A.": "SA", "Sociedad Anonima": "SA"},
+            "parentheses_blacklist": ["Subsidiary"],
+        }
+        matcher = get_name_matcher(settings)
+
+        # Compiled once per configuration; defaults are shared
+        self.assertIs(get_name_matcher(dict(settings)), matcher)
+        self.assertIs(get_name_matcher({}), get_name_matcher(None))
+
+        self.assertEqual(extract_suffix("acme s.a.", matcher), ("SA", "acme"))
+        self.assertEqual(
+            extract_suffix("acme sociedad anonima", matcher),
+            ("SA", "acme"),
+        )
+        self.assertEqual(extract_suffix("acme inc", matcher), ("INC", "acme"))
+        self.assertEqual(extract_suffix("acme s.a."), ("NONE", "acme s.a."))
+
+        name = "Acme Holdings (Big Foods Subsidiary)"
+        self.assertEqual(
+            normalize_name(name).alias_candidates, ["Big Foods Subsidiary"]
+        )
+        self.assertEqual(normalize_name(name, matcher).alias_candidates, [])
+
+        df = pd.DataFrame({"Account Name": ["Acme Sociedad Anonima", name]})
+        result = normalize_dataframe(df, "Account Name", settings)
+        self.assertEqual(result["suffix_class"].tolist(), ["SA", "NONE"])
+        self.assertEqual(result["name_core"].iloc[0], "acme")
+        self.assertEqual(result["alias_candidates"].iloc[1], [])
+
+    def test_parallel_dataframe_normalization(self) -> None:
+        """Test chunked normalization through an executor matches one pass."""
+        names = [f"Company {i % 40} (Holding {i % 7} Inc); Alt {i}" for i in range(300)]
+        names += ["Acme Inc", "", None, "Blue River LLC"]
+        df = pd.DataFrame({"Account Name": pd.Series(names, dtype=object)})
+
+        executor = ParallelExecutor(backend="threading", small_input_threshold=0)
+        executor.workers = 2
+        executor.backend = "threading"
+
+        parallel = normalize_dataframe(
+            df,
+            "Account Name",
+            parallel_executor=executor,
+            with_tokens=True,
+        )
+        sequential = normalize_dataframe(df, "Account Name", with_tokens=True)
+
+        pd.testing.assert_frame_equal(parallel, sequential)
+        self.assertEqual(parallel["name_core_tokens"].iloc[-4], ["acme"])
+        self.assertEqual(parallel["name_core_tokens"].iloc[-2], [])
+
+    def test_name_core_tokens_native_lists(self) -> None:
+        """Test name_core_tokens round-trips through Parquet as list<string>."""
+        df = pd.DataFrame(
+            {"Account Name": pd.Series(["Acme Widgets Inc", None, "Acme"])},
+        )
+        result = normalize_dataframe(df, "Account Name", with_tokens=True)
+        self.assertEqual(result["name_core_tokens"].iloc[0], ["acme", "widgets"])
+        self.assertEqual(result["name_core_tokens"].iloc[1], [])
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "accounts_filtered.parquet"
+            result.to_parquet(path, index=False)
+            field = pq.read_schema(path).field("name_core_tokens")
+            self.assertEqual(field.type, pa.list_(pa.string()))
+            loaded = pd.read_parquet(path)
+
+        self.assertEqual(
+            [parse_name_core_tokens(v) for v in loaded["name_core_tokens"]],
+            [frozenset({"acme", "widgets"}), frozenset(), frozenset({"acme"})],
+        )
+
+    def test_dataframe_matches_row_normalization(self) -> None:
+        """Test vectorized DataFrame normalization matches normalize_name."""
+        names = [
+            "(1) Acme Inc; (2) Acme Holdings LLC",
+            "Acme Inc",
+            "Acme Inc",
+            "Limited",
+            "Blue River Limited Liability Company",
+            "Foo  &  Bar / Baz-Qux Corp.",
+            "Diamond Foods (Big Foods Inc)",
+            "Test Company (paystub)",
+            "1. Alpha and Beta & Gamma: Co",
+            "Müller GmbH",
+            "   ",
+            "",
+            None,
+            float("nan"),
+            42,
+        ]
+        df = pd.DataFrame({"Account Name": pd.Series(names, dtype=object)})
+
+        result = normalize_dataframe(df, "Account Name")
+
+        for i, val in enumerate(names):
+            expected = normalize_name(str(val) if pd.notna(val) else None)
+            for field in [
+                "name_raw",
+                "name_base",
+                "name_core",
+                "suffix_class",
+                "has_parentheses",
+                "has_semicolon",
+                "has_multiple_names",
+                "alias_candidates",
+                "alias_sources",
+            ]:
+                self.assertEqual(
+                    result.iloc[i][field],
+                    getattr(expected, field),
+                    f"{field} differs for {val!r}",
+                )
+
 
 if __name__ == "__main__":
     unittest.main()
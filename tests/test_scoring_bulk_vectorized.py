@@ -0,0 +1,108 @@
+"""Parity tests for the vectorized bulk scorer.
+
+This module verifies that score_pairs_bulk, which scores all pairs with
+RapidFuzz cpdist and combines components with NumPy, returns exactly what
+compute_score_components returns pair by pair, for gate survivors.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pandas as pd
+from rapidfuzz import fuzz
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.similarity.pairs import CandidatePairs
+from src.similarity.scoring import compute_score_components, score_pairs_bulk
+
+VOCAB = ["acme", "store", "shop", "co", "the", "7", "42", "a.b", "o'neil", "st-james"]
+SUFFIXES = ["NONE", "INC", "LLC"]
+
+
+def _random_frame(n: int, seed: int) -> pd.DataFrame:
+    rng = random.Random(seed)
+    names = [
+        " ".join(rng.choice(VOCAB) for _ in range(rng.randint(0, 4))) for _ in range(n)
+    ]
+    return pd.DataFrame(
+        {
+            "account_id": [f"A{i}" for i in range(n)],
+            "name_core": names,
+            "suffix_class": [rng.choice(SUFFIXES) for _ in range(n)],
+        },
+    )
+
+
+def _canonical(
+    df_norm: pd.DataFrame,
+    pairs: CandidatePairs,
+    settings: dict,
+) -> list[dict]:
+    gate_cutoff = settings["similarity"]["scoring"]["gate_cutoff"]
+    penalties = settings["similarity"]["penalty"]
+    names = df_norm["name_core"].tolist()
+    suffixes = df_norm["suffix_class"].tolist()
+    ids = df_norm["account_id"].tolist()
+    return [
+        {
+            "id_a": ids[a],
+            "id_b": ids[b],
+            **compute_score_components(
+                names[a], names[b], suffixes[a], suffixes[b], penalties, settings
+            ),
+        }
+        for a, b in pairs
+        if fuzz.token_set_ratio(names[a], names[b]) >= gate_cutoff
+    ]
+
+
+class TestBulkVectorizedParity:
+    """Test vectorized bulk scoring against the canonical scorer."""
+
+    def test_random_pairs_match_canonical(self):
+        """Every field matches exactly, including base_score floats."""
+        df_norm = _random_frame(60, seed=7)
+        pairs = CandidatePairs.all_pairs(df_norm.index.to_numpy())
+        settings = {
+            "similarity": {
+                "scoring": {"gate_cutoff": 50},
+                "penalty": {
+                    "num_style_mismatch": 5,
+                    "suffix_mismatch": 25,
+                    "punctuation_mismatch": 3,
+                },
+            },
+        }
+
+        expected = _canonical(df_norm, pairs, settings)
+        results = score_pairs_bulk(df_norm, pairs, settings)
+
+        assert len(expected) > 0
+        assert results == expected
+
+    def test_output_types_match_canonical(self):
+        """Component fields are plain Python scalars like the canonical scorer."""
+        df_norm = _random_frame(10, seed=3)
+        pairs = CandidatePairs.all_pairs(df_norm.index.to_numpy())
+        settings = {"similarity": {"scoring": {"gate_cutoff": 0}, "penalty": {}}}
+
+        results = score_pairs_bulk(df_norm, pairs, settings)
+        expected = _canonical(df_norm, pairs, settings)
+
+        for got, want in zip(results, expected):
+            for key in ("score", "ratio_name", "ratio_set", "jaccard", "base_score"):
+                assert type(got[key]) is type(want[key]), key
+            for key in ("num_style_match", "suffix_match", "punctuation_mismatch"):
+                assert type(got[key]) is bool, key
+
+    def test_all_pairs_gated_out(self):
+        """No survivors yields an empty result without a phase-2 pass."""
+        df_norm = _random_frame(5, seed=1)
+        pairs = CandidatePairs.all_pairs(df_norm.index.to_numpy())
+        settings = {"similarity": {"scoring": {"gate_cutoff": 101}}}
+
+        assert score_pairs_bulk(df_norm, pairs, settings) == []
@@ -0,0 +1,125 @@
+"""Tests for per-record scoring feature precompute.
+
+This module verifies that:
+- Scorers using precomputed features match compute_score_components exactly
+- Each distinct name is normalized once, not once per pair side
+- The import fallback still applies when enhanced normalization is missing
+"""
+
+import sys
+from itertools import combinations
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.similarity.pairs import CandidatePairs
+from src.similarity.scoring import (
+    compute_score_components,
+    precompute_scoring_features,
+    score_pairs_bulk,
+    score_pairs_parallel,
+)
+
+NAMES = [
+    "acme corp",
+    "acme corporation",
+    "acme-corp",
+    "acme co 2",
+    "acme co 22",
+    "a.c.m.e. holdings",
+    "acme",
+    "acme corp",
+]
+
+SETTINGS = {
+    "similarity": {
+        "scoring": {"gate_cutoff": 0},
+        "penalty": {
+            "num_style_mismatch": 5,
+            "suffix_mismatch": 25,
+            "punctuation_mismatch": 3,
+        },
+    },
+}
+
+
+def _df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "account_id": [f"A{i}" for i in range(len(NAMES))],
+            "name_core": NAMES,
+            "suffix_class": ["INC", "INC", "LLC", "NONE", "NONE", "INC", "INC", "INC"],
+        },
+    )
+
+
+class TestScoringFeatureParity:
+    """Test that precomputed features reproduce canonical scores."""
+
+    def test_scorers_match_canonical(self):
+        """Both scorers return exactly what compute_score_components returns."""
+        df_norm = _df()
+        pairs = CandidatePairs.all_pairs(pd.RangeIndex(len(df_norm)).to_numpy())
+        penalties = SETTINGS["similarity"]["penalty"]
+
+        expected = [
+            {
+                "id_a": df_norm["account_id"].iloc[a],
+                "id_b": df_norm["account_id"].iloc[b],
+                **compute_score_components(
+                    df_norm["name_core"].iloc[a],
+                    df_norm["name_core"].iloc[b],
+                    df_norm["suffix_class"].iloc[a],
+                    df_norm["suffix_class"].iloc[b],
+                    penalties,
+                    SETTINGS,
+                ),
+            }
+            for a, b in combinations(range(len(df_norm)), 2)
+        ]
+
+        assert score_pairs_parallel(df_norm, pairs, SETTINGS) == expected
+        assert score_pairs_bulk(df_norm, pairs, SETTINGS) == expected
+
+    def test_features_aligned_by_position(self):
+        """Duplicate names share features and rows stay in input order."""
+        features = precompute_scoring_features(pd.Series(NAMES), SETTINGS)
+
+        assert len(features.enhanced) == len(NAMES)
+        assert features.tokens[0] == features.tokens[7]
+        assert features.punct[2] == "-"
+        assert features.nums[3] == ("2",)
+        assert features.nums[4] == ("22",)
+
+
+class TestScoringFeatureCache:
+    """Test that normalization runs once per distinct name."""
+
+    def test_tokens_computed_once_per_unique_name(self):
+        """A name repeated across many pairs is tokenized only once."""
+        import src.normalize as normalize
+
+        df_norm = _df()
+        pairs = CandidatePairs.all_pairs(pd.RangeIndex(len(df_norm)).to_numpy())
+
+        with patch.object(
+            normalize,
+            "get_enhanced_tokens_for_jaccard",
+            wraps=normalize.get_enhanced_tokens_for_jaccard,
+        ) as spy:
+            score_pairs_parallel(df_norm, pairs, SETTINGS)
+
+        assert spy.call_count == len(set(NAMES))
+
+    def test_import_failure_falls_back_to_plain_tokens(self):
+        """Missing enhanced normalization falls back for every record."""
+        with patch.dict("sys.modules", {"src.normalize": None}):
+            features = precompute_scoring_features(pd.Series(NAMES), SETTINGS)
+
+        assert features.enhanced[1] == "acme corporation"
+        assert features.tokens[1] == frozenset({"acme", "corporation"})
@@ -0,0 +1,168 @@
+"""Tests for process-pool scoring over shared-memory feature tables.
+
+This module verifies that:
+- Shared arrays round-trip between the owner and worker processes
+- Range workers reproduce score_pairs_bulk exactly
+- Real process workers (loky) attach to the tables by name
+- Ranges dropped by an interrupted executor raise instead of losing pairs
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.similarity.pairs import CandidatePairs
+from src.similarity.scoring import score_pairs_bulk
+from src.similarity.shared_scoring import (
+    _decode_strings,
+    _encode_strings,
+    _encode_token_sets,
+    score_pairs_shared,
+)
+from src.utils import parallel_utils
+from src.utils.parallel_utils import JOBLIB_AVAILABLE, ParallelExecutor
+from src.utils.shared_arrays import SharedArrayStore, attach_shared_arrays
+from src.utils.token_vocab import TokenIdSets
+
+VOCAB = ["acme", "store", "shop", "co", "the", "7", "42", "a.b", "café", "st-james"]
+SETTINGS = {
+    "similarity": {
+        "scoring": {"gate_cutoff": 50},
+        "penalty": {
+            "num_style_mismatch": 5,
+            "suffix_mismatch": 25,
+            "punctuation_mismatch": 3,
+        },
+    },
+}
+
+
+def _random_frame(n: int, seed: int) -> pd.DataFrame:
+    rng = random.Random(seed)
+    return pd.DataFrame(
+        {
+            "account_id": [f"A{i}" for i in range(n)],
+            "name_core": [
+                " ".join(rng.choice(VOCAB) for _ in range(rng.randint(1, 4)))
+                for _ in range(n)
+            ],
+            "suffix_class": [rng.choice(["NONE", "INC", "LLC"]) for _ in range(n)],
+        },
+    )
+
+
+def _executor(workers: int, backend: str) -> ParallelExecutor:
+    executor = ParallelExecutor(
+        workers=workers,
+        backend=backend,
+        small_input_threshold=0,
+    )
+    # Force the requested worker count even on single-core hosts
+    executor.workers = workers
+    return executor
+
+
+class TestSharedArrays:
+    """Test publishing and attaching shared arrays."""
+
+    def test_round_trip_and_read_only(self):
+        """Attached views equal the published arrays and cannot be written."""
+        data = np.arange(10, dtype=np.int32)
+        with SharedArrayStore() as store:
+            store.publish("data", data)
+            store.publish("empty", np.empty(0, dtype=np.int64))
+            arrays, handles = attach_shared_arrays(store.specs, store.owner_pid)
+
+            assert np.array_equal(arrays["data"], data)
+            assert arrays["empty"].shape == (0,)
+            with pytest.raises(ValueError):
+                arrays["data"][0] = 1
+
+            arrays.clear()
+            for handle in handles:
+                handle.close()
+
+    def test_object_arrays_rejected(self):
+        """Object arrays cannot be placed in shared memory."""
+        with SharedArrayStore() as store, pytest.raises(TypeError):
+            store.publish("names", np.array(["a"], dtype=object))
+
+    def test_string_and_token_codecs(self):
+        """Strings and token sets survive encoding, including non-ASCII."""
+        names = ["café", "", "acme co"]
+        buffer, offsets = _encode_strings(names)
+        assert _decode_strings(buffer, offsets, np.array([2, 0, 1])).tolist() == [
+            "acme co",
+            "café",
+            "",
+        ]
+
+        token_sets = [frozenset({"a", "b"}), frozenset(), frozenset({"b"})]
+        ids, offsets = _encode_token_sets(token_sets)
+        decoded = TokenIdSets(ids, offsets).take(np.arange(3)).to_frozensets()
+        assert [len(t) for t in decoded] == [2, 0, 1]
+        assert decoded[2] <= decoded[0]
+
+
+class TestSharedScoringParity:
+    """Test that shared-memory scoring matches bulk scoring."""
+
+    @pytest.mark.parametrize("backend", ["threading", "loky"])
+    def test_matches_bulk(self, backend):
+        """Results are identical to score_pairs_bulk, in the same order."""
+        if not JOBLIB_AVAILABLE:
+            pytest.skip("joblib not available")
+
+        df_norm = _random_frame(80, seed=11)
+        pairs = CandidatePairs.all_pairs(df_norm.index.to_numpy())
+
+        expected = score_pairs_bulk(df_norm, pairs, SETTINGS)
+        results = score_pairs_shared(
+            df_norm,
+            pairs,
+            SETTINGS,
+            _executor(2, backend),
+        )
+
+        assert len(expected) > 0
+        assert results == expected
+
+    def test_sequential_executor_and_label_input(self):
+        """A single-range run accepts label tuples like the other scorers."""
+        df_norm = _random_frame(20, seed=5)
+        df_norm.index = df_norm.index + 100
+        labels = [(100, 101), (102, 119), (105, 110)]
+        settings = {"similarity": {"scoring": {"gate_cutoff": 0}}}
+
+        executor = ParallelExecutor(disable_parallel=True)
+        results = score_pairs_shared(df_norm, labels, settings, executor)
+
+        assert results == score_pairs_bulk(df_norm, labels, settings)
+
+    def test_interrupted_scoring_raises(self, monkeypatch):
+        """A stop flag that cuts the ranges short raises rather than dropping pairs."""
+
+        def failing_parallel(*args, **kwargs):
+            raise OSError("worker pool unavailable")
+
+        # The sequential fallback checks the stop flag before each range
+        monkeypatch.setattr(parallel_utils, "Parallel", failing_parallel, raising=False)
+        executor = _executor(2, "threading")
+        executor.stop_flag.set()
+        df_norm = _random_frame(40, seed=3)
+
+        with pytest.raises(RuntimeError, match="shared scoring interrupted: 0/8"):
+            score_pairs_shared(
+                df_norm,
+                CandidatePairs.all_pairs(df_norm.index.to_numpy()),
+                SETTINGS,
+                executor,
+            )
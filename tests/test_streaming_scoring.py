@@ -0,0 +1,129 @@
+"""Tests for streaming block-by-block candidate scoring.
+
+This module verifies that:
+- Streaming output matches in-memory blocking + bulk scoring + medium filter
+- Pairs repeated across bigram and token blocks are written once
+- Survivors are appended as multiple Parquet row groups
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.similarity import pair_scores
+from src.similarity.blocking import generate_candidate_pairs_soft_ban
+from src.similarity.scoring import score_pairs_bulk
+from src.similarity.streaming import stream_pair_scores
+
+
+def _settings(row_group_size: int = 3, enabled: bool = True) -> dict:
+    return {
+        "similarity": {
+            "medium": 60,
+            "blocking": {
+                "allowlist_bigrams": ["99 cents"],
+                "stop_tokens": ["inc", "llc", "ltd"],
+                "soft_ban": {"block_cap": 800},
+            },
+            "scoring": {"gate_cutoff": 50},
+            "penalty": {"suffix_mismatch": 25},
+            "streaming": {"enabled": enabled, "row_group_size": row_group_size},
+        },
+    }
+
+
+def _df_norm() -> pd.DataFrame:
+    names = [
+        "99 cents only",
+        "99 cents only store",
+        "99 cents store",
+        "acme store",
+        "acme stores",
+        "acme shop",
+        "acme",
+        "beta holdings",
+        "beta holding",
+        "beta",
+        "gamma one",
+    ]
+    return pd.DataFrame(
+        {
+            "account_id": [f"A{i:02d}" for i in range(len(names))],
+            "name_core": names,
+            "suffix_class": ["NONE"] * len(names),
+        },
+    )
+
+
+def _sorted(df: pd.DataFrame) -> pd.DataFrame:
+    return (
+        df.astype({"id_a": str, "id_b": str})
+        .sort_values(["id_a", "id_b"])
+        .reset_index(drop=True)
+    )
+
+
+class TestStreamingScoring:
+    """Test streaming scoring against the in-memory path."""
+
+    def test_matches_in_memory_bulk(self):
+        """Streamed rows equal bulk-scored pairs at or above medium."""
+        df_norm = _df_norm()
+        settings = _settings()
+
+        pairs = generate_candidate_pairs_soft_ban(df_norm, settings=settings)
+        expected = pd.DataFrame(score_pairs_bulk(df_norm, pairs, settings))
+        expected = expected[expected["score"] >= 60]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "candidate_pairs.parquet"
+            counts = stream_pair_scores(df_norm, settings, path)
+            streamed = pd.read_parquet(path)
+            row_groups = pq.ParquetFile(path).num_row_groups
+
+        assert counts["candidate_pairs"] == len(pairs)
+        assert counts["rows_written"] == len(expected) > 3
+        assert row_groups > 1
+        pd.testing.assert_frame_equal(_sorted(streamed), _sorted(expected))
+
+    def test_no_duplicate_pairs_across_blocks(self):
+        """Bigram-block pairs are not rewritten by their token block."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "candidate_pairs.parquet"
+            stream_pair_scores(_df_norm(), _settings(), path)
+            streamed = pd.read_parquet(path)
+
+        assert not streamed.duplicated(["id_a", "id_b"]).any()
+
+    def test_no_survivors_leaves_no_stale_file(self):
+        """A run with no rows above medium removes the previous output."""
+        settings = _settings()
+        settings["similarity"]["medium"] = 101
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "candidate_pairs.parquet"
+            path.write_bytes(b"stale")
+            counts = stream_pair_scores(_df_norm(), settings, path)
+
+            assert counts["rows_written"] == 0
+            assert not path.exists()
+
+    def test_pair_scores_streaming_mode(self):
+        """pair_scores returns the streamed pairs in canonical sort order."""
+        df_norm = _df_norm()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            result = pair_scores(df_norm, _settings(), interim_dir=temp_dir)
+            on_disk = pd.read_parquet(Path(temp_dir) / "candidate_pairs.parquet")
+            assert (Path(temp_dir) / "block_stats.csv").exists()
+
+        assert len(result) == len(on_disk)
+        assert result["id_a"].tolist() == sorted(result["id_a"].tolist())
+        assert (result["score"] >= 60).all()
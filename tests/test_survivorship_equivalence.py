@@ -7,13 +7,20 @@ Ensures that the hybrid optimization produces identical results to the original
 import sys
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.survivorship import select_primary_records
+from src.survivorship import (
+    _generate_group_merge_preview,
+    _generate_merge_preview_by_group,
+    _select_primary_records_original,
+    _select_primary_records_vectorized,
+    select_primary_records,
+)
 
 
 @pytest.fixture
@@ -443,5 +450,132 @@ class TestSurvivorshipEquivalence:
             pd.testing.assert_frame_equal(results[0], results[i], check_dtype=False)
 
 
+class TestVectorizedKernel:
+    """Test the integer-coded vectorized survivorship kernel."""
+
+    def test_random_groups_match_original(self, relationship_ranks, settings):
+        """Primaries match the original path on ties, gaps and missing dates."""
+        rng = np.random.default_rng(11)
+        n = 2000
+        relationships = [*relationship_ranks, "Unknown", None]
+        dates = ["2020-01-01", "2021-06-30", "2019-12-31", None]
+        df = pd.DataFrame(
+            {
+                "group_id": rng.choice([-1, *range(400)], n),
+                "account_id": [f"A{i:03d}" for i in rng.integers(0, 600, n)],
+                "Relationship": rng.choice(np.array(relationships, dtype=object), n),
+                "created_date": rng.choice(np.array(dates, dtype=object), n),
+            },
+            index=rng.permutation(n) + 50,
+        )
+
+        expected = _select_primary_records_original(df, relationship_ranks, settings)
+        actual = _select_primary_records_vectorized(df, relationship_ranks, settings)
+
+        assert actual.index.equals(df.index)
+        assigned = df["group_id"] != -1
+        assert (
+            actual.loc[assigned, "is_primary"].tolist()
+            == expected.loc[assigned, "is_primary"].tolist()
+        )
+        assert not actual.loc[~assigned, "is_primary"].any()
+        assert actual.loc[actual["is_primary"]].groupby("group_id").size().eq(1).all()
+
+    def test_survivorship_reasons(self, relationship_ranks, settings):
+        """Each primary records the key that decided it."""
+        df = pd.DataFrame(
+            {
+                "group_id": [1, 2, 2, 3, 3, 4, 4, 5, 5, -1],
+                "account_id": ["a", "b", "c", "d", "e", "g", "f", "h", "h", "z"],
+                "Relationship": [
+                    "Per PNC, Company Name",
+                    "Per PNC, Company Name",
+                    "Unknown",
+                    "Unknown",
+                    "Unknown",
+                    "Unknown",
+                    "Unknown",
+                    "Unknown",
+                    "Unknown",
+                    "Per PNC, Company Name",
+                ],
+                "created_date": [
+                    "2020-01-01",
+                    "2020-01-01",
+                    "2019-01-01",
+                    "2021-01-01",
+                    "2020-01-01",
+                    "2020-01-01",
+                    "2020-01-01",
+                    "2020-01-01",
+                    "2020-01-01",
+                    "2020-01-01",
+                ],
+            },
+        )
+
+        result = _select_primary_records_vectorized(df, relationship_ranks, settings)
+
+        assert result["is_primary"].tolist() == [
+            True,
+            True,
+            False,
+            False,
+            True,
+            False,
+            True,
+            True,
+            False,
+            False,
+        ]
+        primaries = result[result["is_primary"]]
+        assert primaries["survivorship_reason"].tolist() == [
+            "singleton",
+            "relationship_rank",
+            "created_date",
+            "account_id",
+            "input_order",
+        ]
+        assert (result.loc[~result["is_primary"], "survivorship_reason"] == "").all()
+
+
+class TestMergePreviewByGroup:
+    """Test the columnar by-group merge preview."""
+
+    def test_previews_match_per_group_generation(self):
+        """Each conflicted group gets exactly its per-group preview JSON."""
+        orjson = pytest.importorskip("orjson")
+        rng = np.random.default_rng(5)
+        n = 600
+        df = pd.DataFrame(
+            {
+                "group_id": rng.choice([-1, *range(120)], n),
+                "account_id": [f"A{i}" for i in rng.integers(0, 200, n)],
+                "account_name": rng.choice(np.array(["acme", "blue", None]), n),
+                "Relationship": rng.choice(np.array(["Parent", None]), n),
+                "relationship_rank": rng.integers(1, 60, n),
+                "Main Country": rng.choice([1.0, 2.0, np.nan], n),
+                "weakest_edge_to_primary": rng.random(n),
+                "is_primary": rng.random(n) < 0.3,
+            },
+            index=rng.permutation(n) + 10,
+        )
+        fields = ["account_name", "account_id", "Relationship", "Main Country"]
+
+        result = _generate_merge_preview_by_group(df, fields, True, "")
+
+        assert (result.loc[df["group_id"] == -1, "merge_preview_json"] == "").all()
+        for _, group_data in df[df["group_id"] != -1].groupby("group_id"):
+            previews = result.loc[group_data.index, "merge_preview_json"]
+            assert previews.nunique() == 1
+            if group_data[fields].nunique().gt(1).any():
+                expected = orjson.dumps(
+                    _generate_group_merge_preview(group_data, fields),
+                ).decode("utf-8")
+            else:
+                expected = ""
+            assert previews.iloc[0] == expected
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,240 @@
+"""Tests for the run-level token vocabulary and token-ID set operations."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.alias_matching import _build_first_token_bucket
+from src.edge_grouping import create_groups_with_edge_gating
+from src.similarity.blocking import _blocking_keys
+from src.utils.token_vocab import (
+    build_token_vocabulary,
+    encode_token_lists,
+    intersection_sizes,
+    load_token_vocabulary,
+    save_token_vocabulary,
+    tokenize_names,
+)
+
+TOKEN_LISTS = [
+    ["acme", "widgets", "acme"],
+    [],
+    ["the", "acme", "co"],
+    np.array(["blue", "river"], dtype=object),
+    '["the", "blue"]',
+    None,
+]
+
+
+class TestTokenVocabulary:
+    """Test vocabulary construction and encoding."""
+
+    def test_build_sorted_vocabulary(self):
+        """IDs follow sorted token order and keep per-record token order."""
+        vocab, sets = build_token_vocabulary(TOKEN_LISTS)
+
+        assert vocab.tokens.tolist() == [
+            "acme",
+            "blue",
+            "co",
+            "river",
+            "the",
+            "widgets",
+        ]
+        assert vocab.doc_freq.tolist() == [2, 2, 1, 1, 2, 1]
+        assert vocab.tokens[sets.record(0)].tolist() == ["acme", "widgets", "acme"]
+        assert vocab.tokens[sets.record(4)].tolist() == ["the", "blue"]
+        assert sets.sizes.tolist() == [3, 0, 3, 2, 2, 0]
+
+    def test_unique_and_first(self):
+        """unique() de-duplicates per record; first() can skip tokens."""
+        vocab, sets = build_token_vocabulary(TOKEN_LISTS)
+
+        assert sets.unique().sizes.tolist() == [2, 0, 3, 2, 2, 0]
+        assert sets.first().tolist() == [0, -1, 4, 1, 4, -1]
+
+        skip = vocab.mask(["the", "acme"])
+        assert sets.first(skip=skip).tolist() == [5, -1, 2, 1, 1, -1]
+
+        # All tokens skipped falls back to the first token
+        all_skipped = build_token_vocabulary([["the", "the"]])[1]
+        assert all_skipped.first(skip=np.array([True])).tolist() == [0]
+
+    def test_encode_unknown_tokens(self):
+        """Out-of-vocabulary tokens get shared IDs past the vocabulary."""
+        vocab, _ = build_token_vocabulary([["acme", "co"]])
+        encoded = vocab.encode([["co", "zeta"], ["zeta", "acme"], ["omega"]])
+
+        assert encoded.record(0).tolist() == [1, 3]
+        assert encoded.record(1).tolist() == [3, 0]
+        assert encoded.record(2).tolist() == [2]
+
+    def test_take(self):
+        """take() selects records in the requested order."""
+        _, sets = build_token_vocabulary(TOKEN_LISTS)
+        taken = sets.take(np.array([3, 1, 0]))
+
+        assert len(taken) == 3
+        assert taken.record(0).tolist() == sets.record(3).tolist()
+        assert taken.record(1).tolist() == []
+        assert taken.record(2).tolist() == sets.record(0).tolist()
+
+    def test_tokenize_names(self):
+        """Names split on whitespace; missing names have no tokens."""
+        names = pd.Series(["acme  co", None, ""])
+        assert tokenize_names(names) == [["acme", "co"], [], []]
+
+    def test_save_and_load(self, tmp_path):
+        """The vocabulary round-trips through its Parquet artifact."""
+        vocab, _ = build_token_vocabulary(TOKEN_LISTS)
+        path = tmp_path / "token_vocab.parquet"
+        save_token_vocabulary(vocab, path)
+        loaded = load_token_vocabulary(path)
+
+        assert loaded.tokens.tolist() == vocab.tokens.tolist()
+        assert loaded.doc_freq.tolist() == vocab.doc_freq.tolist()
+        assert pd.read_parquet(path).columns.tolist() == [
+            "token_id",
+            "token",
+            "doc_freq",
+        ]
+
+
+class TestIntersectionSizes:
+    """Test vectorized token-ID set intersections."""
+
+    def test_matches_python_sets(self):
+        """Counts equal len(a & b) over string sets, with exclusions."""
+        rng = np.random.default_rng(7)
+        words = np.array([f"w{i}" for i in range(30)], dtype=object)
+        token_sets = [
+            frozenset(words[rng.integers(0, 30, rng.integers(0, 6))])
+            for _ in range(200)
+        ]
+        left = rng.integers(0, 200, 5000)
+        right = rng.integers(0, 200, 5000)
+        sets = encode_token_lists(token_sets)
+
+        expected = [len(token_sets[a] & token_sets[b]) for a, b in zip(left, right)]
+        assert intersection_sizes(sets, left, right).tolist() == expected
+
+        vocab, _ = build_token_vocabulary(token_sets)
+        exclude = vocab.mask(["w0", "w1", "w2"])
+        stop = {"w0", "w1", "w2"}
+        expected = [
+            len((token_sets[a] & token_sets[b]) - stop) for a, b in zip(left, right)
+        ]
+        assert intersection_sizes(sets, left, right, exclude).tolist() == expected
+
+    def test_empty_pairs(self):
+        """No pairs yields an empty result."""
+        sets = encode_token_lists([["a"], ["b"]])
+        empty = np.empty(0, dtype=np.int64)
+        assert intersection_sizes(sets, empty, empty).tolist() == []
+
+
+class TestEdgeGatingTokenIds:
+    """Test edge gating on token-ID sets."""
+
+    def test_run_vocabulary_matches_local_encoding(self):
+        """Passing the run vocabulary does not change groups or counts."""
+        accounts_df = pd.DataFrame(
+            {
+                "account_id": ["001A", "001B", "001C", "001D"],
+                "name_core": ["acme inc", "acme llc", "the river", "the rivers"],
+                "name_core_tokens": [
+                    ["acme", "inc"],
+                    ["acme", "llc"],
+                    ["the", "river"],
+                    ["the", "rivers"],
+                ],
+            },
+        )
+        pairs_df = pd.DataFrame(
+            {
+                "account_id_1": ["001A", "001C"],
+                "account_id_2": ["001B", "001D"],
+                "score": [86.0, 88.0],
+            },
+        )
+        config = {
+            "similarity": {"high": 92, "medium": 84},
+            "grouping": {"edge_gating": {"enabled": True}},
+        }
+        # "the" is a stop token missing from the (partial) run vocabulary
+        vocab, _ = build_token_vocabulary([["acme", "inc"], ["river"]])
+        stop_tokens = {"the", "inc", "llc"}
+
+        local = create_groups_with_edge_gating(
+            accounts_df, pairs_df, config, stop_tokens
+        )
+        shared = create_groups_with_edge_gating(
+            accounts_df,
+            pairs_df,
+            config,
+            stop_tokens,
+            token_vocab=vocab,
+        )
+
+        columns = ["account_id", "group_id", "shared_tokens_count"]
+        pd.testing.assert_frame_equal(local[columns], shared[columns])
+        assert local["group_id"].nunique() == 3
+        assert local.set_index("account_id").loc["001B", "shared_tokens_count"] == 1
+
+
+NAMES = ["the acme co", "acme widgets", "", "Blue River", "the", "blue lagoon"]
+
+
+class TestRunVocabularyKeys:
+    """Test blocking keys and alias buckets from the run vocabulary."""
+
+    def _df(self):
+        return pd.DataFrame(
+            {"name_core": NAMES, "name_core_tokens": tokenize_names(NAMES)},
+            index=[10, 11, 12, 13, 14, 15],
+        )
+
+    def test_blocking_keys_match_split(self):
+        """Vocabulary-encoded keys equal the per-name split keys."""
+        df = self._df()
+        vocab, _ = build_token_vocabulary(df["name_core_tokens"])
+        stop_tokens = {"the"}
+        bigrams = {"blue river"}
+
+        split = _blocking_keys(df, stop_tokens, bigrams)
+        encoded = _blocking_keys(df, stop_tokens, bigrams, vocab)
+
+        for expected, actual in zip(split, encoded):
+            pd.testing.assert_series_equal(expected, actual, check_names=False)
+        assert split[0].tolist() == ["acme", "acme", "", "blue", "the", "blue"]
+        assert split[1].tolist() == ["", "", "", "blue river", "", ""]
+
+    def test_blocking_keys_out_of_vocabulary(self):
+        """Tokens missing from the vocabulary fall back to splitting names."""
+        df = self._df()
+        vocab, _ = build_token_vocabulary([["acme"]])
+
+        split = _blocking_keys(df, {"the"}, set())
+        encoded = _blocking_keys(df, {"the"}, set(), vocab)
+
+        for expected, actual in zip(split, encoded):
+            pd.testing.assert_series_equal(expected, actual, check_names=False)
+
+    def test_alias_buckets_match_split(self):
+        """First-token buckets by ID equal the split-based buckets."""
+        name_core = self._df()["name_core"].astype("string")
+        vocab, _ = build_token_vocabulary([["the"], ["acme"]])
+
+        split, index_map, _ = _build_first_token_bucket(name_core)
+        by_id, _, _ = _build_first_token_bucket(name_core, vocab)
+
+        assert list(by_id) == list(split) == ["the", "acme", "Blue", "blue"]
+        for token, indices in split.items():
+            np.testing.assert_array_equal(by_id[token], indices)
+        assert index_map[15] == 5
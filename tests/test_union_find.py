@@ -0,0 +1,134 @@
+"""Tests for the array-backed union-find."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.union_find import (
+    ArrayUnionFind,
+    DisjointSet,
+    connected_component_labels,
+)
+
+
+class TestArrayUnionFind:
+    """Test ArrayUnionFind against DisjointSet semantics."""
+
+    def test_union_and_sizes(self):
+        """Unions merge sets and track sizes without scanning nodes."""
+        uf = ArrayUnionFind(6)
+
+        assert uf.union(0, 1)
+        assert uf.union(2, 1)
+        assert not uf.union(0, 2)
+
+        assert uf.find(2) == uf.find(0)
+        assert uf.get_size(2) == 3
+        assert uf.get_size(5) == 1
+        assert uf.get_set_count() == 4
+        assert uf.parent.dtype == np.int32
+
+    def test_tie_break(self):
+        """Equal-rank unions keep the first root or the smaller node."""
+        first = ArrayUnionFind(4)
+        first.union(3, 1)
+        assert first.find(1) == 3
+
+        smaller = ArrayUnionFind(4, tie_break="smaller")
+        smaller.union(3, 1)
+        assert smaller.find(3) == 1
+
+        with pytest.raises(ValueError):
+            ArrayUnionFind(4, tie_break="largest")
+
+    def test_matches_disjoint_set(self):
+        """Batched unions give the same roots and sizes as DisjointSet."""
+        rng = np.random.default_rng(3)
+        xs = rng.integers(0, 500, 800)
+        ys = rng.integers(0, 500, 800)
+
+        reference = DisjointSet()
+        for node in range(500):
+            reference.make_set(node)
+        merges = sum(reference.union(int(x), int(y)) for x, y in zip(xs, ys))
+
+        uf = ArrayUnionFind(500)
+        assert uf.union_many(xs, ys) == merges
+
+        roots = uf.find_all()
+        assert roots.tolist() == [reference.find(node) for node in range(500)]
+        assert [uf.get_size(node) for node in range(500)] == [
+            reference.get_size(node) for node in range(500)
+        ]
+        assert uf.get_set_count() == reference.get_set_count()
+
+    def test_union_many_matches_union(self):
+        """Batched unions keep the same arrays as per-pair unions."""
+        rng = np.random.default_rng(11)
+        xs = rng.integers(0, 300, 600)
+        ys = rng.integers(0, 300, 600)
+
+        for tie_break in ("first", "smaller"):
+            batched = ArrayUnionFind(300, tie_break=tie_break)
+            single = ArrayUnionFind(300, tie_break=tie_break)
+            merges = batched.union_many(xs, ys)
+
+            assert merges == sum(single.union(int(x), int(y)) for x, y in zip(xs, ys))
+            np.testing.assert_array_equal(batched.find_all(), single.find_all())
+            np.testing.assert_array_equal(batched.rank, single.rank)
+            assert batched.parent.dtype == np.int32
+            assert [batched.get_size(n) for n in range(300)] == [
+                single.get_size(n) for n in range(300)
+            ]
+
+    def test_union_many_records_roots_at_union_time(self):
+        """roots_out holds find(xs[i]) right after pair i, not the final root."""
+        rng = np.random.default_rng(5)
+        xs = rng.integers(0, 100, 200)
+        ys = rng.integers(0, 100, 200)
+
+        for tie_break in ("first", "smaller"):
+            batched = ArrayUnionFind(100, tie_break=tie_break)
+            single = ArrayUnionFind(100, tie_break=tie_break)
+            roots = np.full(len(xs), -1, dtype=np.int64)
+            batched.union_many(xs, ys, roots_out=roots)
+
+            expected = []
+            for x, y in zip(xs, ys):
+                single.union(int(x), int(y))
+                expected.append(single.find(int(x)))
+            assert roots.tolist() == expected
+            assert not np.array_equal(roots, batched.find_all()[xs])
+
+
+class TestConnectedComponentLabels:
+    """Test vectorized connected component labelling."""
+
+    def test_labels_are_component_minimum(self):
+        """Each node is labelled with the smallest node of its component."""
+        labels = connected_component_labels(
+            7,
+            np.array([5, 3, 1, 6]),
+            np.array([3, 1, 4, 6]),
+        )
+        assert labels.tolist() == [0, 1, 2, 1, 1, 1, 6]
+
+    def test_matches_union_find(self):
+        """Labels partition nodes exactly like the union-find."""
+        rng = np.random.default_rng(5)
+        xs = rng.integers(0, 1000, 900)
+        ys = rng.integers(0, 1000, 900)
+        uf = ArrayUnionFind(1000)
+        uf.union_many(xs, ys)
+        roots = uf.find_all()
+
+        labels = connected_component_labels(1000, xs, ys)
+        for node in range(1000):
+            members = np.flatnonzero(roots == roots[node])
+            assert labels[node] == members.min()